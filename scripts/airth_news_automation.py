@@ -333,20 +333,22 @@ class AirthNewsAutomation:
             f"publish_status={publish_status}, enable_publishing={enable_publishing}")
 
         try:
-            # Step 1: Fetch news articles
+            # Step 1: Fetch news articles newest first across sources, so
+            # processing sees the same order whichever source finishes first
             logger.info("Step 1: Fetching news articles")
-            articles = self.news_fetcher.fetch_all_sources(
-                max_age_days=max_age_days)
-            self.stats["articles_fetched"] = len(articles)
-            logger.info(f"Fetched {len(articles)} news articles")
-
-            if not articles:
-                logger.warning("No articles fetched. Exiting workflow.")
-                return self.stats
+            articles = self._count_fetched(
+                self.news_fetcher.iter_articles(max_age_days=max_age_days, merge_by_date=True))
 
             # Step 2: Process articles into topics
             logger.info("Step 2: Processing articles into topics")
             topics = self.news_processor.process_articles(articles)
+            logger.info(
+                f"Fetched {self.stats['articles_fetched']} news articles")
+
+            if not self.stats["articles_fetched"]:
+                logger.warning("No articles fetched. Exiting workflow.")
+                return self.stats
+
             self.stats["topics_generated"] = len(topics)
             logger.info(f"Generated {len(topics)} topic clusters")
 
@@ -373,22 +375,24 @@ class AirthNewsAutomation:
                                 topic.get(
                                     'id',
                                     0)))}")
-                try:
-                    result = self.content_generator.generate_article_from_topic(
-                        topic)
-
-                    if result.get("success"):
-                        generated_articles.append(result)
-                        logger.info(
-                            f"Successfully generated article: {
-                                result.get('title')}")
-                    else:
-                        logger.error(
-                            f"Failed to generate article: {
-                                result.get('error')}")
-                        self.stats["errors"] += 1
-                except Exception as e:
-                    logger.error(f"Error generating article content: {e}")
+            try:
+                # One batch shares the LLM section queue across all topics
+                results = self.content_generator.generate_articles(topics)
+            except Exception as e:
+                logger.error(f"Error generating article content: {e}")
+                self.stats["errors"] += len(topics)
+                results = []
+
+            for result in results:
+                if result.get("success"):
+                    generated_articles.append(result)
+                    logger.info(
+                        f"Successfully generated article: {
+                            result.get('title')}")
+                else:
+                    logger.error(
+                        f"Failed to generate article: {
+                            result.get('error')}")
                     self.stats["errors"] += 1
 
             self.stats["articles_created"] = len(generated_articles)
@@ -486,6 +490,23 @@ class AirthNewsAutomation:
             self.stats["errors"] += 1
             return self.stats
 
+        finally:
+            self.close()
+
+    def close(self):
+        """Shut down the worker pools of the components and close their stores."""
+        for component in (self.content_generator, self.news_processor, self.news_fetcher):
+            try:
+                component.close()
+            except Exception as e:
+                logger.error(f"Error closing {type(component).__name__}: {e}")
+
+    def _count_fetched(self, articles):
+        """Pass articles through while counting them in the run statistics."""
+        for article in articles:
+            self.stats["articles_fetched"] += 1
+            yield article
+
     def send_notification(self,
                           success: bool,
                           run_stats: Dict[str,
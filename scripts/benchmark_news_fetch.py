@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Replayable benchmark for the news fetcher.
+
+Serves synthetic or recorded RSS feeds, NewsAPI-shaped JSON and HTML pages from
+a local HTTP server and drives NewsFetcher.fetch_all_sources against it, so
+fetch throughput can be measured without touching live sites.
+
+Examples:
+    # 20 synthetic sources of each type, 50 ms latency, 5% injected errors
+    python scripts/benchmark_news_fetch.py --sources 20 --latency 0.05 --error-rate 0.05
+
+    # Replay recorded documents (*.xml/*.rss, *.json, *.html) from a directory
+    python scripts/benchmark_news_fetch.py --recordings data/benchmark_feeds
+
+    # Run only the feed server, e.g. to benchmark from another process or host
+    python scripts/benchmark_news_fetch.py --serve --port 8765
+"""
+import os
+import sys
+import json
+import time
+import math
+import random
+import hashlib
+import logging
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger("TEC.FetchBenchmark")
+
+RECORDED_TYPES = {
+    ".xml": ("rss", "application/rss+xml"),
+    ".rss": ("rss", "application/rss+xml"),
+    ".json": ("news_api", "application/json"),
+    ".html": ("web", "text/html"),
+}
+
+CONTENT_TYPES = {
+    "rss": "application/rss+xml",
+    "news_api": "application/json",
+    "web": "text/html",
+}
+
+
+def _filler(size: int, seed: int) -> str:
+    """Build deterministic filler text of roughly the given size."""
+    words = ["quantum", "network", "model", "launch", "policy", "market", "research",
+             "startup", "chip", "climate", "robot", "security", "data", "cloud"]
+    rng = random.Random(seed)
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return " ".join(text)
+
+
+def build_rss(feed_id: int, items: int, summary_size: int, now: datetime) -> bytes:
+    """Build a synthetic RSS 2.0 document."""
+    entries = []
+    for i in range(items):
+        published = format_datetime(now - timedelta(minutes=30 * i))
+        entries.append(
+            f"<item><guid>feed{feed_id}-{i}</guid><title>Feed {feed_id} story {i}</title>"
+            f"<link>http://bench.local/{feed_id}/{i}</link><pubDate>{published}</pubDate>"
+            f"<description>&lt;p&gt;{_filler(summary_size, feed_id * 1000 + i)}&lt;/p&gt;</description></item>"
+        )
+    document = (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed_id}</title>'
+        f'{"".join(entries)}</channel></rss>'
+    )
+    return document.encode("utf-8")
+
+
+def build_news_api(feed_id: int, items: int, summary_size: int, now: datetime) -> bytes:
+    """Build a synthetic NewsAPI top-headlines response."""
+    articles = []
+    for i in range(items):
+        summary = _filler(summary_size, feed_id * 1000 + i)
+        articles.append({
+            "source": {"name": f"API {feed_id}"},
+            "title": f"API {feed_id} story {i}",
+            "url": f"http://bench.local/api/{feed_id}/{i}",
+            "publishedAt": (now - timedelta(minutes=30 * i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "description": summary,
+            "content": summary
+        })
+    return json.dumps({"status": "ok", "totalResults": items, "articles": articles}).encode("utf-8")
+
+
+def build_html(feed_id: int, items: int, summary_size: int, now: datetime) -> bytes:
+    """Build a synthetic HTML listing page."""
+    blocks = [
+        f'<article><h2>Page {feed_id} story {i}</h2><a href="/{feed_id}/{i}">Read</a>'
+        f'<p>{_filler(summary_size, feed_id * 1000 + i)}</p></article>'
+        for i in range(items)
+    ]
+    return f"<html><body>{''.join(blocks)}</body></html>".encode("utf-8")
+
+
+BUILDERS = {
+    "rss": build_rss,
+    "news_api": build_news_api,
+    "web": build_html,
+}
+
+
+class FeedServer:
+    """
+    Local HTTP server standing in for news sites.
+
+    Synthetic documents are served at /<type>/<id> (type is rss, news_api or
+    web) and recorded files at /recorded/<filename>. Responses carry an
+    ETag so conditional requests get 304s like most real feeds.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 latency_jitter: float = 0.0, items: int = 20, summary_size: int = 500,
+                 error_rate: float = 0.0, recordings: Optional[str] = None,
+                 etags: bool = True, seed: int = 42):
+        """
+        Initialize the feed server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Delay added to every response in seconds
+            latency_jitter: Maximum random delay added on top of latency in seconds
+            items: Entries per synthetic document
+            summary_size: Approximate characters of text per entry
+            error_rate: Fraction of requests answered with a 503
+            recordings: Directory of recorded documents to serve
+            etags: Send ETags and honour If-None-Match
+            seed: Random seed for latency jitter and error injection
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.items = items
+        self.summary_size = summary_size
+        self.error_rate = error_rate
+        self.etags = etags
+        self.recordings = recordings
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._documents = {}
+        self._documents_lock = threading.Lock()
+        self._now = datetime.now(timezone.utc)
+        self.requests = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def recorded_files(self) -> List[str]:
+        """List the recorded documents that can be served."""
+        if not self.recordings or not os.path.isdir(self.recordings):
+            return []
+        return sorted(
+            name for name in os.listdir(self.recordings)
+            if os.path.splitext(name)[1].lower() in RECORDED_TYPES
+        )
+
+    def start(self) -> "FeedServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server and release its socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _document(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the body, content type and ETag for a request path."""
+        with self._documents_lock:
+            if path in self._documents:
+                return self._documents[path]
+
+        parts = path.strip("/").split("/")
+        if len(parts) != 2:
+            return None
+        kind, name = parts
+
+        if kind == "recorded":
+            if name not in self.recorded_files():
+                return None
+            with open(os.path.join(self.recordings, name), "rb") as f:
+                body = f.read()
+            content_type = RECORDED_TYPES[os.path.splitext(name)[1].lower()][1]
+        elif kind in BUILDERS and name.isdigit():
+            body = BUILDERS[kind](int(name), self.items, self.summary_size, self._now)
+            content_type = CONTENT_TYPES[kind]
+        else:
+            return None
+
+        document = {
+            "body": body,
+            "content_type": content_type,
+            "etag": '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        }
+        with self._documents_lock:
+            self._documents[path] = document
+        return document
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._random_lock:
+                    server.requests += 1
+                    delay = server.latency + server._random.uniform(0, server.latency_jitter)
+                    fail = server._random.random() < server.error_rate
+
+                if delay:
+                    time.sleep(delay)
+
+                document = server._document(urlparse(self.path).path)
+                if document is None:
+                    self._send(404, b"not found", "text/plain")
+                elif fail:
+                    self._send(503, b"injected error", "text/plain")
+                elif server.etags and self.headers.get("If-None-Match") == document["etag"]:
+                    self._send(304, b"", document["content_type"], document["etag"])
+                else:
+                    self._send(200, document["body"], document["content_type"], document["etag"])
+
+            def _send(self, status, body, content_type, etag=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                if etag and server.etags:
+                    self.send_header("ETag", etag)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if status != 304:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def build_sources(base_url: str, sources_per_type: int, types: List[str],
+                  recorded: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Build the NewsFetcher source list pointing at the feed server.
+
+    Args:
+        base_url: Feed server base URL
+        sources_per_type: Synthetic sources per source type
+        types: Source types to include (rss, news_api, web)
+        recorded: Recorded file names to include as sources
+
+    Returns:
+        List of source configuration dictionaries
+    """
+    sources = []
+    for kind in types:
+        for i in range(sources_per_type):
+            source = {
+                "name": f"bench {kind} {i}",
+                "url": f"{base_url}/{kind}/{i}",
+                "type": kind,
+                "category": "technology"
+            }
+            if kind == "news_api":
+                source["api_url"] = source["url"]
+            sources.append(source)
+
+    for name in recorded or []:
+        kind = RECORDED_TYPES[os.path.splitext(name)[1].lower()][0]
+        source = {
+            "name": f"recorded {name}",
+            "url": f"{base_url}/recorded/{name}",
+            "type": kind,
+            "category": "technology"
+        }
+        if kind == "news_api":
+            source["api_url"] = source["url"]
+        sources.append(source)
+
+    return sources
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(fraction * len(ordered))
+    return ordered[max(0, rank - 1)]
+
+
+def run_benchmark(server_url: str, sources: List[Dict[str, Any]], rounds: int = 3,
+                  workers: int = 8, max_per_host: Optional[int] = None,
+                  parse_workers: int = 0, use_cache: bool = False,
+                  max_retries: int = 0, work_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run fetch_all_sources against the feed server and collect measurements.
+
+    Args:
+        server_url: Feed server base URL
+        sources: Source configuration dictionaries
+        rounds: Number of fetch_all_sources calls
+        workers: Fetch thread pool size
+        max_per_host: Concurrent requests per host (defaults to workers, since
+            every source lives on the same local host)
+        parse_workers: Feed parsing processes (0 parses in-process)
+        use_cache: Keep the fetcher's cache policy; otherwise every round goes
+            to the server (conditional requests are still sent)
+        max_retries: HTTP retries for injected errors
+        work_dir: Directory for the config and article store (a temporary
+            directory by default)
+
+    Returns:
+        Dictionary of throughput, latency and memory measurements
+    """
+    from src.utils.news_fetcher import NewsFetcher
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        config = {
+            "sources": sources,
+            "article_store": os.path.join(tmp, "articles.db"),
+            "max_workers": workers,
+            "max_per_host": max_per_host or workers,
+            "parse_workers": parse_workers,
+            "http": {"max_retries": max_retries, "pool_maxsize": max(workers, 10)}
+        }
+        if not use_cache:
+            config.update({
+                "cache_expiry": -1,
+                "stale_while_revalidate": 0,
+                "negative_cache_ttl": 0,
+                "max_negative_cache_ttl": 0,
+                "adaptive_polling": False
+            })
+
+        config_path = os.path.join(tmp, "news_sources.json")
+        with open(config_path, "w") as f:
+            json.dump(config, f)
+
+        fetcher = NewsFetcher(config_path=config_path)
+        fetcher.api_keys.setdefault("news_api", "benchmark")
+
+        # Time every source fetch, wherever the fetcher runs it
+        latencies = {source["name"]: [] for source in sources}
+        fetch_source = fetcher._fetch_source
+
+        def timed_fetch_source(source, use_cache=True):
+            start = time.perf_counter()
+            try:
+                return fetch_source(source, use_cache)
+            finally:
+                latencies[source["name"]].append(time.perf_counter() - start)
+
+        fetcher._fetch_source = timed_fetch_source
+
+        round_results = []
+        tracemalloc.start()
+        try:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                articles = fetcher.fetch_all_sources(max_age_days=30)
+                elapsed = time.perf_counter() - start
+                round_results.append({
+                    "seconds": elapsed,
+                    "articles": len(articles),
+                    "articles_per_second": len(articles) / elapsed if elapsed else 0.0
+                })
+            _, peak_traced = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            fetcher.close()
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    total_articles = sum(r["articles"] for r in round_results)
+    total_seconds = sum(r["seconds"] for r in round_results)
+
+    return {
+        "server": server_url,
+        "sources": len(sources),
+        "rounds": round_results,
+        "articles_per_second": total_articles / total_seconds if total_seconds else 0.0,
+        "source_latency": {
+            "p50_seconds": _percentile(all_latencies, 0.50),
+            "p99_seconds": _percentile(all_latencies, 0.99),
+            "max_seconds": max(all_latencies) if all_latencies else 0.0
+        },
+        "per_source": {
+            name: {
+                "p50_seconds": _percentile(values, 0.50),
+                "p99_seconds": _percentile(values, 0.99)
+            }
+            for name, values in latencies.items()
+        },
+        "peak_traced_mb": peak_traced / (1024 * 1024),
+        "peak_rss_mb": _peak_rss_mb()
+    }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def print_report(results: Dict[str, Any], per_source: bool = False):
+    """Print a benchmark report."""
+    print(f"\n=== News Fetch Benchmark ({results['sources']} sources, {results['server']}) ===\n")
+    for i, r in enumerate(results["rounds"], 1):
+        print(f"Round {i}: {r['articles']} articles in {r['seconds']:.3f}s ({r['articles_per_second']:.1f} articles/s)")
+
+    latency = results["source_latency"]
+    print(f"\nThroughput:       {results['articles_per_second']:.1f} articles/s")
+    print(f"Source latency:   p50 {latency['p50_seconds'] * 1000:.1f} ms, "
+          f"p99 {latency['p99_seconds'] * 1000:.1f} ms, max {latency['max_seconds'] * 1000:.1f} ms")
+    print(f"Peak traced heap: {results['peak_traced_mb']:.1f} MB")
+    if results["peak_rss_mb"] is not None:
+        print(f"Peak RSS:         {results['peak_rss_mb']:.1f} MB")
+
+    if per_source:
+        print("\nPer source (p50 / p99 ms):")
+        for name, stats in results["per_source"].items():
+            print(f"  {name:<40} {stats['p50_seconds'] * 1000:8.1f} {stats['p99_seconds'] * 1000:8.1f}")
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark NewsFetcher against a local feed server")
+    parser.add_argument("--sources", type=int, default=10, help="Synthetic sources per type")
+    parser.add_argument("--types", default="rss,news_api,web",
+                        help="Comma-separated synthetic source types (empty for none)")
+    parser.add_argument("--recordings", help="Directory of recorded *.xml/*.rss, *.json and *.html documents")
+    parser.add_argument("--items", type=int, default=20, help="Entries per synthetic document")
+    parser.add_argument("--summary-size", type=int, default=500, help="Characters of text per entry")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server response delay in seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Random extra delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--no-etags", action="store_true", help="Disable ETags and 304 responses")
+    parser.add_argument("--rounds", type=int, default=3, help="Number of fetch_all_sources calls")
+    parser.add_argument("--workers", type=int, default=8, help="Fetch thread pool size")
+    parser.add_argument("--max-per-host", type=int, help="Concurrent requests per host (defaults to --workers)")
+    parser.add_argument("--parse-workers", type=int, default=0, help="Feed parsing processes")
+    parser.add_argument("--retries", type=int, default=0, help="HTTP retries for failed requests")
+    parser.add_argument("--use-cache", action="store_true", help="Keep the fetcher's cache policy between rounds")
+    parser.add_argument("--server-url", help="Use an already running feed server instead of starting one")
+    parser.add_argument("--serve", action="store_true", help="Only run the feed server")
+    parser.add_argument("--host", default="127.0.0.1", help="Feed server interface")
+    parser.add_argument("--port", type=int, default=0, help="Feed server port")
+    parser.add_argument("--per-source", action="store_true", help="Print latency for every source")
+    parser.add_argument("--json", dest="json_path", help="Write the results to a JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show fetcher logging")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.CRITICAL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    types = [t.strip() for t in args.types.split(",") if t.strip()]
+    unknown = [t for t in types if t not in BUILDERS]
+    if unknown:
+        parser.error(f"Unknown source types: {', '.join(unknown)}")
+
+    if args.serve and args.server_url:
+        parser.error("--serve and --server-url cannot be combined")
+
+    server = None
+    if not args.server_url:
+        server = FeedServer(
+            host=args.host, port=args.port, latency=args.latency,
+            latency_jitter=args.latency_jitter, items=args.items,
+            summary_size=args.summary_size, error_rate=args.error_rate,
+            recordings=args.recordings, etags=not args.no_etags
+        )
+
+    if args.serve:
+        print(f"Serving benchmark feeds at {server.url} (Ctrl+C to stop)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.httpd.server_close()
+        return
+
+    server_url = args.server_url or server.start().url
+    recorded = server.recorded_files() if server else []
+    sources = build_sources(server_url, args.sources, types, recorded)
+    if not sources:
+        parser.error("No sources to benchmark")
+
+    try:
+        results = run_benchmark(
+            server_url, sources, rounds=args.rounds, workers=args.workers,
+            max_per_host=args.max_per_host, parse_workers=args.parse_workers,
+            use_cache=args.use_cache, max_retries=args.retries
+        )
+    finally:
+        if server:
+            server.stop()
+
+    print_report(results, per_source=args.per_source)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,11 @@ Handles interactions with the ClickUp API for task management and content workfl
 import os
 import logging
 import json
-import requests
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from .base_agent import BaseAgent
+from ..utils.http_client import get_http_client
 
 class ClickUpAgent(BaseAgent):
     """
@@ -38,6 +38,9 @@ class ClickUpAgent(BaseAgent):
         # ClickUp API base URL
         self.api_base_url = "https://api.clickup.com/api/v2"
         
+        # Shared pooled HTTP transport
+        self.http = get_http_client()
+        
         # Cache for statuses, custom fields, etc.
         self.status_cache = {}
         self.custom_fields_cache = {}
@@ -84,7 +87,7 @@ class ClickUpAgent(BaseAgent):
             headers = self._get_auth_headers()
             
             self.logger.info(f"Fetching ClickUp list information for list {target_list_id}")
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, headers=headers)
             response.raise_for_status()
             
             list_data = response.json()
@@ -145,7 +148,7 @@ class ClickUpAgent(BaseAgent):
             headers = self._get_auth_headers()
             
             self.logger.info(f"Fetching ClickUp custom fields for list {target_list_id}")
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, headers=headers)
             response.raise_for_status()
             
             fields_data = response.json()
@@ -222,7 +225,7 @@ class ClickUpAgent(BaseAgent):
                     self.logger.warning(f"Status '{status_name}' not found, fetching all tasks")
             
             self.logger.info(f"Fetching ClickUp tasks for list {target_list_id}")
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             response.raise_for_status()
             
             tasks_data = response.json()
@@ -274,7 +277,7 @@ class ClickUpAgent(BaseAgent):
             }
             
             self.logger.info(f"Updating ClickUp task {task_id} status to '{status_name}'")
-            response = requests.put(url, headers=headers, json=update_data)
+            response = self.http.put(url, headers=headers, json=update_data)
             response.raise_for_status()
             
             updated_task = response.json()
@@ -319,7 +322,7 @@ class ClickUpAgent(BaseAgent):
             }
             
             self.logger.info(f"Updating ClickUp task {task_id} custom field {field_id}")
-            response = requests.post(url, headers=headers, json=update_data)
+            response = self.http.post(url, headers=headers, json=update_data)
             response.raise_for_status()
             
             result = response.json()
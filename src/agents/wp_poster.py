@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional, Union
 from base64 import b64encode
 
 from .base_agent import BaseAgent
+from ..utils.http_client import get_http_client
 
 class WordPressAgent(BaseAgent):
     """
@@ -101,6 +102,9 @@ class WordPressAgent(BaseAgent):
             "creative-ai-tools"
         ]
         
+        # Shared pooled HTTP transport
+        self.http = get_http_client()
+        
         # Cache categories on initialization
         if self.api_base_url:
             self.get_categories()
@@ -164,7 +168,7 @@ class WordPressAgent(BaseAgent):
                 
                 if "headers" in auth_method:
                     # Use headers authentication
-                    response = requests.request(
+                    response = self.http.request(
                         method=method,
                         url=url,
                         headers=auth_method["headers"],
@@ -172,7 +176,7 @@ class WordPressAgent(BaseAgent):
                     )
                 else:
                     # Use basic auth
-                    response = requests.request(
+                    response = self.http.request(
                         method=method,
                         url=url,
                         auth=auth_method["auth"],
@@ -0,0 +1,151 @@
+"""
+Article - The typed news article record shared by the news pipeline.
+Publication dates are parsed once, when the record is created, into epoch seconds.
+"""
+import time
+import calendar
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Union
+
+
+def parse_published(value: Any, default: Optional[float] = None) -> Optional[float]:
+    """
+    Convert a publication date into epoch seconds.
+
+    Args:
+        value: Epoch seconds, datetime (naive values are local time), time.struct_time
+            (UTC, as produced by feedparser), or an ISO 8601 / RFC 2822 string
+        default: Value returned when the date is missing or unparseable
+
+    Returns:
+        Epoch seconds, or default
+    """
+    if value is None or value == "":
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, time.struct_time):
+        return float(calendar.timegm(value))
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(text).timestamp()
+        except (TypeError, ValueError, IndexError):
+            pass
+    return default
+
+
+def _add_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = names
+    # Defaults live in __init__ and the dataclass fields, not in class attributes
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_add_slots
+@dataclass
+class Article:
+    """
+    A news article as it moves from NewsFetcher through NewsProcessor to ContentGenerator.
+
+    Read-only dict-style access (article["title"], article.get("summary")) is
+    kept for callers that still treat articles as dictionaries.
+    """
+
+    title: str
+    url: str
+    source: str = ""
+    category: str = "general"
+    published: str = ""  # Publication date as the source wrote it
+    published_ts: float = 0.0  # Publication time in epoch seconds
+    summary: str = ""
+    content: str = ""
+
+    @property
+    def published_datetime(self) -> datetime:
+        """Publication time as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.published_ts, tz=timezone.utc)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_ts: Optional[float] = None) -> "Article":
+        """
+        Build an article from a dictionary.
+
+        The publication time is taken from published_ts, then
+        published_datetime, then the raw published string.
+
+        Args:
+            data: Article dictionary
+            default_ts: Publication time used when none can be parsed (defaults to now)
+
+        Returns:
+            The article
+        """
+        published_ts = parse_published(data.get("published_ts"))
+        if published_ts is None:
+            published_ts = parse_published(data.get("published_datetime"))
+        if published_ts is None:
+            published_ts = parse_published(data.get("published"))
+        if published_ts is None:
+            published_ts = default_ts if default_ts is not None else time.time()
+
+        return cls(
+            title=data.get("title") or "",
+            url=data.get("url") or "",
+            source=data.get("source") or "",
+            category=data.get("category") or "general",
+            published=data.get("published") or "",
+            published_ts=published_ts,
+            summary=data.get("summary") or "",
+            content=data.get("content") or ""
+        )
+
+    @classmethod
+    def coerce(cls, article: Union["Article", Dict[str, Any]]) -> "Article":
+        """Return the article unchanged, or convert it from a dictionary."""
+        return article if isinstance(article, cls) else cls.from_dict(article)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the article to a JSON-serializable dictionary.
+
+        Returns:
+            Article fields plus published_datetime as an ISO 8601 string
+        """
+        data = asdict(self)
+        data["published_datetime"] = self.published_datetime.isoformat()
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_NAMES or key == "published_datetime":
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_NAMES or key == "published_datetime"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style attribute lookup."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+_FIELD_NAMES = frozenset(field.name for field in fields(Article))
@@ -0,0 +1,183 @@
+"""
+Article Cache - Reuse of generated articles for topics seen before.
+Fingerprints a topic by its dominant terms and article set, so a topic that
+returns unchanged in a later run maps to the article already generated for it.
+Entries refer to articles by their ContentStore id.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger("TEC.ArticleCache")
+
+HIT = "hit"
+NEAR_HIT = "near_hit"
+
+
+def _digest(values: List[str]) -> str:
+    """Hash a list of strings independently of their order."""
+    return hashlib.sha1("\n".join(sorted(values)).encode("utf-8")).hexdigest()
+
+
+class ArticleCache:
+    """
+    Index of generated articles by topic fingerprint.
+
+    A topic's fingerprint combines its top dominant terms with the URLs of
+    its articles. An exact match is a hit. A topic with the same terms whose
+    article set overlaps a cached one by at least near_hit_threshold (Jaccard
+    similarity) is a near hit: the same story with a few articles added or
+    dropped. Entries expire ttl_hours after their article was generated, and
+    the least recently used entries are evicted above max_entries.
+    """
+
+    def __init__(self, path: str, ttl_hours: float = 24, max_entries: int = 500,
+                 near_hit_threshold: float = 0.5, fingerprint_terms: int = 10):
+        """
+        Initialize the cache and load its index.
+
+        Args:
+            path: JSON index file
+            ttl_hours: Age after which a cached article is regenerated
+            max_entries: Largest number of entries kept
+            near_hit_threshold: Minimum article overlap for a near hit (above 1 disables near hits)
+            fingerprint_terms: Number of dominant terms in the fingerprint
+        """
+        self.path = path
+        self.ttl_hours = ttl_hours
+        self.max_entries = max_entries
+        self.near_hit_threshold = near_hit_threshold
+        self.fingerprint_terms = fingerprint_terms
+
+        self._entries = {}  # fingerprint -> entry
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fingerprint(self, topic_data: Dict[str, Any]) -> Tuple[str, str, List[str]]:
+        """
+        Fingerprint a topic.
+
+        Args:
+            topic_data: Topic with "dominant_terms" (or "keywords") and "articles"
+
+        Returns:
+            Fingerprint, fingerprint of the terms alone, and the sorted article URLs
+        """
+        terms = topic_data.get("dominant_terms") or topic_data.get("keywords") or []
+        terms = [term.lower() for term in terms[:self.fingerprint_terms]]
+        urls = sorted({article.url for article in topic_data.get("articles", []) if article.url})
+
+        terms_key = _digest(terms)
+        return _digest([terms_key] + urls), terms_key, urls
+
+    def lookup(self, topic_data: Dict[str, Any], now: Optional[float] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Find the cached article for a topic.
+
+        Args:
+            topic_data: Topic with "dominant_terms" and "articles"
+            now: Current time as epoch seconds (defaults to now)
+
+        Returns:
+            HIT or NEAR_HIT with the matching entry ("article_id", "created_at",
+            "urls"), or (None, None)
+        """
+        now = now if now is not None else time.time()
+        key, terms_key, urls = self.fingerprint(topic_data)
+
+        entry = self._entries.get(key)
+        if entry and self._is_live(entry, now):
+            entry["used_at"] = now
+            self._dirty = True
+            return HIT, entry
+
+        best, best_overlap = None, self.near_hit_threshold
+        url_set = set(urls)
+        for entry in self._entries.values():
+            if entry["terms_key"] != terms_key or not self._is_live(entry, now):
+                continue
+            cached = set(entry["urls"])
+            union = url_set | cached
+            overlap = len(url_set & cached) / len(union) if union else 1.0
+            if overlap >= best_overlap:
+                best, best_overlap = entry, overlap
+
+        if best:
+            best["used_at"] = now
+            self._dirty = True
+            return NEAR_HIT, best
+        return None, None
+
+    def add(self, topic_data: Dict[str, Any], article_id: str, created_at: Optional[float] = None,
+            now: Optional[float] = None):
+        """
+        Record the article generated for a topic.
+
+        Args:
+            topic_data: Topic the article was generated from
+            article_id: ContentStore id of the saved article
+            created_at: When the article's content was generated; an article
+                updated from a near hit keeps its original time, so the TTL
+                still bounds the age of reused content (defaults to now)
+            now: Current time as epoch seconds (defaults to now)
+        """
+        now = now if now is not None else time.time()
+        key, terms_key, urls = self.fingerprint(topic_data)
+        self._entries[key] = {
+            "terms_key": terms_key,
+            "urls": urls,
+            "article_id": article_id,
+            "created_at": created_at if created_at is not None else now,
+            "used_at": now
+        }
+        self._dirty = True
+
+    def discard(self, entry: Dict[str, Any]):
+        """Drop an entry, e.g. when its article is no longer stored."""
+        self._entries = {key: value for key, value in self._entries.items() if value is not entry}
+        self._dirty = True
+
+    def save(self, now: Optional[float] = None):
+        """
+        Write the index, dropping expired entries and evicting above max_entries.
+
+        Args:
+            now: Current time as epoch seconds (defaults to now)
+        """
+        if not self._dirty:
+            return
+        now = now if now is not None else time.time()
+
+        live = [(key, entry) for key, entry in self._entries.items() if self._is_live(entry, now)]
+        live.sort(key=lambda item: item[1]["used_at"], reverse=True)
+        self._entries = dict(live[:self.max_entries])
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"entries": self._entries}, indent=2) + "\n")
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def _is_live(self, entry: Dict[str, Any], now: float) -> bool:
+        """Whether an entry is younger than the TTL."""
+        return now - entry["created_at"] < self.ttl_hours * 3600
+
+    def _load(self):
+        """Load the index file, starting empty if it is missing or unreadable."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("entries", {})
+            # Entries written before articles had ids cannot be resolved
+            self._entries = {key: entry for key, entry in entries.items() if "article_id" in entry}
+        except Exception as e:
+            logger.error(f"Error loading article cache index {self.path}: {e}")
+            self._entries = {}
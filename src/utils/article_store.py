@@ -0,0 +1,661 @@
+"""
+Article Store - A SQLite-backed store for fetched news articles.
+Replaces the per-source JSON cache files with an indexed local database.
+"""
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Union
+from datetime import datetime
+
+from .article import Article
+
+logger = logging.getLogger("TEC.ArticleStore")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    source_key TEXT NOT NULL,
+    source TEXT,
+    category TEXT,
+    title TEXT,
+    published TEXT,
+    published_ts REAL,
+    summary TEXT,
+    content TEXT,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source_key, last_seen);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts);
+
+CREATE TABLE IF NOT EXISTS source_articles (
+    source_key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (source_key, url)
+);
+CREATE INDEX IF NOT EXISTS idx_source_articles_seen ON source_articles (source_key, last_seen);
+
+CREATE TABLE IF NOT EXISTS sources (
+    source_key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+
+CREATE TABLE IF NOT EXISTS failures (
+    source_key TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL,
+    retry_after REAL NOT NULL,
+    last_error TEXT
+);
+
+CREATE TABLE IF NOT EXISTS schedule (
+    source_key TEXT PRIMARY KEY,
+    next_poll REAL NOT NULL,
+    interval REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    source_key TEXT NOT NULL,
+    entry_key TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    article TEXT NOT NULL,
+    PRIMARY KEY (source_key, entry_key)
+);
+
+CREATE TABLE IF NOT EXISTS signatures (
+    url TEXT PRIMARY KEY,
+    signature BLOB NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_signatures_indexed ON signatures (indexed_at);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    content_hash TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_used ON analyses (used_at);
+
+CREATE TABLE IF NOT EXISTS topics (
+    topic_key TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    runs INTEGER NOT NULL,
+    article_count INTEGER NOT NULL,
+    terms TEXT NOT NULL,
+    centroid BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_topics_last_seen ON topics (last_seen);
+
+CREATE TABLE IF NOT EXISTS topic_observations (
+    topic_key TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    article_count INTEGER NOT NULL,
+    relevance REAL NOT NULL,
+    velocity REAL NOT NULL,
+    PRIMARY KEY (topic_key, observed_at)
+);
+"""
+
+# Keep IN (...) lists under SQLite's default bound-parameter limit
+MAX_QUERY_PARAMS = 500
+
+ARTICLE_COLUMNS = "url, source, category, title, published, published_ts, summary, content"
+# The same columns qualified for queries that join articles (alias "a") to other tables
+JOINED_ARTICLE_COLUMNS = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS.split(", "))
+
+
+class ArticleStore:
+    """
+    Stores fetched articles in SQLite, keyed by URL.
+
+    Each source is identified by a source key. The articles seen in a source's
+    most recent fetch form its cached result set; older articles stay in the
+    table and remain available to time-range queries. Which sources saw each
+    URL is recorded separately, so a URL carried by several sources stays in
+    every one of their result sets.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the article store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        # One connection shared by fetcher threads, serialized with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            migrate_sources = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles'"
+            ).fetchone() and not self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'source_articles'"
+            ).fetchone()
+            self._conn.executescript(SCHEMA)
+            if migrate_sources:
+                # Stores written before source_articles existed link each URL to its last source
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO source_articles (source_key, url, last_seen) "
+                    "SELECT source_key, url, last_seen FROM articles"
+                )
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def save_source_articles(self, source_key: str, articles: List[Union[Article, Dict[str, Any]]],
+                             fetched_at: Optional[float] = None):
+        """
+        Replace a source's cached result set with freshly fetched articles.
+
+        Args:
+            source_key: Unique key of the source
+            articles: Articles returned by the latest fetch
+            fetched_at: Fetch time as epoch seconds (defaults to now)
+        """
+        fetched_at = fetched_at if fetched_at is not None else datetime.now().timestamp()
+        articles = [Article.coerce(article) for article in articles]
+        rows = [self._article_to_row(source_key, article, fetched_at) for article in articles if article.url]
+        links = [(source_key, article.url, fetched_at) for article in articles if article.url]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO articles (source_key, {ARTICLE_COLUMNS}, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO source_articles (source_key, url, last_seen) VALUES (?, ?, ?)", links
+            )
+            self._conn.execute(
+                "INSERT INTO sources (source_key, fetched_at) VALUES (?, ?) "
+                "ON CONFLICT(source_key) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (source_key, fetched_at)
+            )
+
+    def touch_source(self, source_key: str, fetched_at: Optional[float] = None):
+        """
+        Mark a source's cached result set as fresh without changing it (e.g. after a 304).
+
+        Args:
+            source_key: Unique key of the source
+            fetched_at: New fetch time as epoch seconds (defaults to now)
+        """
+        fetched_at = fetched_at if fetched_at is not None else datetime.now().timestamp()
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM sources WHERE source_key = ?", (source_key,)
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute(
+                "UPDATE source_articles SET last_seen = ? WHERE source_key = ? AND last_seen = ?",
+                (fetched_at, source_key, row["fetched_at"])
+            )
+            self._conn.execute(
+                "UPDATE sources SET fetched_at = ? WHERE source_key = ?", (fetched_at, source_key)
+            )
+
+    def get_fetched_at(self, source_key: str) -> Optional[float]:
+        """Get the time of a source's last successful fetch as epoch seconds."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM sources WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        return row["fetched_at"] if row else None
+
+    def get_source_articles(self, source_key: str, since: Optional[datetime] = None) -> List[Article]:
+        """
+        Get the articles from a source's most recent fetch.
+
+        Args:
+            source_key: Unique key of the source
+            since: Only return articles published at or after this time
+
+        Returns:
+            List of articles
+        """
+        query = (
+            f"SELECT {JOINED_ARTICLE_COLUMNS} FROM source_articles sa "
+            "JOIN sources s ON sa.source_key = s.source_key AND sa.last_seen = s.fetched_at "
+            "JOIN articles a ON a.url = sa.url "
+            "WHERE sa.source_key = ?"
+        )
+        params = [source_key]
+        if since is not None:
+            query += " AND a.published_ts >= ?"
+            params.append(since.timestamp())
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_article(row) for row in rows]
+
+    def query_articles(self, since: Optional[datetime] = None, source: Optional[str] = None,
+                       category: Optional[str] = None, limit: Optional[int] = None) -> List[Article]:
+        """
+        Query stored articles across all sources, newest first.
+
+        Args:
+            since: Only return articles published at or after this time
+            source: Only return articles from this source name
+            category: Only return articles in this category
+            limit: Maximum number of articles to return
+
+        Returns:
+            List of articles
+        """
+        clauses = []
+        params = []
+        if since is not None:
+            clauses.append("published_ts >= ?")
+            params.append(since.timestamp())
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+
+        query = f"SELECT {ARTICLE_COLUMNS} FROM articles"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY published_ts DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_article(row) for row in rows]
+
+    def prune_articles(self, before: datetime) -> int:
+        """
+        Delete source links last seen before a cutoff, then the articles no source links to.
+
+        Args:
+            before: Cutoff time
+
+        Returns:
+            Number of articles deleted
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM source_articles WHERE last_seen < ?", (before.timestamp(),))
+            cursor = self._conn.execute(
+                "DELETE FROM articles WHERE NOT EXISTS "
+                "(SELECT 1 FROM source_articles sa WHERE sa.url = articles.url)"
+            )
+        return cursor.rowcount
+
+    def get_validators(self, source_key: str) -> Dict[str, str]:
+        """
+        Get the ETag / Last-Modified values stored for a source.
+
+        Args:
+            source_key: Unique key of the source
+
+        Returns:
+            Dictionary with optional "etag" and "last_modified" keys
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM sources WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        if not row:
+            return {}
+        return {key: row[key] for key in ("etag", "last_modified") if row[key]}
+
+    def set_validators(self, source_key: str, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Store the ETag / Last-Modified values returned for a source.
+
+        Args:
+            source_key: Unique key of the source
+            etag: ETag header value, if any
+            last_modified: Last-Modified header value, if any
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE sources SET etag = ?, last_modified = ? WHERE source_key = ?",
+                (etag, last_modified, source_key)
+            )
+
+    def get_failure(self, source_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded failure state of a source.
+
+        Args:
+            source_key: Unique key of the source
+
+        Returns:
+            Dictionary with "failures", "retry_after" and "last_error", or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT failures, retry_after, last_error FROM failures WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def record_failure(self, source_key: str, retry_after: float, error: str) -> int:
+        """
+        Record a failed fetch for a source.
+
+        Args:
+            source_key: Unique key of the source
+            retry_after: Epoch seconds before which the source should not be retried
+            error: Description of the failure
+
+        Returns:
+            Number of consecutive failures including this one
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO failures (source_key, failures, retry_after, last_error) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT(source_key) DO UPDATE SET failures = failures + 1, "
+                "retry_after = excluded.retry_after, last_error = excluded.last_error",
+                (source_key, retry_after, error)
+            )
+            row = self._conn.execute(
+                "SELECT failures FROM failures WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        return row["failures"]
+
+    def clear_failure(self, source_key: str):
+        """Forget recorded failures for a source after a successful fetch."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM failures WHERE source_key = ?", (source_key,))
+
+    def get_next_poll(self, source_key: str) -> Optional[float]:
+        """Get when a source is next due to be polled, as epoch seconds."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_poll FROM schedule WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        return row["next_poll"] if row else None
+
+    def set_next_poll(self, source_key: str, next_poll: float, interval: float):
+        """
+        Record when a source is next due to be polled.
+
+        Args:
+            source_key: Unique key of the source
+            next_poll: Epoch seconds at which the source is due
+            interval: Polling interval in seconds that produced next_poll
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO schedule (source_key, next_poll, interval) VALUES (?, ?, ?)",
+                (source_key, next_poll, interval)
+            )
+
+    def get_entry_index(self, source_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the seen-entry index for a source.
+
+        Args:
+            source_key: Unique key of the source
+
+        Returns:
+            Mapping of entry GUID/link to {"hash": ..., "article": ...}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT entry_key, hash, article FROM entries WHERE source_key = ?", (source_key,)
+            ).fetchall()
+        return {row["entry_key"]: {"hash": row["hash"], "article": json.loads(row["article"])} for row in rows}
+
+    def save_entry_index(self, source_key: str, entry_index: Dict[str, Dict[str, Any]]):
+        """
+        Replace the seen-entry index for a source.
+
+        Args:
+            source_key: Unique key of the source
+            entry_index: Mapping of entry GUID/link to a hash and serialized article
+        """
+        rows = [
+            (source_key, entry_key, value["hash"], json.dumps(value["article"]))
+            for entry_key, value in entry_index.items()
+        ]
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE source_key = ?", (source_key,))
+            self._conn.executemany(
+                "INSERT INTO entries (source_key, entry_key, hash, article) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def get_signatures(self, since: Optional[datetime] = None) -> List[tuple]:
+        """
+        Get persisted near-duplicate signatures.
+
+        Args:
+            since: Only return signatures indexed at or after this time
+
+        Returns:
+            List of (url, signature bytes) tuples
+        """
+        since_ts = since.timestamp() if since else 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, signature FROM signatures WHERE indexed_at >= ?", (since_ts,)
+            ).fetchall()
+        return [(row["url"], row["signature"]) for row in rows]
+
+    def save_signatures(self, signatures: Dict[str, bytes], indexed_at: Optional[float] = None):
+        """
+        Store near-duplicate signatures for articles.
+
+        Args:
+            signatures: Mapping of article URL to signature bytes
+            indexed_at: Index time as epoch seconds (defaults to now)
+        """
+        indexed_at = indexed_at if indexed_at is not None else datetime.now().timestamp()
+        rows = [(url, sqlite3.Binary(signature), indexed_at) for url, signature in signatures.items()]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO signatures (url, signature, indexed_at) VALUES (?, ?, ?)", rows
+            )
+
+    def prune_signatures(self, before: datetime) -> int:
+        """
+        Delete signatures indexed before a cutoff.
+
+        Args:
+            before: Cutoff time
+
+        Returns:
+            Number of signatures deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM signatures WHERE indexed_at < ?", (before.timestamp(),))
+        return cursor.rowcount
+
+    def get_analyses(self, content_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached text analyses and mark them as used.
+
+        Args:
+            content_hashes: Hashes of the analyzed texts
+
+        Returns:
+            Mapping of content hash to analysis for the hashes that are cached
+        """
+        analyses = {}
+        now = datetime.now().timestamp()
+
+        with self._lock, self._conn:
+            for start in range(0, len(content_hashes), MAX_QUERY_PARAMS):
+                chunk = content_hashes[start:start + MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT content_hash, analysis FROM analyses WHERE content_hash IN ({placeholders})", chunk
+                ).fetchall()
+                analyses.update((row["content_hash"], json.loads(row["analysis"])) for row in rows)
+                self._conn.execute(
+                    f"UPDATE analyses SET used_at = ? WHERE content_hash IN ({placeholders})", [now] + chunk
+                )
+        return analyses
+
+    def save_analyses(self, analyses: Dict[str, Dict[str, Any]]):
+        """
+        Store text analyses.
+
+        Args:
+            analyses: Mapping of content hash to JSON-serializable analysis
+        """
+        now = datetime.now().timestamp()
+        rows = [(content_hash, json.dumps(analysis), now) for content_hash, analysis in analyses.items()]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analyses (content_hash, analysis, used_at) VALUES (?, ?, ?)", rows
+            )
+
+    def prune_analyses(self, before: datetime) -> int:
+        """
+        Delete analyses not used since a cutoff.
+
+        Args:
+            before: Cutoff time
+
+        Returns:
+            Number of analyses deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM analyses WHERE used_at < ?", (before.timestamp(),))
+        return cursor.rowcount
+
+    def get_topics(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Get tracked topics.
+
+        Args:
+            since: Only return topics last seen at or after this time
+
+        Returns:
+            List of dictionaries with "topic_key", "first_seen", "last_seen",
+            "runs", "article_count", "terms" and "centroid" (bytes)
+        """
+        since_ts = since.timestamp() if since else 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT topic_key, first_seen, last_seen, runs, article_count, terms, centroid "
+                "FROM topics WHERE last_seen >= ?", (since_ts,)
+            ).fetchall()
+
+        topics = []
+        for row in rows:
+            topic = dict(row)
+            topic["terms"] = json.loads(topic["terms"])
+            topics.append(topic)
+        return topics
+
+    def save_topics(self, topics: List[Dict[str, Any]]):
+        """
+        Store tracked topics and record an observation of each.
+
+        Args:
+            topics: Dictionaries with the fields returned by get_topics, plus
+                "relevance" and "velocity" of the observation
+        """
+        topic_rows = [
+            (topic["topic_key"], topic["first_seen"], topic["last_seen"], topic["runs"], topic["article_count"],
+             json.dumps(topic["terms"]), sqlite3.Binary(topic["centroid"]))
+            for topic in topics
+        ]
+        observation_rows = [
+            (topic["topic_key"], topic["last_seen"], topic["article_count"], topic["relevance"], topic["velocity"])
+            for topic in topics
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO topics (topic_key, first_seen, last_seen, runs, article_count, terms, centroid) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                topic_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO topic_observations (topic_key, observed_at, article_count, relevance, velocity) "
+                "VALUES (?, ?, ?, ?, ?)",
+                observation_rows
+            )
+
+    def get_topic_observations(self, topic_key: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Get the recorded observations of a topic, oldest first.
+
+        Args:
+            topic_key: Key of the tracked topic
+            since: Only return observations made at or after this time
+
+        Returns:
+            List of dictionaries with "observed_at", "article_count", "relevance" and "velocity"
+        """
+        since_ts = since.timestamp() if since else 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT observed_at, article_count, relevance, velocity FROM topic_observations "
+                "WHERE topic_key = ? AND observed_at >= ? ORDER BY observed_at", (topic_key, since_ts)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def prune_topics(self, before: datetime) -> int:
+        """
+        Delete topics, and their observations, last seen before a cutoff.
+
+        Args:
+            before: Cutoff time
+
+        Returns:
+            Number of topics deleted
+        """
+        before_ts = before.timestamp()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM topic_observations WHERE topic_key IN (SELECT topic_key FROM topics WHERE last_seen < ?)",
+                (before_ts,)
+            )
+            cursor = self._conn.execute("DELETE FROM topics WHERE last_seen < ?", (before_ts,))
+        return cursor.rowcount
+
+    def _article_to_row(self, source_key: str, article: Article, fetched_at: float) -> tuple:
+        """Convert an article into an articles table row."""
+        return (
+            source_key,
+            article.url,
+            article.source,
+            article.category,
+            article.title,
+            article.published,
+            article.published_ts,
+            article.summary,
+            article.content,
+            fetched_at
+        )
+
+    def _row_to_article(self, row: sqlite3.Row) -> Article:
+        """Convert an articles table row into an article."""
+        return Article(
+            title=row["title"],
+            url=row["url"],
+            source=row["source"],
+            category=row["category"],
+            published=row["published"],
+            published_ts=row["published_ts"],
+            summary=row["summary"],
+            content=row["content"]
+        )
@@ -5,14 +5,73 @@ Handles SEO optimization, article structure, image selection, and formatting.
 import os
 import logging
 import json
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 import re
 import random
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
+from .article import Article
+from .article_cache import ArticleCache, HIT, NEAR_HIT
+from .content_store import ContentStore
+from .text_utils import TermMatcher
+from .templates import Template, compile_templates, compile_template_fields
+
 logger = logging.getLogger("TEC.ContentGenerator")
 
+# Industry and category detection terms, matched as substrings of the topic text
+TECH_INDUSTRIES = {
+    "AI": ["artificial intelligence", "machine learning", "neural network", "deep learning"],
+    "Cloud Computing": ["cloud", "aws", "azure", "google cloud", "saas", "paas", "iaas"],
+    "Cybersecurity": ["security", "cyber", "hack", "breach", "encryption", "firewall"],
+    "Blockchain": ["blockchain", "crypto", "bitcoin", "ethereum", "token", "defi", "nft"],
+    "IoT": ["iot", "internet of things", "connected device", "smart home", "sensor"],
+    "Mobile Technology": ["mobile", "smartphone", "app", "android", "ios", "5g"],
+    "Software Development": ["software", "development", "programming", "code", "api", "sdk"],
+    "Data Science": ["data science", "big data", "analytics", "visualization", "database"]
+}
+
+CATEGORY_TERMS = {
+    "airths_codex": ["analysis", "future", "prediction", "opinion", "perspective"],
+    "technology_ai": ["ai", "machine learning", "artificial intelligence", "automation", "algorithm"],
+    "creative_explorations": ["design", "creative", "art", "innovation", "imagination"],
+    "workflows_automation": ["workflow", "productivity", "automation", "tools", "software"]
+}
+
+# One matcher per table, so each topic text is scanned once for all terms
+_INDUSTRY_MATCHER = TermMatcher(term for terms in TECH_INDUSTRIES.values() for term in terms)
+_CATEGORY_MATCHER = TermMatcher(term for terms in CATEGORY_TERMS.values() for term in terms)
+
+# Placeholders each kind of template may use
+ARTICLE_PLACEHOLDERS = frozenset({"primary_keyword", "secondary_aspect", "related_industry", "current_year"})
+TEMPLATE_PLACEHOLDERS = {
+    "title": ARTICLE_PLACEHOLDERS,
+    "intro": ARTICLE_PLACEHOLDERS,
+    "section_format": frozenset({"section_title", "section_content"}),
+    "conclusion": ARTICLE_PLACEHOLDERS,
+    "call_to_action": ARTICLE_PLACEHOLDERS
+}
+SEO_PATTERN_PLACEHOLDERS = {
+    "title_formats": ARTICLE_PLACEHOLDERS | {"number"},
+    "meta_description_formats": ARTICLE_PLACEHOLDERS,
+    "heading_patterns": ARTICLE_PLACEHOLDERS
+}
+
+DEFAULT_SECTION_FORMAT = Template("<h2>{{section_title}}</h2>\n<p>{{section_content}}</p>",
+                                  TEMPLATE_PLACEHOLDERS["section_format"], "section_format")
+EMPTY_TEMPLATE = Template("")
+
+# Fallback heading patterns
+DEFAULT_HEADING_PATTERNS = compile_templates([
+    "The Rise of {{primary_keyword}}",
+    "Understanding {{secondary_aspect}}",
+    "Key Developments in {{primary_keyword}}",
+    "How {{primary_keyword}} Impacts {{related_industry}}",
+    "Expert Opinions on {{primary_keyword}}",
+    "The Future of {{secondary_aspect}}"
+], SEO_PATTERN_PLACEHOLDERS["heading_patterns"], "heading_patterns")
+
 class ContentGenerator:
     """
     Generates optimized WordPress-ready content from processed news topics.
@@ -35,6 +94,15 @@ class ContentGenerator:
         self.default_category = "technology_ai"
         self.include_images = True
         self.airth_agent = airth_agent
+        self.section_workers = 4  # Sections generated concurrently with the LLM (1 generates them in turn)
+        self.section_timeout = 120  # Seconds an article waits for its LLM sections before using basic content (running LLM calls are not interrupted)
+        self._section_executor = None
+        self.article_cache = True  # Reuse articles generated for the same topic in earlier runs
+        self.article_cache_ttl_hours = 24  # Regenerate cached articles older than this
+        self.article_cache_max_entries = 500  # Least recently used cache entries beyond this are dropped
+        self.article_cache_near_hit_threshold = 0.5  # Article overlap at which a topic updates a cached article
+        self._article_cache = None
+        self._content_store = None
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
@@ -45,7 +113,37 @@ class ContentGenerator:
         
         # Load default templates if not loaded from config
         if not self.content_templates:
-            self._load_default_templates()
+            self._load_default_content_templates()
+        if not self.seo_patterns:
+            self._load_default_seo_patterns()
+
+    @property
+    def content_templates(self) -> Dict[str, Dict[str, str]]:
+        """Article templates by template type."""
+        return self._content_templates
+
+    @content_templates.setter
+    def content_templates(self, templates: Dict[str, Dict[str, str]]):
+        # Compile once here, so rendering an article only fills in values
+        self._compiled_templates = {
+            template_type: compile_template_fields(fields, TEMPLATE_PLACEHOLDERS, f"templates.{template_type}")
+            for template_type, fields in templates.items()
+        }
+        self._content_templates = templates
+
+    @property
+    def seo_patterns(self) -> Dict[str, List[str]]:
+        """Title, meta description and heading patterns."""
+        return self._seo_patterns
+
+    @seo_patterns.setter
+    def seo_patterns(self, patterns: Dict[str, List[str]]):
+        self._compiled_patterns = {
+            key: compile_templates(sources, SEO_PATTERN_PLACEHOLDERS.get(key), f"seo_patterns.{key}")
+            for key, sources in patterns.items()
+            if isinstance(sources, list)
+        }
+        self._seo_patterns = patterns
 
     def _load_config(self, config_path: str):
         """Load content generator configuration from file."""
@@ -57,13 +155,28 @@ class ContentGenerator:
                 with open(config_path, 'r') as f:
                     config = json.load(f)
                 
-                # Apply configuration values
-                self.content_templates = config.get('templates', self.content_templates)
-                self.seo_patterns = config.get('seo_patterns', self.seo_patterns)
+                # Apply configuration values; a template that does not compile
+                # falls back to the defaults for its own field only
+                try:
+                    self.content_templates = config.get('templates', self.content_templates)
+                except Exception as e:
+                    logger.error(f"Invalid templates in {config_path}, using the default templates: {e}")
+                    self._load_default_content_templates()
+                try:
+                    self.seo_patterns = config.get('seo_patterns', self.seo_patterns)
+                except Exception as e:
+                    logger.error(f"Invalid seo_patterns in {config_path}, using the default patterns: {e}")
+                    self._load_default_seo_patterns()
                 self.min_content_length = config.get('min_content_length', self.min_content_length)
                 self.max_content_length = config.get('max_content_length', self.max_content_length)
                 self.default_category = config.get('default_category', self.default_category)
                 self.include_images = config.get('include_images', self.include_images)
+                self.section_workers = config.get('section_workers', self.section_workers)
+                self.section_timeout = config.get('section_timeout', self.section_timeout)
+                self.article_cache = config.get('article_cache', self.article_cache)
+                self.article_cache_ttl_hours = config.get('article_cache_ttl_hours', self.article_cache_ttl_hours)
+                self.article_cache_max_entries = config.get('article_cache_max_entries', self.article_cache_max_entries)
+                self.article_cache_near_hit_threshold = config.get('article_cache_near_hit_threshold', self.article_cache_near_hit_threshold)
                 
                 if 'output_dir' in config:
                     self.output_dir = config['output_dir']
@@ -79,6 +192,11 @@ class ContentGenerator:
             self._load_default_templates()
 
     def _load_default_templates(self):
+        """Load default content templates and SEO patterns."""
+        self._load_default_content_templates()
+        self._load_default_seo_patterns()
+
+    def _load_default_content_templates(self):
         """Load default content templates."""
         self.content_templates = {
             "news_roundup": {
@@ -103,7 +221,10 @@ class ContentGenerator:
                 "call_to_action": "What aspects of {{primary_keyword}} are you most excited or concerned about? Let us know in the comments!"
             }
         }
-        
+        logger.info("Loaded default content templates")
+
+    def _load_default_seo_patterns(self):
+        """Load default SEO patterns."""
         self.seo_patterns = {
             "title_formats": [
                 "{{primary_keyword}}: {{secondary_aspect}} Explained",
@@ -126,8 +247,7 @@ class ContentGenerator:
                 "The Future of {{secondary_aspect}}"
             ]
         }
-        
-        logger.info("Loaded default content templates and SEO patterns")
+        logger.info("Loaded default SEO patterns")
 
     def generate_article_from_topic(self, topic_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -139,88 +259,306 @@ class ContentGenerator:
         Returns:
             Dictionary with the generated article content and metadata
         """
+        return self.generate_articles([topic_data])[0]
+
+    def generate_articles(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate WordPress-ready articles for many topics at once.
+        
+        Every topic is prepared first; then the LLM sections of all articles
+        go through one shared queue of section_workers threads, so wall-clock
+        time grows with the number of LLM calls divided by the worker count
+        rather than with the number of articles. Articles are assembled in
+        topic order and saved together at the end.
+        
+        With the article cache enabled, a topic whose terms and articles match
+        an article generated within article_cache_ttl_hours gets that article
+        back (marked "cached": True), and a topic that mostly overlaps one is
+        updated from it without LLM calls.
+        
+        Args:
+            topics: Processed topics from the NewsProcessor
+            
+        Returns:
+            One result per topic, in topic order: the article data with
+            "success": True, or "success": False and an "error"
+        """
+        plans = [self._plan_article(topic_data) for topic_data in topics]
+        cache = self._get_article_cache()
+        
+        # Queue the section content of every new article before waiting on any of it
+        for plan in plans:
+            if not plan.get("success", True):
+                continue
+            if cache is not None:
+                plan["cache_match"], plan["cache_entry"], plan["cached_article"] = self._lookup_cached_article(cache, plan)
+            if not plan.get("cache_match"):
+                plan["pending_sections"] = self._start_section_contents(
+                    plan["topic_data"], plan["primary_keyword"], plan["section_aspects"]
+                )
+        
+        results = []
+        generated = []  # (plan, article) for each article to save
+        for plan in plans:
+            if not plan.get("success", True):
+                results.append(plan)
+                continue
+            if plan.get("cache_match") == HIT:
+                results.append({"success": True, **plan["cached_article"], "cached": True})
+                continue
+            try:
+                if plan.get("cache_match") == NEAR_HIT:
+                    contents = self._update_section_contents(plan)
+                else:
+                    contents = self._finish_section_contents(
+                        plan["topic_data"], plan["primary_keyword"], plan["section_aspects"], plan["pending_sections"]
+                    )
+                article = self._assemble_article(plan, contents)
+                generated.append((plan, article))
+                results.append(article)
+            except Exception as e:
+                logger.error(f"Error generating article from topic: {e}")
+                results.append({"success": False, "error": str(e)})
+        
+        try:
+            article_ids = self._save_articles([article for _, article in generated])
+            if cache is not None:
+                for (plan, _), article_id in zip(generated, article_ids):
+                    entry = plan.get("cache_entry")
+                    cache.add(plan["topic_data"], article_id, created_at=entry["created_at"] if entry else None)
+                cache.save()
+        except Exception as e:
+            logger.error(f"Error saving generated articles: {e}")
+            for _, article in generated:
+                article.update({"success": False, "error": f"Error saving article: {e}"})
+        
+        if cache is not None:
+            hits = sum(1 for plan in plans if plan.get("cache_match") == HIT)
+            updates = sum(1 for plan in plans if plan.get("cache_match") == NEAR_HIT)
+            logger.info(f"Article cache: {hits} reused, {updates} updated, {len(generated) - updates} generated")
+        
+        return results
+
+    def _plan_article(self, topic_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Choose the template, keywords, title and sections of a topic's article.
+        
+        Args:
+            topic_data: Processed topic data
+            
+        Returns:
+            Article plan, or a result with "success": False if the topic cannot be used
+        """
         if not topic_data:
             logger.error("No topic data provided for content generation")
             return {"success": False, "error": "No topic data provided"}
             
         try:
+            # Topics loaded from JSON carry plain dictionaries
+            topic_data = {**topic_data, "articles": [Article.coerce(a) for a in topic_data.get("articles", [])]}
+            
             # Choose template type based on topic characteristics
             template_type = self._select_template_type(topic_data)
-            template = self.content_templates.get(template_type)
+            template = self._compiled_templates.get(template_type)
             
             if not template:
                 logger.error(f"Template type '{template_type}' not found")
                 return {"success": False, "error": f"Template type '{template_type}' not found"}
             
-            # Extract primary keyword and related terms
+            # Extract primary keyword and related terms; the industry is detected once per topic
             primary_keyword = self._extract_primary_keyword(topic_data)
             secondary_aspects = self._extract_secondary_aspects(topic_data)
-            related_industry = self._extract_related_industry(topic_data)
+            topic_data["related_industry"] = self._extract_related_industry(topic_data)
             
             # Generate SEO-optimized title
             title = self._generate_title(topic_data, primary_keyword, secondary_aspects)
             
-            # Generate article sections
-            sections = self._generate_content_sections(topic_data, primary_keyword, secondary_aspects, template)
-            
-            # Construct full article content
-            current_year = datetime.now().year
-            article_content = self._construct_article_content(
-                template, 
-                primary_keyword, 
-                secondary_aspects[0] if secondary_aspects else "", 
-                related_industry,
-                current_year,
-                sections
-            )
+            # Plan article sections
+            sections, section_aspects = self._plan_sections(topic_data, primary_keyword, secondary_aspects)
             
-            # Generate meta description for SEO
-            meta_description = self._generate_meta_description(
-                primary_keyword, 
-                secondary_aspects[0] if secondary_aspects else "",
-                related_industry,
-                current_year
-            )
-            
-            # Extract and prepare tags
-            tags = self._prepare_tags(topic_data)
-            
-            # Select appropriate WordPress category
-            category = self._select_category(topic_data)
-            
-            # Save the generated content
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = os.path.join(self.output_dir, f"article_{timestamp}.json")
-            
-            article_data = {
+            return {
+                "topic_data": topic_data,
+                "template_type": template_type,
+                "template": template,
+                "primary_keyword": primary_keyword,
+                "secondary_aspects": secondary_aspects,
                 "title": title,
-                "content": article_content,
-                "meta_description": meta_description,
-                "keywords": tags,
-                "category": category,
-                "template_used": template_type,
-                "topic_data": {
-                    "id": topic_data.get("id"),
-                    "suggested_title": topic_data.get("suggested_title"),
-                    "keywords": topic_data.get("keywords", [])[:5],  # Limit to top 5 keywords
-                    "article_count": topic_data.get("article_count", 0),
-                    "sentiment": topic_data.get("sentiment", {}).get("overall", "neutral")
-                },
-                "generated_at": datetime.now().isoformat()
+                "sections": sections,
+                "section_aspects": section_aspects
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, indent=2)
-                
-            logger.info(f"Generated article: '{title}', saved to {filename}")
-            
-            # Return the article data with success flag
-            return {"success": True, **article_data}
-            
         except Exception as e:
             logger.error(f"Error generating article from topic: {e}")
             return {"success": False, "error": str(e)}
 
+    def _assemble_article(self, plan: Dict[str, Any], contents: List[str]) -> Dict[str, Any]:
+        """
+        Build the final article from its plan and generated section contents.
+        
+        Args:
+            plan: Article plan from _plan_article
+            contents: Content of each planned section
+            
+        Returns:
+            Dictionary with the generated article content and metadata
+        """
+        topic_data = plan["topic_data"]
+        primary_keyword = plan["primary_keyword"]
+        secondary_aspects = plan["secondary_aspects"]
+        related_industry = topic_data["related_industry"]
+        sections = [{**section, "content": content} for section, content in zip(plan["sections"], contents)]
+        
+        # Construct full article content
+        current_year = datetime.now().year
+        article_content = self._construct_article_content(
+            plan["template"], 
+            primary_keyword, 
+            secondary_aspects[0] if secondary_aspects else "", 
+            related_industry,
+            current_year,
+            sections
+        )
+        
+        # Generate meta description for SEO
+        meta_description = self._generate_meta_description(
+            primary_keyword, 
+            secondary_aspects[0] if secondary_aspects else "",
+            related_industry,
+            current_year
+        )
+        
+        # Extract and prepare tags
+        tags = self._prepare_tags(topic_data)
+        
+        # Select appropriate WordPress category
+        category = self._select_category(topic_data)
+        
+        article_data = {
+            "title": plan["title"],
+            "content": article_content,
+            "meta_description": meta_description,
+            "keywords": tags,
+            "category": category,
+            "template_used": plan["template_type"],
+            "sections": sections,
+            "topic_data": {
+                "id": topic_data.get("id"),
+                "suggested_title": topic_data.get("suggested_title"),
+                "keywords": topic_data.get("keywords", [])[:5],  # Limit to top 5 keywords
+                "article_count": topic_data.get("article_count", 0),
+                "sentiment": topic_data.get("sentiment", {}).get("overall", "neutral")
+            },
+            "generated_at": datetime.now().isoformat()
+        }
+        
+        # Return the article data with success flag
+        return {"success": True, **article_data}
+
+    def _save_articles(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """
+        Append generated articles to the content store in one transaction.
+        
+        Each article gets a unique id, which is also set as its "id".
+        
+        Args:
+            articles: Generated article results (the success flag is not saved)
+            
+        Returns:
+            Id of each saved article
+        """
+        if not articles:
+            return []
+        
+        article_ids = self._get_content_store().add_articles([
+            {key: value for key, value in article.items() if key != "success"}
+            for article in articles
+        ])
+        
+        for article, article_id in zip(articles, article_ids):
+            article["id"] = article_id
+            logger.info(f"Generated article: '{article['title']}', saved as {article_id}")
+        
+        return article_ids
+
+    def _get_content_store(self) -> ContentStore:
+        """Get the store of generated articles, opening it on first use."""
+        if self._content_store is None:
+            self._content_store = ContentStore(os.path.join(self.output_dir, "generated_articles.db"))
+        return self._content_store
+
+    def _get_article_cache(self) -> Optional[ArticleCache]:
+        """Get the article cache, loading its index on first use (None if disabled)."""
+        if not self.article_cache:
+            return None
+        if self._article_cache is None:
+            self._article_cache = ArticleCache(
+                os.path.join(self.output_dir, "cache_index.json"),
+                ttl_hours=self.article_cache_ttl_hours,
+                max_entries=self.article_cache_max_entries,
+                near_hit_threshold=self.article_cache_near_hit_threshold
+            )
+        return self._article_cache
+
+    def _lookup_cached_article(self, cache: ArticleCache,
+                               plan: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Find a previously generated article for a planned topic.
+        
+        Args:
+            cache: Article cache
+            plan: Article plan from _plan_article
+            
+        Returns:
+            HIT or NEAR_HIT, the cache entry and the saved article, or (None, None, None)
+        """
+        match, entry = cache.lookup(plan["topic_data"])
+        if not match:
+            return None, None, None
+        
+        try:
+            article = self._get_content_store().get_article(entry["article_id"])
+        except Exception as e:
+            logger.error(f"Error loading cached article {entry['article_id']}: {e}")
+            article = None
+        
+        if article is None:
+            logger.warning(f"Cached article {entry['article_id']} is unavailable, regenerating")
+            cache.discard(entry)
+            return None, None, None
+        
+        return match, entry, {**article, "id": entry["article_id"]}
+
+    def _update_section_contents(self, plan: Dict[str, Any]) -> List[str]:
+        """
+        Reuse a cached article's content for a topic that mostly overlaps it.
+        
+        The cached title and sections, headings together with their contents,
+        are kept, so no LLM calls are made. Planned sections beyond the cached
+        ones are added with basic content. Metadata, tags and the meta
+        description are rebuilt from the new topic.
+        
+        Args:
+            plan: Article plan with a near-hit "cached_article"; its sections
+                are replaced by the reused ones
+            
+        Returns:
+            Content of each section
+        """
+        cached = plan["cached_article"]
+        plan["title"] = cached.get("title", plan["title"])
+        cached_sections = cached.get("sections", [])
+        
+        sections = [{"title": section["title"], "content": ""} for section in cached_sections]
+        contents = [section["content"] for section in cached_sections]
+        for i in range(len(cached_sections), len(plan["sections"])):
+            sections.append(plan["sections"][i])
+            contents.append(self._generate_section_content(
+                plan["topic_data"], i, plan["primary_keyword"], plan["section_aspects"][i], use_llm=False
+            ))
+        
+        plan["sections"] = sections
+        return contents
+
     def _select_template_type(self, topic_data: Dict[str, Any]) -> str:
         """
         Select the most appropriate template type based on topic characteristics.
@@ -287,7 +625,7 @@ class ContentGenerator:
         if not aspects and topic_data.get("articles"):
             # Extract some words from article titles
             for article in topic_data["articles"][:3]:
-                title = article.get("title", "")
+                title = article.title
                 words = re.findall(r'\b[A-Za-z][a-z]{5,}\b', title)
                 for word in words:
                     if word.lower() not in [a.lower() for a in aspects]:
@@ -298,17 +636,9 @@ class ContentGenerator:
 
     def _extract_related_industry(self, topic_data: Dict[str, Any]) -> str:
         """Extract or infer the related industry from topic data."""
-        # Check for industry-specific keywords
-        tech_industries = {
-            "AI": ["artificial intelligence", "machine learning", "neural network", "deep learning"],
-            "Cloud Computing": ["cloud", "aws", "azure", "google cloud", "saas", "paas", "iaas"],
-            "Cybersecurity": ["security", "cyber", "hack", "breach", "encryption", "firewall"],
-            "Blockchain": ["blockchain", "crypto", "bitcoin", "ethereum", "token", "defi", "nft"],
-            "IoT": ["iot", "internet of things", "connected device", "smart home", "sensor"],
-            "Mobile Technology": ["mobile", "smartphone", "app", "android", "ios", "5g"],
-            "Software Development": ["software", "development", "programming", "code", "api", "sdk"],
-            "Data Science": ["data science", "big data", "analytics", "visualization", "database"]
-        }
+        # Already detected for this topic
+        if topic_data.get("related_industry"):
+            return topic_data["related_industry"]
         
         # Combine all text for industry detection
         all_text = ""
@@ -318,9 +648,10 @@ class ContentGenerator:
         all_text = f"{keywords} {dominant_terms} {summary}".lower()
         
         # Find matches
+        found = _INDUSTRY_MATCHER.find(all_text)
         industry_matches = {}
-        for industry, terms in tech_industries.items():
-            count = sum(1 for term in terms if term in all_text)
+        for industry, terms in TECH_INDUSTRIES.items():
+            count = sum(1 for term in terms if term in found)
             if count > 0:
                 industry_matches[industry] = count
         
@@ -352,7 +683,7 @@ class ContentGenerator:
             return suggested_title
             
         # Otherwise, use SEO title patterns
-        title_formats = self.seo_patterns.get("title_formats", [])
+        title_formats = self._compiled_patterns.get("title_formats", [])
         if not title_formats:
             return f"{primary_keyword}: Latest News and Developments"
             
@@ -361,15 +692,13 @@ class ContentGenerator:
         
         # Fill in the template
         secondary_aspect = secondary_aspects[0] if secondary_aspects else "Latest Developments"
-        current_year = str(datetime.now().year)
-        related_industry = self._extract_related_industry(topic_data)
-        number = random.choice(["5", "7", "10"])
-        
-        title = title_format.replace("{{primary_keyword}}", primary_keyword)
-        title = title.replace("{{secondary_aspect}}", secondary_aspect)
-        title = title.replace("{{current_year}}", current_year)
-        title = title.replace("{{related_industry}}", related_industry)
-        title = title.replace("{{number}}", number)
+        title = title_format.render({
+            "primary_keyword": primary_keyword,
+            "secondary_aspect": secondary_aspect,
+            "current_year": datetime.now().year,
+            "related_industry": self._extract_related_industry(topic_data),
+            "number": random.choice(["5", "7", "10"])
+        })
         
         # Limit length and ensure proper capitalization
         if len(title) > 70:
@@ -377,41 +706,31 @@ class ContentGenerator:
         
         return title
 
-    def _generate_content_sections(self, topic_data: Dict[str, Any], primary_keyword: str, 
-                                 secondary_aspects: List[str], template: Dict[str, str]) -> List[Dict[str, str]]:
+    def _plan_sections(self, topic_data: Dict[str, Any], primary_keyword: str,
+                       secondary_aspects: List[str]) -> Tuple[List[Dict[str, str]], List[str]]:
         """
-        Generate content sections for the article.
+        Choose the number and titles of an article's sections.
         
         Args:
             topic_data: Processed topic data
             primary_keyword: The main keyword for the article
             secondary_aspects: List of secondary aspects or subtopics
-            template: The selected article template
             
         Returns:
-            List of section dictionaries with titles and content
+            Section dictionaries with titles and empty content, and the
+            secondary aspect of each section
         """
         sections = []
-        
         # Use heading patterns from SEO patterns
-        heading_patterns = self.seo_patterns.get("heading_patterns", [])
-        if not heading_patterns:
-            # Fallback heading patterns
-            heading_patterns = [
-                "The Rise of {{primary_keyword}}",
-                "Understanding {{secondary_aspect}}",
-                "Key Developments in {{primary_keyword}}",
-                "How {{primary_keyword}} Impacts {{related_industry}}",
-                "Expert Opinions on {{primary_keyword}}",
-                "The Future of {{secondary_aspect}}"
-            ]
+        heading_patterns = self._compiled_patterns.get("heading_patterns") or DEFAULT_HEADING_PATTERNS
             
         # Determine how many sections to create
         num_sections = min(len(topic_data.get("articles", [])) // 2 + 1, 4)
         num_sections = max(num_sections, 2)  # At least 2 sections
         
-        # Generate sections
+        # Generate section titles
         related_industry = self._extract_related_industry(topic_data)
+        section_aspects = []
         
         for i in range(num_sections):
             # Select a heading pattern
@@ -419,25 +738,107 @@ class ContentGenerator:
             
             # Select secondary aspect for this section
             secondary_aspect = secondary_aspects[i % len(secondary_aspects)] if secondary_aspects else "recent developments"
+            section_aspects.append(secondary_aspect)
             
             # Generate section title
-            section_title = heading_pattern.replace("{{primary_keyword}}", primary_keyword)
-            section_title = section_title.replace("{{secondary_aspect}}", secondary_aspect)
-            section_title = section_title.replace("{{related_industry}}", related_industry)
-            
-            # Generate section content using relevant articles
-            section_content = self._generate_section_content(topic_data, i, primary_keyword, secondary_aspect)
+            section_title = heading_pattern.render({
+                "primary_keyword": primary_keyword,
+                "secondary_aspect": secondary_aspect,
+                "related_industry": related_industry,
+                "current_year": datetime.now().year
+            })
             
             sections.append({
                 "title": section_title,
-                "content": section_content
+                "content": ""
             })
         
-        return sections
+        return sections, section_aspects
+
+    def _has_llm(self) -> bool:
+        """Whether the Airth agent can generate content with its LLM."""
+        return bool(self.airth_agent and getattr(self.airth_agent, 'llm_client', None))
+
+    def _start_section_contents(self, topic_data: Dict[str, Any], primary_keyword: str,
+                                section_aspects: List[str]) -> List[Union[Future, str]]:
+        """
+        Start generating the content of every section.
+        
+        Each section's LLM call is an independent network round-trip, so they
+        are queued on the shared section executor, where up to section_workers
+        run at once. Without the LLM, content is generated right away.
+        
+        Returns:
+            A future or the finished content for each section
+        """
+        if not self._has_llm() or self.section_workers <= 1:
+            return [
+                self._generate_section_content(topic_data, i, primary_keyword, aspect)
+                for i, aspect in enumerate(section_aspects)
+            ]
+        
+        executor = self._get_section_executor()
+        return [
+            executor.submit(self._generate_section_content, topic_data, i, primary_keyword, aspect)
+            for i, aspect in enumerate(section_aspects)
+        ]
+
+    def _finish_section_contents(self, topic_data: Dict[str, Any], primary_keyword: str,
+                                 section_aspects: List[str], pending: List[Union[Future, str]]) -> List[str]:
+        """
+        Wait for the content started by _start_section_contents.
+        
+        A section that fails or is not ready within section_timeout gets basic
+        content, while the other sections keep their LLM content. The timeout
+        bounds how long each article waits, not the LLM calls: a section that
+        has not started is cancelled, but one whose call is already running
+        cannot be stopped. It keeps its worker until the call returns and its
+        result is discarded, so later articles' sections may start late and
+        fall back to basic content too.
+        
+        Returns:
+            Content of each section, in section order
+        """
+        futures = [item for item in pending if isinstance(item, Future)]
+        if futures:
+            wait(futures, timeout=self.section_timeout)
+        
+        contents = []
+        for i, (item, aspect) in enumerate(zip(pending, section_aspects)):
+            if not isinstance(item, Future):
+                contents.append(item)
+                continue
+            try:
+                if not item.done():
+                    item.cancel()
+                    raise TimeoutError(f"not ready after {self.section_timeout}s")
+                contents.append(item.result())
+            except Exception as e:
+                logger.error(f"Error generating section {i + 1} content, using basic content: {e}")
+                contents.append(self._generate_section_content(topic_data, i, primary_keyword, aspect, use_llm=False))
+        return contents
+
+    def _get_section_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for LLM section generation, creating it on first use."""
+        if self._section_executor is None:
+            self._section_executor = ThreadPoolExecutor(
+                max_workers=self.section_workers,
+                thread_name_prefix="section"
+            )
+        return self._section_executor
+
+    def close(self):
+        """Shut down the section generation threads and close the content store."""
+        executor, self._section_executor = self._section_executor, None
+        if executor:
+            executor.shutdown(wait=True)
+        store, self._content_store = self._content_store, None
+        if store:
+            store.close()
 
     def _generate_section_content(self, topic_data: Dict[str, Any], section_index: int, 
-                                primary_keyword: str, secondary_aspect: str) -> str:
-        """Generate content for a specific article section."""
+                                primary_keyword: str, secondary_aspect: str, use_llm: bool = True) -> str:
+        """Generate content for a specific article section, with the LLM unless use_llm is False."""
         # Group articles by relevance to this section
         relevant_articles = topic_data.get("articles", [])
         
@@ -451,15 +852,16 @@ class ContentGenerator:
         start_idx = section_index * section_size
         end_idx = start_idx + section_size
         section_articles = relevant_articles[start_idx:end_idx]
-          # If we have the Airth agent, use it to generate coherent content
-        if self.airth_agent and hasattr(self.airth_agent, 'llm_client') and self.airth_agent.llm_client:
+        
+        # If we have the Airth agent, use it to generate coherent content
+        if use_llm and self._has_llm():
             # Prepare article data for the prompt
             article_data = []
             for article in section_articles:
                 article_data.append({
-                    "title": article.get("title", ""),
-                    "summary": article.get("summary", ""),
-                    "source": article.get("source", "")
+                    "title": article.title,
+                    "summary": article.summary,
+                    "source": article.source
                 })
                 
             # Generate content using Airth's LLM
@@ -489,9 +891,8 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
         
         # Information from articles
         for article in section_articles:
-            title = article.get("title", "")
-            summary = article.get("summary", "")
-            source = article.get("source", "")
+            summary = article.summary
+            source = article.source
             
             if summary:
                 # Extract a sentence or two from the summary
@@ -509,14 +910,14 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
         # Combine paragraphs
         return "\n\n".join(paragraphs)
 
-    def _construct_article_content(self, template: Dict[str, str], primary_keyword: str, 
+    def _construct_article_content(self, template: Dict[str, Template], primary_keyword: str, 
                                  secondary_aspect: str, related_industry: str,
                                  current_year: int, sections: List[Dict[str, str]]) -> str:
         """
         Construct the full article content from template and sections.
         
         Args:
-            template: Article template to use
+            template: Compiled article template to use
             primary_keyword: Main keyword for the article
             secondary_aspect: Secondary aspect or subtopic
             related_industry: Related industry
@@ -526,37 +927,34 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
         Returns:
             Complete article HTML content
         """
+        values = {
+            "primary_keyword": primary_keyword,
+            "secondary_aspect": secondary_aspect,
+            "related_industry": related_industry,
+            "current_year": current_year
+        }
+        
         # Start with intro
-        intro = template.get("intro", "")
-        intro = intro.replace("{{primary_keyword}}", primary_keyword)
-        intro = intro.replace("{{secondary_aspect}}", secondary_aspect)
-        intro = intro.replace("{{related_industry}}", related_industry)
-        intro = intro.replace("{{current_year}}", str(current_year))
+        intro = template.get("intro", EMPTY_TEMPLATE).render(values)
         
         content = f"<p>{intro}</p>\n\n"
         
         # Add each section
-        section_format = template.get("section_format", "<h2>{{section_title}}</h2>\n<p>{{section_content}}</p>")
+        section_format = template.get("section_format", DEFAULT_SECTION_FORMAT)
         for section in sections:
-            section_content = section_format.replace("{{section_title}}", section["title"])
-            section_content = section_content.replace("{{section_content}}", section["content"])
+            section_content = section_format.render({
+                "section_title": section["title"],
+                "section_content": section["content"]
+            })
             content += f"{section_content}\n\n"
         
         # Add conclusion
-        conclusion = template.get("conclusion", "")
-        conclusion = conclusion.replace("{{primary_keyword}}", primary_keyword)
-        conclusion = conclusion.replace("{{secondary_aspect}}", secondary_aspect)
-        conclusion = conclusion.replace("{{related_industry}}", related_industry)
-        conclusion = conclusion.replace("{{current_year}}", str(current_year))
+        conclusion = template.get("conclusion", EMPTY_TEMPLATE).render(values)
         
         content += f"<h2>Conclusion</h2>\n<p>{conclusion}</p>\n\n"
         
         # Add call to action
-        call_to_action = template.get("call_to_action", "")
-        call_to_action = call_to_action.replace("{{primary_keyword}}", primary_keyword)
-        call_to_action = call_to_action.replace("{{secondary_aspect}}", secondary_aspect)
-        call_to_action = call_to_action.replace("{{related_industry}}", related_industry)
-        call_to_action = call_to_action.replace("{{current_year}}", str(current_year))
+        call_to_action = template.get("call_to_action", EMPTY_TEMPLATE).render(values)
         
         content += f"<p>{call_to_action}</p>"
         
@@ -566,7 +964,7 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
                                  related_industry: str, current_year: int) -> str:
         """Generate an SEO-optimized meta description for the article."""
         # Use meta description formats from SEO patterns
-        meta_formats = self.seo_patterns.get("meta_description_formats", [])
+        meta_formats = self._compiled_patterns.get("meta_description_formats", [])
         if not meta_formats:
             return f"Explore the latest developments in {primary_keyword} and {secondary_aspect}. Learn how these innovations are transforming {related_industry} in {current_year} and beyond."
             
@@ -574,10 +972,12 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
         meta_format = random.choice(meta_formats)
         
         # Fill in the template
-        meta_description = meta_format.replace("{{primary_keyword}}", primary_keyword)
-        meta_description = meta_description.replace("{{secondary_aspect}}", secondary_aspect)
-        meta_description = meta_description.replace("{{related_industry}}", related_industry)
-        meta_description = meta_description.replace("{{current_year}}", str(current_year))
+        meta_description = meta_format.render({
+            "primary_keyword": primary_keyword,
+            "secondary_aspect": secondary_aspect,
+            "related_industry": related_industry,
+            "current_year": current_year
+        })
         
         # Limit length
         if len(meta_description) > 160:
@@ -616,14 +1016,6 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
 
     def _select_category(self, topic_data: Dict[str, Any]) -> str:
         """Select appropriate WordPress category based on topic."""
-        # Extract and analyze topic characteristics
-        categories = {
-            "airths_codex": ["analysis", "future", "prediction", "opinion", "perspective"],
-            "technology_ai": ["ai", "machine learning", "artificial intelligence", "automation", "algorithm"],
-            "creative_explorations": ["design", "creative", "art", "innovation", "imagination"],
-            "workflows_automation": ["workflow", "productivity", "automation", "tools", "software"]
-        }
-        
         # Combine all text for category detection
         all_text = ""
         keywords = " ".join(topic_data.get("keywords", []))
@@ -632,9 +1024,10 @@ Make the text SEO-friendly by naturally incorporating the terms '{primary_keywor
         all_text = f"{keywords} {dominant_terms} {summary}".lower()
         
         # Find matches
+        found = _CATEGORY_MATCHER.find(all_text)
         category_matches = {}
-        for category, terms in categories.items():
-            count = sum(1 for term in terms if term in all_text)
+        for category, terms in CATEGORY_TERMS.items():
+            count = sum(1 for term in terms if term in found)
             category_matches[category] = count
         
         # Select category with most matches, or default
@@ -0,0 +1,205 @@
+"""
+Content Store - A SQLite-backed, append-only store for generated articles.
+Replaces the per-article JSON files with an indexed local database.
+"""
+import os
+import json
+import uuid
+import sqlite3
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+
+logger = logging.getLogger("TEC.ContentStore")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generated_articles (
+    article_id TEXT PRIMARY KEY,
+    generated_at REAL NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT,
+    template TEXT,
+    article TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_generated_at ON generated_articles (generated_at);
+CREATE INDEX IF NOT EXISTS idx_generated_category ON generated_articles (category, generated_at);
+CREATE INDEX IF NOT EXISTS idx_generated_title ON generated_articles (title COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS generated_keywords (
+    keyword TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    PRIMARY KEY (keyword, article_id)
+) WITHOUT ROWID;
+"""
+
+
+class ContentStore:
+    """
+    Stores generated articles in SQLite under unique ids.
+
+    Articles are only ever inserted, never rewritten. Generation time,
+    category, title and keywords are indexed, so history lookups, duplicate
+    checks and reports are queries rather than directory scans.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the content store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        # One connection shared by callers, serialized with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add_articles(self, articles: List[Dict[str, Any]], generated_at: Optional[float] = None) -> List[str]:
+        """
+        Append generated articles in one transaction.
+
+        Args:
+            articles: Article dictionaries with "title", "category", "template_used" and "keywords"
+            generated_at: Generation time as epoch seconds (defaults to now)
+
+        Returns:
+            The new id of each article
+        """
+        generated_at = generated_at if generated_at is not None else datetime.now().timestamp()
+        article_ids = [uuid.uuid4().hex for _ in articles]
+
+        article_rows = [
+            (article_id, generated_at, article.get("title", ""), article.get("category"),
+             article.get("template_used"), json.dumps(article))
+            for article_id, article in zip(article_ids, articles)
+        ]
+        keyword_rows = [
+            (keyword.lower(), article_id)
+            for article_id, article in zip(article_ids, articles)
+            for keyword in set(article.get("keywords", []))
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO generated_articles (article_id, generated_at, title, category, template, article) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                article_rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO generated_keywords (keyword, article_id) VALUES (?, ?)", keyword_rows
+            )
+        return article_ids
+
+    def get_article(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a generated article by id.
+
+        Args:
+            article_id: Id returned by add_articles
+
+        Returns:
+            The article dictionary, or None if there is no such article
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT article FROM generated_articles WHERE article_id = ?", (article_id,)
+            ).fetchone()
+        return json.loads(row["article"]) if row else None
+
+    def find_articles(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                      category: Optional[str] = None, keyword: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find generated articles, newest first.
+
+        Args:
+            since: Only articles generated at or after this time
+            until: Only articles generated before this time
+            category: Only articles in this category
+            keyword: Only articles tagged with this keyword (case-insensitive)
+            limit: Maximum number of articles to return
+
+        Returns:
+            Article dictionaries, each with its "id" and "generated_ts" (epoch seconds)
+        """
+        query = "SELECT a.article_id, a.generated_at, a.article FROM generated_articles a"
+        conditions, params = [], []
+
+        if keyword is not None:
+            query += " JOIN generated_keywords k ON k.article_id = a.article_id"
+            conditions.append("k.keyword = ?")
+            params.append(keyword.lower())
+        if since is not None:
+            conditions.append("a.generated_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            conditions.append("a.generated_at < ?")
+            params.append(until.timestamp())
+        if category is not None:
+            conditions.append("a.category = ?")
+            params.append(category)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.generated_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {**json.loads(row["article"]), "id": row["article_id"], "generated_ts": row["generated_at"]}
+            for row in rows
+        ]
+
+    def has_title(self, title: str, since: Optional[datetime] = None) -> bool:
+        """
+        Check whether an article with this title (ignoring case) was generated.
+
+        Args:
+            title: Article title
+            since: Only consider articles generated at or after this time
+
+        Returns:
+            True if such an article exists
+        """
+        since_ts = since.timestamp() if since else 0
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM generated_articles WHERE title = ? COLLATE NOCASE AND generated_at >= ? LIMIT 1",
+                (title, since_ts)
+            ).fetchone()
+        return row is not None
+
+    def count_by_category(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Count generated articles per category.
+
+        Args:
+            since: Only count articles generated at or after this time
+
+        Returns:
+            Mapping of category to article count
+        """
+        since_ts = since.timestamp() if since else 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) AS count FROM generated_articles WHERE generated_at >= ? GROUP BY category",
+                (since_ts,)
+            ).fetchall()
+        return {row["category"]: row["count"] for row in rows}
@@ -0,0 +1,218 @@
+"""
+HTTP Client - A shared, pooled HTTP transport for TEC agents and fetchers.
+Provides keep-alive connection pools, default timeouts, retries with jittered
+backoff, compressed transfers and per-host latency metrics.
+"""
+import math
+import time
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+logger = logging.getLogger("TEC.HttpClient")
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HttpClient:
+    """
+    Pooled HTTP client built on a single requests.Session.
+
+    Connections are kept alive per host, every request gets a default
+    (connect, read) timeout unless one is passed, and idempotent requests are
+    retried on 429 and 5xx responses with jittered exponential backoff.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 max_retries: int = 3, backoff_factor: float = 0.5,
+                 backoff_jitter: float = 0.5, user_agent: Optional[str] = None,
+                 latency_samples: int = 500):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept alive per host
+            connect_timeout: Default connect timeout in seconds
+            read_timeout: Default read timeout in seconds
+            max_retries: Retries for failed idempotent requests
+            backoff_factor: Base of the exponential retry backoff in seconds
+            backoff_jitter: Maximum random jitter added to each backoff in seconds
+            user_agent: Default User-Agent header
+            latency_samples: Number of recent latencies kept per host for percentiles
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+
+        retry = self._build_retry(max_retries, backoff_factor, backoff_jitter)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Advertise every encoding urllib3 can decode here (gzip/deflate, plus br/zstd when available)
+        self.session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+        self._latency_samples = latency_samples
+        self._metrics_lock = threading.Lock()
+        self._metrics = defaultdict(self._new_host_metrics)
+
+    def _build_retry(self, max_retries: int, backoff_factor: float, backoff_jitter: float) -> Retry:
+        """Build the urllib3 retry policy."""
+        options = {
+            "total": max_retries,
+            "backoff_factor": backoff_factor,
+            "status_forcelist": RETRY_STATUSES,
+            "respect_retry_after_header": True,
+            "raise_on_status": False  # Hand the final response back to the caller
+        }
+        try:
+            return Retry(backoff_jitter=backoff_jitter, **options)
+        except TypeError:
+            # urllib3 < 2.0 has no jitter support
+            return Retry(**options)
+
+    def _new_host_metrics(self) -> Dict[str, Any]:
+        """Create an empty metrics record for a host."""
+        return {
+            "requests": 0,
+            "errors": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+            "latencies": deque(maxlen=self._latency_samples)
+        }
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments accepted by requests.Session.request
+
+        Returns:
+            The response
+
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        failed = True
+
+        try:
+            response = self.session.request(method, url, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            self._record(url, time.perf_counter() - start, failed)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def _record(self, url: str, elapsed: float, failed: bool):
+        """Record the latency of a request against its host."""
+        host = urlparse(url).netloc.lower()
+        with self._metrics_lock:
+            metrics = self._metrics[host]
+            metrics["requests"] += 1
+            metrics["total_seconds"] += elapsed
+            metrics["max_seconds"] = max(metrics["max_seconds"], elapsed)
+            metrics["latencies"].append(elapsed)
+            if failed:
+                metrics["errors"] += 1
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host request metrics.
+
+        Returns:
+            Mapping of host to request count, error count and latency statistics in seconds
+        """
+        with self._metrics_lock:
+            snapshot = {host: (dict(m), sorted(m["latencies"])) for host, m in self._metrics.items()}
+
+        report = {}
+        for host, (metrics, latencies) in snapshot.items():
+            report[host] = {
+                "requests": metrics["requests"],
+                "errors": metrics["errors"],
+                "avg_seconds": metrics["total_seconds"] / metrics["requests"] if metrics["requests"] else 0.0,
+                "p50_seconds": _percentile(latencies, 0.50),
+                "p95_seconds": _percentile(latencies, 0.95),
+                "max_seconds": metrics["max_seconds"]
+            }
+        return report
+
+    def reset_metrics(self):
+        """Clear all recorded metrics."""
+        with self._metrics_lock:
+            self._metrics.clear()
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide shared HTTP client, creating it with defaults if needed.
+
+    Returns:
+        The shared HttpClient
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
+
+
+def configure_http_client(**settings) -> HttpClient:
+    """
+    Replace the shared HTTP client with one built from the given settings.
+
+    Components that already hold the previous client keep using it; configure
+    the transport before creating fetchers and agents.
+
+    Args:
+        **settings: Keyword arguments accepted by HttpClient
+
+    Returns:
+        The new shared HttpClient
+    """
+    global _shared_client
+    with _shared_lock:
+        _shared_client = HttpClient(**settings)
+        logger.info(f"Configured shared HTTP client: {settings}")
+        return _shared_client
@@ -0,0 +1,206 @@
+"""
+Near Duplicates - MinHash/LSH detection of near-duplicate articles.
+Catches syndicated copies of the same story published under different URLs.
+"""
+import re
+import zlib
+import logging
+from typing import Dict, List, Optional
+from datetime import datetime
+
+import numpy as np
+
+logger = logging.getLogger("TEC.NearDuplicates")
+
+# Modulus of the hash permutations. crc32 shingle hashes go up to 2**32 - 1, so
+# hashes that differ by a multiple of this prime collide; at a few hundred
+# shingles per article that costs no measurable accuracy, and in return
+# (a * x + b) stays within uint64 and signatures fit in uint32.
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures of article texts, banded into an LSH index.
+
+    Each text is split into word shingles and summarized as a fixed-size
+    MinHash signature. Signatures are split into bands; texts that share any
+    band become candidates and are confirmed by their estimated Jaccard
+    similarity, so lookups cost roughly constant time per article instead
+    of a comparison against every other article.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 5,
+                 threshold: float = 0.7, seed: int = 1):
+        """
+        Initialize an empty index.
+
+        Args:
+            num_perm: Number of hash permutations in a signature
+            bands: Number of LSH bands (num_perm must divide evenly)
+            shingle_size: Words per shingle
+            threshold: Minimum estimated Jaccard similarity for a duplicate
+            seed: Seed for the permutations (must match across runs to reuse
+                persisted signatures)
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+        self._signatures = {}  # url -> signature
+        self._buckets = [dict() for _ in range(bands)]  # band -> band hash -> [url]
+        self._pending = {}  # url -> signature not yet persisted
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._signatures
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to summarize
+
+        Returns:
+            Array of num_perm uint32 values, or None if the text has no words
+        """
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+
+        # crc32 is stable across processes, unlike the built-in hash()
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _shingles(self, text: str) -> set:
+        """Split a text into lowercase word shingles."""
+        words = WORD_PATTERN.findall(text.lower())
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        return float(np.count_nonzero(first == second)) / self.num_perm
+
+    def query(self, signature: np.ndarray, exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Find the most similar indexed article at or above the threshold.
+
+        Args:
+            signature: Signature to look up
+            exclude: URL to ignore among the candidates
+
+        Returns:
+            URL of the best match, or None
+        """
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        candidates.discard(exclude)
+
+        best_url, best_score = None, self.threshold
+        for url in candidates:
+            score = self.similarity(signature, self._signatures[url])
+            if score >= best_score:
+                best_url, best_score = url, score
+        return best_url
+
+    def add(self, url: str, signature: np.ndarray, persist: bool = True):
+        """
+        Add an article's signature to the index.
+
+        Args:
+            url: Article URL
+            signature: MinHash signature of the article text
+            persist: Include the signature in the next save()
+        """
+        if url in self._signatures:
+            return
+
+        self._signatures[url] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(url)
+        if persist:
+            self._pending[url] = signature
+
+    def find_duplicate(self, url: str, text: str) -> Optional[str]:
+        """
+        Check an article against the index, adding it if it is not a duplicate.
+
+        Args:
+            url: Article URL
+            text: Article text (e.g. title and summary)
+
+        Returns:
+            URL of the earlier article this one duplicates, or None
+        """
+        # An article already in the index is the original, not a copy of itself
+        if url in self._signatures:
+            return None
+
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        duplicate_of = self.query(signature)
+        if duplicate_of is None:
+            self.add(url, signature)
+        return duplicate_of
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """Split a signature into per-band bucket keys."""
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def load(self, store, since: Optional[datetime] = None) -> int:
+        """
+        Load persisted signatures from an article store.
+
+        Args:
+            store: ArticleStore holding the signatures
+            since: Ignore signatures indexed before this time
+
+        Returns:
+            Number of signatures loaded
+        """
+        loaded = 0
+        for url, blob in store.get_signatures(since=since):
+            signature = np.frombuffer(blob, dtype=np.uint32)
+            if len(signature) != self.num_perm:
+                continue  # Written with different index settings
+            self.add(url, signature, persist=False)
+            loaded += 1
+        return loaded
+
+    def save(self, store) -> int:
+        """
+        Persist signatures added since the last save.
+
+        Args:
+            store: ArticleStore to write to
+
+        Returns:
+            Number of signatures written
+        """
+        if not self._pending:
+            return 0
+
+        pending = self._pending
+        store.save_signatures({url: signature.tobytes() for url, signature in pending.items()})
+        self._pending = {}
+        return len(pending)
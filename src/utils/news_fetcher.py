@@ -3,18 +3,124 @@ News Fetcher - A module for retrieving news data from various sources.
 Supports RSS feeds, news APIs, and direct web scraping.
 """
 import os
+import re
 import logging
 import json
-import requests
+import hashlib
 import feedparser
-from typing import Dict, Any, List, Optional
+import heapq
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, as_completed, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from time import mktime
+import time
 from pathlib import Path
 
+from .article import Article, parse_published
+from .article_store import ArticleStore
+from .http_client import get_http_client, configure_http_client
+
 logger = logging.getLogger("TEC.NewsFetcher")
 
+NEWS_API_URL = "https://newsapi.org/v2/top-headlines"
+
+
+def parse_feed_document(document: bytes, response_headers: Dict[str, str], source: Dict[str, Any],
+                        known_hashes: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Parse a downloaded feed and normalize its new or changed entries.
+    
+    Kept at module level with picklable arguments so it can run in a worker
+    process as well as in-process.
+    
+    Args:
+        document: Raw feed bytes
+        response_headers: HTTP response headers (used for encoding detection)
+        source: Source configuration dictionary
+        known_hashes: Mapping of entry GUID/link to the hash seen on the last poll
+        
+    Returns:
+        Dictionary with "entries" as (entry_key, entry_hash, article) tuples, where
+        article is None for entries matching known_hashes, the feed's "ttl", and
+        an "error" message if the document could not be parsed
+    """
+    feed = feedparser.parse(
+        document,
+        response_headers={key.lower(): value for key, value in response_headers.items()}
+    )
+    
+    if feed.get("bozo") and not feed.entries:
+        return {"entries": [], "ttl": None, "error": str(feed.get("bozo_exception", "unreadable feed"))}
+    
+    entries = []
+    for entry in feed.entries:
+        # Extract raw content
+        content = ""
+        if hasattr(entry, 'content'):
+            for content_item in entry.content:
+                content += content_item.value
+        elif hasattr(entry, 'summary'):
+            content = entry.summary
+        
+        entry_key = entry.get("id") or entry.get("link", "")
+        entry_hash = _hash_entry(entry, content)
+        
+        if known_hashes.get(entry_key) == entry_hash:
+            entries.append((entry_key, entry_hash, None))
+        else:
+            entries.append((entry_key, entry_hash, _normalize_rss_entry(entry, content, source)))
+    
+    return {"entries": entries, "ttl": feed.get("feed", {}).get("ttl"), "error": None}
+
+
+def _normalize_rss_entry(entry: Any, content: str, source: Dict[str, Any]) -> Article:
+    """
+    Convert a feed entry into an article.
+    
+    Args:
+        entry: feedparser entry
+        content: Raw (possibly HTML) entry content
+        source: Source configuration dictionary
+        
+    Returns:
+        Article
+    """
+    # feedparser normalizes publication dates to UTC struct_time
+    published_ts = parse_published(entry.get("published_parsed"), default=time.time())
+    
+    # Clean HTML if present
+    if content:
+        soup = BeautifulSoup(content, 'html.parser')
+        content = soup.get_text()
+    
+    return Article(
+        title=entry.title,
+        url=entry.link,
+        source=source["name"],
+        category=source.get("category", "general"),
+        published=entry.get("published", ""),
+        published_ts=published_ts,
+        summary=content,
+        content=content
+    )
+
+
+def _hash_entry(entry: Any, content: str) -> str:
+    """Hash the raw fields of a feed entry to detect changes between polls."""
+    parts = [
+        entry.get("title", ""),
+        entry.get("link", ""),
+        entry.get("published", ""),
+        entry.get("updated", ""),
+        content
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
 class NewsFetcher:
     """
     Handles retrieval of news data from various sources.
@@ -31,7 +137,25 @@ class NewsFetcher:
         self.sources = []
         self.api_keys = {}
         self.cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'news_cache')
+        self.store_path = os.path.join(self.cache_dir, 'articles.db')
         self.cache_expiry = 3600  # Default cache expiry in seconds (1 hour)
+        self.max_workers = 8  # Worker threads used for concurrent fetching
+        self.max_per_host = 2  # Simultaneous requests allowed against one host
+        self.fetch_time_budget = 120  # Wall-clock budget in seconds for a full run
+        self.stale_while_revalidate = 86400  # Serve expired cache this long while refreshing
+        self.negative_cache_ttl = 300  # Initial backoff in seconds after a failed fetch
+        self.max_negative_cache_ttl = 21600  # Longest backoff for a repeatedly failing source
+        self.adaptive_polling = True  # Skip sources that are not due according to their publish rate
+        self.min_poll_interval = 300  # Shortest adaptive polling interval in seconds
+        self.max_poll_interval = 21600  # Longest adaptive polling interval in seconds
+        self.article_retention_days = 30  # Drop stored articles no source has returned for this long
+        self._store_pruned = False
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+        self.parse_workers = 0  # Worker processes for feed parsing (0 parses in the fetch thread)
+        self._refreshing = set()
+        self._refresh_executor = None
+        self._parse_pool = None
         
         # Ensure cache directory exists
         os.makedirs(self.cache_dir, exist_ok=True)
@@ -48,6 +172,13 @@ class NewsFetcher:
                 logger.warning("No news sources configuration found. Using default sources.")
                 self._load_default_sources()
 
+        # Open the article store used as the fetch cache
+        self.store = ArticleStore(self.store_path)
+        self._import_legacy_cache()
+        
+        # All network I/O goes through the shared pooled transport
+        self.http = get_http_client()
+
         # Load API keys from environment variables
         self._load_api_keys()
 
@@ -63,6 +194,21 @@ class NewsFetcher:
                 
                 self.sources = config.get('sources', [])
                 self.cache_expiry = config.get('cache_expiry', 3600)
+                self.max_workers = config.get('max_workers', self.max_workers)
+                self.max_per_host = config.get('max_per_host', self.max_per_host)
+                self.fetch_time_budget = config.get('fetch_time_budget', self.fetch_time_budget)
+                self.store_path = config.get('article_store', self.store_path)
+                self.stale_while_revalidate = config.get('stale_while_revalidate', self.stale_while_revalidate)
+                self.negative_cache_ttl = config.get('negative_cache_ttl', self.negative_cache_ttl)
+                self.max_negative_cache_ttl = config.get('max_negative_cache_ttl', self.max_negative_cache_ttl)
+                self.parse_workers = config.get('parse_workers', self.parse_workers)
+                self.adaptive_polling = config.get('adaptive_polling', self.adaptive_polling)
+                self.min_poll_interval = config.get('min_poll_interval', self.min_poll_interval)
+                self.max_poll_interval = config.get('max_poll_interval', self.max_poll_interval)
+                self.article_retention_days = config.get('article_retention_days', self.article_retention_days)
+                
+                if 'http' in config:
+                    configure_http_client(**config['http'])
                 
                 logger.info(f"Loaded {len(self.sources)} news sources from configuration")
             else:
@@ -122,61 +268,376 @@ class NewsFetcher:
             
         # Add more API keys as needed
 
-    def fetch_all_sources(self, max_age_days: int = 1) -> List[Dict[str, Any]]:
+    def fetch_all_sources(self, max_age_days: int = 1, concurrent: Optional[bool] = None) -> List[Article]:
         """
         Fetch articles from all configured sources.
         
         Args:
             max_age_days: Maximum age of articles to fetch in days
+            concurrent: Fetch sources in parallel (defaults to True when
+                max_workers is greater than 1)
             
         Returns:
             List of articles from all sources
         """
+        self._prune_store()
+        
+        if concurrent is None:
+            concurrent = self.max_workers > 1 and len(self.sources) > 1
+        
+        if concurrent:
+            results = self._fetch_sources_concurrently(self.sources)
+        else:
+            results = [self._fetch_source(source) for source in self.sources]
+        
+        cutoff_ts = (datetime.now() - timedelta(days=max_age_days)).timestamp()
         all_articles = []
         
-        for source in self.sources:
+        # Merge in configuration order so output matches the sequential path
+        for source, articles in zip(self.sources, results):
+            if articles is None:
+                continue
+            
             try:
-                source_type = source.get("type", "rss")
-                
-                if source_type == "rss":
-                    articles = self._fetch_rss(source)
-                elif source_type == "news_api":
-                    articles = self._fetch_news_api(source)
-                elif source_type == "web":
-                    articles = self._fetch_web_scrape(source)
-                else:
-                    logger.warning(f"Unknown source type: {source_type}")
-                    continue
-                  # Filter by age
-                cutoff_date = datetime.now() - timedelta(days=max_age_days)
-                filtered_articles = []
+                filtered_articles = self._filter_by_age(articles, cutoff_ts)
+            except Exception as e:
+                logger.error(f"Error filtering articles from {source['name']}: {e}")
+                continue
+            all_articles.extend(filtered_articles)
+            
+            logger.info(f"Fetched {len(filtered_articles)} recent articles from {source['name']}")
+        
+        # Sort by publication date, newest first
+        all_articles.sort(key=lambda x: x.published_ts, reverse=True)
+        
+        return all_articles
+
+    def iter_articles(self, max_age_days: int = 1, merge_by_date: bool = False) -> Iterator[Article]:
+        """
+        Stream articles from all configured sources as each source completes.
+        
+        Unlike fetch_all_sources, articles are yielded per source in completion
+        order so downstream stages can start before the slowest source finishes.
+        
+        Args:
+            max_age_days: Maximum age of articles to fetch in days
+            merge_by_date: Yield articles newest first across all sources. This
+                waits for every source but merges the per-source lists lazily
+                instead of building and sorting one combined list. Articles
+                published at the same time keep the configured source order, so
+                the result does not depend on which source finished first.
+            
+        Yields:
+            Articles
+        """
+        self._prune_store()
+        
+        cutoff_ts = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+        sort_key = lambda x: x.published_ts
+        positions = {id(source): i for i, source in enumerate(self.sources)}
+        streams = []
+        
+        for source, articles in self._iter_source_results(self.sources):
+            try:
+                filtered_articles = self._filter_by_age(articles, cutoff_ts)
+            except Exception as e:
+                logger.error(f"Error filtering articles from {source['name']}: {e}")
+                continue
+            logger.info(f"Fetched {len(filtered_articles)} recent articles from {source['name']}")
+            
+            if merge_by_date:
+                filtered_articles.sort(key=sort_key, reverse=True)
+                streams.append((positions[id(source)], filtered_articles))
+            else:
+                yield from filtered_articles
+        
+        if merge_by_date:
+            streams.sort(key=lambda stream: stream[0])
+            yield from heapq.merge(*(articles for _, articles in streams), key=sort_key, reverse=True)
+
+    def _prune_store(self):
+        """Delete articles older than article_retention_days from the store, once per fetcher."""
+        if self._store_pruned:
+            return
+        self._store_pruned = True
+        try:
+            deleted = self.store.prune_articles(datetime.now() - timedelta(days=self.article_retention_days))
+            if deleted:
+                logger.info(f"Pruned {deleted} articles not seen in {self.article_retention_days} days")
+        except Exception as e:
+            logger.error(f"Error pruning the article store: {e}")
+
+    def get_recent_articles(self, max_age_days: int = 1, category: Optional[str] = None) -> List[Article]:
+        """
+        Get recently published articles from the article store without fetching.
+        
+        Args:
+            max_age_days: Maximum age of articles in days
+            category: Only return articles in this category
+            
+        Returns:
+            List of stored articles, newest first
+        """
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        return self.store.query_articles(since=cutoff_date, category=category)
+
+    def _iter_source_results(self, sources: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], List[Article]]]:
+        """
+        Fetch sources in parallel and yield each result as soon as it is ready.
+        
+        Args:
+            sources: Source configuration dictionaries
+            
+        Yields:
+            (source, articles) tuples in completion order; failed sources are skipped
+        """
+        if not sources:
+            return
+            
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="news-fetch")
+        
+        try:
+            futures = {executor.submit(self._fetch_source_limited, source): source for source in sources}
+            pending = set(futures)
+            
+            try:
+                for future in as_completed(futures, timeout=self.fetch_time_budget):
+                    pending.discard(future)
+                    articles = future.result()
+                    if articles is not None:
+                        yield futures[future], articles
+            except FuturesTimeoutError:
+                for future in pending:
+                    future.cancel()
+                    source = futures[future]
+                    logger.warning(f"Fetch time budget of {self.fetch_time_budget}s exceeded; skipping {source.get('name', 'unknown')}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_source(self, source: Dict[str, Any], use_cache: bool = True) -> Optional[List[Article]]:
+        """
+        Fetch articles from a single source using the fetcher for its type.
+        
+        Fresh cached articles are returned directly. Expired articles still inside
+        the source's stale-while-revalidate window are returned immediately while a
+        background refresh runs, and sources that failed recently are not retried
+        until their backoff has elapsed.
+        
+        Args:
+            source: Source configuration dictionary
+            use_cache: Consult the article store before hitting the network
+            
+        Returns:
+            List of articles, or None if the source could not be fetched
+        """
+        try:
+            source_key = self._get_source_key(source)
+            
+            if use_cache:
+                failure = self.store.get_failure(source_key)
+                if failure and failure["retry_after"] > datetime.now().timestamp():
+                    logger.info(f"Skipping {source['name']} after {failure['failures']} recent failure(s); serving cached articles")
+                    return self._read_cache(source_key)
                 
-                for article in articles:
-                    publish_date = article.get("published_datetime")
-                    # Make sure publish_date is a datetime object
-                    if isinstance(publish_date, str):
-                        try:
-                            publish_date = datetime.fromisoformat(publish_date.replace('Z', '+00:00'))
-                        except ValueError:
-                            # If conversion fails, use current time
-                            publish_date = datetime.now()
-                    
-                    if publish_date and publish_date >= cutoff_date:
-                        filtered_articles.append(article)
+                # Sources that publish rarely are not polled until they are due
+                next_poll = self.store.get_next_poll(source_key) if self.adaptive_polling else None
+                if next_poll and next_poll > datetime.now().timestamp() and self.store.get_fetched_at(source_key) is not None:
+                    logger.debug(f"{source['name']} not due for polling; serving cached articles")
+                    return self._read_cache(source_key)
                 
-                all_articles.extend(filtered_articles)
+                # Check if cached data is available and recent
+                cache_expiry = source.get("cache_expiry", self.cache_expiry)
+                cached_data = self._check_cache(source_key, cache_expiry)
+                if cached_data:
+                    return cached_data
                 
-                logger.info(f"Fetched {len(filtered_articles)} recent articles from {source['name']}")
+                # Serve an expired copy while it is within the stale window
+                stale_window = cache_expiry + source.get("stale_while_revalidate", self.stale_while_revalidate)
+                stale_data = self._check_cache(source_key, stale_window)
+                if stale_data:
+                    self._schedule_refresh(source, source_key)
+                    return stale_data
+            
+            source_type = source.get("type", "rss")
+            
+            if source_type == "rss":
+                return self._fetch_rss(source)
+            elif source_type == "news_api":
+                return self._fetch_news_api(source)
+            elif source_type == "web":
+                return self._fetch_web_scrape(source)
+            else:
+                logger.warning(f"Unknown source type: {source_type}")
+                return None
                 
-            except Exception as e:
-                logger.error(f"Error fetching from {source.get('name', 'unknown')}: {e}")
+        except Exception as e:
+            logger.error(f"Error fetching from {source.get('name', 'unknown')}: {e}")
+            return None
+
+    def _schedule_refresh(self, source: Dict[str, Any], source_key: str):
+        """
+        Refresh a stale source in the background, at most once at a time per source.
         
-        # Sort by publication date, newest first
-        all_articles.sort(key=lambda x: x.get("published_datetime", datetime.min), reverse=True)
+        Args:
+            source: Source configuration dictionary
+            source_key: Unique store key of the source
+        """
+        with self._host_lock:
+            if source_key in self._refreshing:
+                return
+            self._refreshing.add(source_key)
+            
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="news-refresh")
         
-        return all_articles
+        logger.info(f"Serving stale articles for {source['name']} while refreshing in the background")
+        
+        def refresh():
+            try:
+                self._fetch_source_limited(source, use_cache=False)
+            finally:
+                with self._host_lock:
+                    self._refreshing.discard(source_key)
+        
+        self._refresh_executor.submit(refresh)
+
+    def _schedule_next_poll(self, source: Dict[str, Any], source_key: str, articles: List[Article],
+                            headers: Optional[Dict[str, str]] = None, ttl_minutes: Optional[str] = None):
+        """
+        Work out when a source should next be polled and record it.
+        
+        The interval is the median gap between the source's publication times,
+        raised to any feed <ttl> or Cache-Control max-age the server sent, and
+        clamped to the source's min_poll_interval / max_poll_interval.
+        
+        Args:
+            source: Source configuration dictionary
+            source_key: Unique store key of the source
+            articles: Articles from the latest fetch
+            headers: Response headers from the latest fetch
+            ttl_minutes: Value of the feed's <ttl> element, if any
+        """
+        if not self.adaptive_polling:
+            return
+            
+        try:
+            min_interval = source.get("min_poll_interval", self.min_poll_interval)
+            max_interval = source.get("max_poll_interval", self.max_poll_interval)
+            
+            interval = self._observed_publish_interval(articles)
+            if interval is None:
+                interval = min_interval
+            
+            # Servers telling us how long the document stays fresh are honored
+            hints = [self._parse_max_age(headers.get("Cache-Control")) if headers else None]
+            if ttl_minutes and str(ttl_minutes).strip().isdigit():
+                hints.append(int(ttl_minutes) * 60)
+            interval = max([interval] + [hint for hint in hints if hint])
+            
+            interval = min(max(interval, min_interval), max_interval)
+            self.store.set_next_poll(source_key, datetime.now().timestamp() + interval, interval)
+            logger.debug(f"Next poll of {source['name']} in {interval:.0f}s")
+        except Exception as e:
+            logger.error(f"Error scheduling next poll for {source_key}: {e}")
+
+    def _observed_publish_interval(self, articles: List[Article]) -> Optional[float]:
+        """Median gap in seconds between consecutive publication times, or None."""
+        timestamps = sorted(article.published_ts for article in articles)
+        gaps = sorted(later - earlier for earlier, later in zip(timestamps, timestamps[1:]) if later > earlier)
+        if not gaps:
+            return None
+        return gaps[len(gaps) // 2]
+
+    def _parse_max_age(self, cache_control: Optional[str]) -> Optional[int]:
+        """Extract max-age in seconds from a Cache-Control header."""
+        if not cache_control or "no-cache" in cache_control or "no-store" in cache_control:
+            return None
+        match = re.search(r'max-age=(\d+)', cache_control)
+        return int(match.group(1)) if match else None
+
+    def _record_failure(self, source_key: str, error: str):
+        """
+        Remember a failed fetch so the source backs off before being retried.
+        
+        The backoff doubles with each consecutive failure, from negative_cache_ttl
+        up to max_negative_cache_ttl.
+        
+        Args:
+            source_key: Unique store key of the source
+            error: Description of the failure
+        """
+        try:
+            failure = self.store.get_failure(source_key)
+            failures = (failure["failures"] if failure else 0) + 1
+            backoff = min(self.negative_cache_ttl * (2 ** (failures - 1)), self.max_negative_cache_ttl)
+            
+            self.store.record_failure(source_key, datetime.now().timestamp() + backoff, error)
+            logger.info(f"Backing off {source_key} for {backoff}s after {failures} failure(s)")
+        except Exception as e:
+            logger.error(f"Error recording failure for {source_key}: {e}")
 
-    def _fetch_rss(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _fetch_sources_concurrently(self, sources: List[Dict[str, Any]]) -> List[Optional[List[Article]]]:
+        """
+        Fetch several sources in parallel with a per-host cap and a time budget.
+        
+        Args:
+            sources: Source configuration dictionaries
+            
+        Returns:
+            Fetch results in the same order as sources; None for sources that
+            failed or did not finish within fetch_time_budget
+        """
+        results = [None] * len(sources)
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="news-fetch")
+        
+        try:
+            futures = {
+                executor.submit(self._fetch_source_limited, source): index
+                for index, source in enumerate(sources)
+            }
+            done, not_done = wait(futures, timeout=self.fetch_time_budget)
+            
+            for future in done:
+                results[futures[future]] = future.result()
+            
+            for future in not_done:
+                future.cancel()
+                source = sources[futures[future]]
+                logger.warning(f"Fetch time budget of {self.fetch_time_budget}s exceeded; skipping {source.get('name', 'unknown')}")
+        finally:
+            # Don't block on stragglers that are past the budget
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+
+    def _fetch_source_limited(self, source: Dict[str, Any], use_cache: bool = True) -> Optional[List[Article]]:
+        """Fetch a source while holding its host's concurrency slot."""
+        with self._get_host_semaphore(source):
+            return self._fetch_source(source, use_cache=use_cache)
+
+    def _get_host_semaphore(self, source: Dict[str, Any]) -> threading.Semaphore:
+        """Get the semaphore limiting concurrent requests to a source's host."""
+        host = urlparse(source.get("url", "")).netloc.lower() or source.get("type", "rss")
+        
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.Semaphore(max(1, self.max_per_host))
+            return self._host_semaphores[host]
+
+    def _filter_by_age(self, articles: List[Article], cutoff_ts: float) -> List[Article]:
+        """
+        Keep only articles published at or after the cutoff.
+        
+        Args:
+            articles: Articles to filter
+            cutoff_ts: Oldest publication time to keep, in epoch seconds
+            
+        Returns:
+            List of recent articles
+        """
+        return [article for article in articles if article.published_ts >= cutoff_ts]
+
+    def _fetch_rss(self, source: Dict[str, Any]) -> List[Article]:
         """
         Fetch articles from an RSS feed.
         
@@ -186,60 +647,116 @@ class NewsFetcher:
         Returns:
             List of articles from the RSS feed
         """
-        cache_file = self._get_cache_file(source)
-        
-        # Check if cached data is available and recent
-        cached_data = self._check_cache(cache_file)
-        if cached_data:
-            return cached_data
+        source_key = self._get_source_key(source)
         
         try:
-            feed = feedparser.parse(source["url"])
+            # Revalidate with the stored ETag / Last-Modified so unchanged feeds return 304
+            headers = self._conditional_headers(self._load_validators(source_key))
+            response = self.http.get(source["url"], headers=headers)
+            
+            if response.status_code == 304:
+                logger.info(f"RSS feed {source['url']} not modified; reusing cached articles")
+                articles = self._refresh_cache(source_key)
+                self._schedule_next_poll(source, source_key, articles, response.headers)
+                return articles
+            elif response.status_code >= 400:
+                logger.error(f"Error fetching RSS feed {source['url']}: HTTP {response.status_code}")
+                self._record_failure(source_key, f"HTTP {response.status_code}")
+                return []
+            
+            # Only entries that are new or changed since the last poll get cleaned
+            entry_index = self._load_entry_index(source_key)
+            known_hashes = {entry_key: indexed["hash"] for entry_key, indexed in entry_index.items()}
+            
+            parsed = self._parse_feed(response.content, dict(response.headers), source, known_hashes)
+            
+            if parsed["error"]:
+                logger.error(f"Error parsing RSS feed {source['url']}: {parsed['error']}")
+                self._record_failure(source_key, parsed["error"])
+                return []
+            
+            new_index = {}
             articles = []
+            reused = 0
             
-            for entry in feed.entries:
-                # Extract the publication date
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published_datetime = datetime.fromtimestamp(mktime(entry.published_parsed))
-                else:
-                    published_datetime = datetime.now()
-                
-                # Extract content
-                content = ""
-                if hasattr(entry, 'content'):
-                    for content_item in entry.content:
-                        content += content_item.value
-                elif hasattr(entry, 'summary'):
-                    content = entry.summary
-                
-                # Clean HTML if present
-                if content:
-                    soup = BeautifulSoup(content, 'html.parser')
-                    content = soup.get_text()
-                
-                article = {
-                    "title": entry.title,
-                    "url": entry.link,
-                    "source": source["name"],
-                    "category": source.get("category", "general"),
-                    "published": entry.get("published", ""),
-                    "published_datetime": published_datetime,
-                    "summary": content,
-                    "content": content
-                }
+            for entry_key, entry_hash, article in parsed["entries"]:
+                if article is None:
+                    article = self._deserialize_article(entry_index[entry_key]["article"])
+                    reused += 1
                 
+                new_index[entry_key] = {"hash": entry_hash, "article": self._serialize_article(article)}
                 articles.append(article)
             
+            if reused:
+                logger.debug(f"Reused {reused} of {len(articles)} unchanged entries from {source['name']}")
+            
+            # Entries that dropped out of the feed are pruned from the index
+            self._save_entry_index(source_key, new_index)
+            
             # Cache the results
-            self._cache_results(cache_file, articles)
+            self._cache_results(source_key, articles)
+            self._save_validators(source_key, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            self._schedule_next_poll(source, source_key, articles, response.headers, parsed["ttl"])
             
             return articles
             
         except Exception as e:
             logger.error(f"Error fetching RSS feed {source['url']}: {e}")
+            self._record_failure(source_key, str(e))
             return []
 
-    def _fetch_news_api(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_feed(self, document: bytes, response_headers: Dict[str, str], source: Dict[str, Any],
+                    known_hashes: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Parse a feed document, in the process pool when parse_workers is set.
+        
+        The calling fetch thread blocks on the result, so other threads keep
+        downloading while CPU-bound parsing runs on other cores.
+        
+        Args:
+            document: Raw feed bytes
+            response_headers: HTTP response headers
+            source: Source configuration dictionary
+            known_hashes: Entry hashes from the seen-entry index
+            
+        Returns:
+            Result of parse_feed_document
+        """
+        if self.parse_workers > 0:
+            try:
+                pool = self._get_parse_pool()
+                return pool.submit(parse_feed_document, document, response_headers, source, known_hashes).result()
+            except BrokenProcessPool as e:
+                logger.error(f"Feed parsing pool failed, parsing {source['name']} in-process: {e}")
+                with self._host_lock:
+                    self._parse_pool = None
+                
+        return parse_feed_document(document, response_headers, source, known_hashes)
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool used for feed parsing, creating it on first use."""
+        with self._host_lock:
+            if self._parse_pool is None:
+                # spawn avoids forking a parent that holds threads and SQLite connections
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._parse_pool
+
+    def close(self):
+        """Shut down background refresh threads and the feed parsing pool, then close the article store."""
+        with self._host_lock:
+            refresh_executor, self._refresh_executor = self._refresh_executor, None
+            parse_pool, self._parse_pool = self._parse_pool, None
+            
+        if refresh_executor:
+            refresh_executor.shutdown(wait=True)
+        if parse_pool:
+            parse_pool.shutdown(wait=True)
+        self.store.close()
+
+    def _fetch_news_api(self, source: Dict[str, Any]) -> List[Article]:
         """
         Fetch articles from NewsAPI.
         
@@ -253,15 +770,10 @@ class NewsFetcher:
             logger.error("News API key not configured")
             return []
         
-        cache_file = self._get_cache_file(source)
-        
-        # Check if cached data is available and recent
-        cached_data = self._check_cache(cache_file)
-        if cached_data:
-            return cached_data
+        source_key = self._get_source_key(source)
         
         try:
-            url = "https://newsapi.org/v2/top-headlines"
+            url = source.get("api_url", NEWS_API_URL)
             
             # Prepare query parameters
             params = {
@@ -279,47 +791,42 @@ class NewsFetcher:
             if "sources" in source:
                 params["sources"] = source["sources"]
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             
             if response.status_code == 200:
                 data = response.json()
                 articles = []
                 
                 for article_data in data.get("articles", []):
-                    # Parse the publication date
-                    published_datetime = None
-                    if article_data.get("publishedAt"):
-                        try:
-                            published_datetime = datetime.fromisoformat(article_data["publishedAt"].replace("Z", "+00:00"))
-                        except:
-                            published_datetime = datetime.now()
-                    
-                    article = {
-                        "title": article_data.get("title", ""),
-                        "url": article_data.get("url", ""),
-                        "source": article_data.get("source", {}).get("name", source["name"]),
-                        "category": source.get("category", "general"),
-                        "published": article_data.get("publishedAt", ""),
-                        "published_datetime": published_datetime,
-                        "summary": article_data.get("description", ""),
-                        "content": article_data.get("content", "")
-                    }
+                    article = Article(
+                        title=article_data.get("title") or "",
+                        url=article_data.get("url") or "",
+                        source=(article_data.get("source") or {}).get("name") or source["name"],
+                        category=source.get("category", "general"),
+                        published=article_data.get("publishedAt") or "",
+                        published_ts=parse_published(article_data.get("publishedAt"), default=time.time()),
+                        summary=article_data.get("description") or "",
+                        content=article_data.get("content") or ""
+                    )
                     
                     articles.append(article)
                 
                 # Cache the results
-                self._cache_results(cache_file, articles)
+                self._cache_results(source_key, articles)
+                self._schedule_next_poll(source, source_key, articles, response.headers)
                 
                 return articles
             else:
                 logger.error(f"News API error: {response.status_code} - {response.text}")
+                self._record_failure(source_key, f"HTTP {response.status_code}")
                 return []
                 
         except Exception as e:
             logger.error(f"Error fetching from News API: {e}")
+            self._record_failure(source_key, str(e))
             return []
 
-    def _fetch_web_scrape(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _fetch_web_scrape(self, source: Dict[str, Any]) -> List[Article]:
         """
         Fetch articles by web scraping.
         
@@ -331,21 +838,24 @@ class NewsFetcher:
         """
         # This is a simplified implementation
         # For production use, you'd want to implement specific scrapers for each site
-        cache_file = self._get_cache_file(source)
+        source_key = self._get_source_key(source)
         
-        # Check if cached data is available and recent
-        cached_data = self._check_cache(cache_file)
-        if cached_data:
-            return cached_data
-            
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(source["url"], headers=headers)
+            # Send conditional request headers if we have validators from a previous fetch
+            headers.update(self._conditional_headers(self._load_validators(source_key)))
             
-            if response.status_code == 200:
+            response = self.http.get(source["url"], headers=headers)
+            
+            if response.status_code == 304:
+                logger.info(f"Page {source['url']} not modified; reusing cached articles")
+                articles = self._refresh_cache(source_key)
+                self._schedule_next_poll(source, source_key, articles, response.headers)
+                return articles
+            elif response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
                 # This is a very simplified scraping approach
@@ -374,95 +884,221 @@ class NewsFetcher:
                         if summary_element:
                             summary = summary_element.get_text().strip()
                         
-                        article = {
-                            "title": title,
-                            "url": link,
-                            "source": source["name"],
-                            "category": source.get("category", "general"),
-                            "published": "",  # Often difficult to extract consistently
-                            "published_datetime": datetime.now(),  # Default to current time
-                            "summary": summary,
-                            "content": summary
-                        }
+                        article = Article(
+                            title=title,
+                            url=link,
+                            source=source["name"],
+                            category=source.get("category", "general"),
+                            published="",  # Often difficult to extract consistently
+                            published_ts=time.time(),  # Default to current time
+                            summary=summary,
+                            content=summary
+                        )
                         
                         articles.append(article)
                 
                 # Cache the results
-                self._cache_results(cache_file, articles)
+                self._cache_results(source_key, articles)
+                self._save_validators(source_key, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                self._schedule_next_poll(source, source_key, articles, response.headers)
                 
                 return articles
             else:
                 logger.error(f"Error scraping {source['url']}: HTTP {response.status_code}")
+                self._record_failure(source_key, f"HTTP {response.status_code}")
                 return []
                 
         except Exception as e:
             logger.error(f"Error scraping {source['url']}: {e}")
+            self._record_failure(source_key, str(e))
             return []
 
-    def _get_cache_file(self, source: Dict[str, Any]) -> str:
-        """Get the cache file path for a source."""
+    def _import_legacy_cache(self):
+        """
+        Import the per-source JSON cache files of earlier versions into the article store.
+        
+        A file is imported only while its source has no fetch recorded in the
+        store, so this runs once per source. The files are left in place and
+        their modification time becomes the fetch time, as the JSON cache used it.
+        """
+        for source in self.sources:
+            legacy_file = os.path.join(self.cache_dir, f"{source['name'].lower().replace(' ', '_')}.json")
+            if not os.path.exists(legacy_file):
+                continue
+            
+            source_key = self._get_source_key(source)
+            try:
+                if self.store.get_fetched_at(source_key) is not None:
+                    continue
+                
+                fetched_at = os.path.getmtime(legacy_file)
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                articles = [Article.from_dict(article, default_ts=fetched_at) for article in data]
+                self.store.save_source_articles(source_key, articles, fetched_at=fetched_at)
+                logger.info(f"Imported {len(articles)} articles for {source['name']} from {legacy_file}")
+            except Exception as e:
+                logger.error(f"Error importing cache file {legacy_file}: {e}")
+
+    def _get_source_key(self, source: Dict[str, Any]) -> str:
+        """
+        Get the unique store key for a source.
+        
+        The URL hash keeps two sources that share a display name from
+        overwriting each other's cached articles.
+        """
         source_name = source["name"].lower().replace(" ", "_")
-        return os.path.join(self.cache_dir, f"{source_name}.json")
+        url_hash = hashlib.sha1(source.get("url", "").encode("utf-8")).hexdigest()[:8]
+        return f"{source_name}_{url_hash}"
 
-    def _check_cache(self, cache_file: str) -> List[Dict[str, Any]]:
+    def _check_cache(self, source_key: str, cache_expiry: Optional[float] = None) -> List[Article]:
         """
-        Check if cache file exists and is recent enough.
+        Check if a source has cached articles that are recent enough.
         
         Args:
-            cache_file: Path to the cache file
+            source_key: Unique store key of the source
+            cache_expiry: Maximum cache age in seconds (defaults to cache_expiry)
             
         Returns:
             List of cached articles or empty list if cache is invalid
         """
-        if not os.path.exists(cache_file):
+        fetched_at = self.store.get_fetched_at(source_key)
+        if fetched_at is None:
             return []
             
         # Check if cache is still valid
-        cache_time = os.path.getmtime(cache_file)
         now = datetime.now().timestamp()
+        if cache_expiry is None:
+            cache_expiry = self.cache_expiry
         
-        if now - cache_time > self.cache_expiry:
+        if now - fetched_at > cache_expiry:
             return []  # Cache expired
             
-        try:
-            # Load cache
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Convert string dates back to datetime objects
-            for article in data:
-                if "published_datetime" in article and isinstance(article["published_datetime"], str):
-                    try:
-                        article["published_datetime"] = datetime.fromisoformat(article["published_datetime"])
-                    except:
-                        article["published_datetime"] = datetime.now()
-                
-            return data
+        return self._read_cache(source_key)
+
+    def _read_cache(self, source_key: str) -> List[Article]:
+        """
+        Read a source's cached articles regardless of their age.
+        
+        Args:
+            source_key: Unique store key of the source
             
+        Returns:
+            List of cached articles or empty list if the cache can't be read
+        """
+        try:
+            return self.store.get_source_articles(source_key)
         except Exception as e:
-            logger.error(f"Error reading cache file {cache_file}: {e}")
+            logger.error(f"Error reading cached articles for {source_key}: {e}")
             return []
 
-    def _cache_results(self, cache_file: str, articles: List[Dict[str, Any]]):
+    def _refresh_cache(self, source_key: str) -> List[Article]:
         """
-        Cache the results to a file.
+        Mark a source's cached articles as fresh after a 304 response and return them.
         
         Args:
-            cache_file: Path to the cache file
-            articles: List of articles to cache
+            source_key: Unique store key of the source
+            
+        Returns:
+            List of cached articles
         """
         try:
-            # Convert datetime objects to ISO format strings for JSON serialization
-            for article in articles:
-                if "published_datetime" in article and isinstance(article["published_datetime"], datetime):
-                    article["published_datetime"] = article["published_datetime"].isoformat()
+            self.store.touch_source(source_key)
+        except Exception as e:
+            logger.error(f"Error refreshing cached articles for {source_key}: {e}")
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, indent=2)
-                
+        return self._read_cache(source_key)
+
+    def _conditional_headers(self, validators: Dict[str, str]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from stored validators."""
+        headers = {}
+        if validators.get("etag"):
+            headers['If-None-Match'] = validators["etag"]
+        if validators.get("last_modified"):
+            headers['If-Modified-Since'] = validators["last_modified"]
+        return headers
+
+    def _load_validators(self, source_key: str) -> Dict[str, str]:
+        """
+        Load the ETag and Last-Modified values saved for a source.
+        
+        Args:
+            source_key: Unique store key of the source
+            
+        Returns:
+            Dictionary with optional "etag" and "last_modified" keys
+        """
+        try:
+            return self.store.get_validators(source_key)
         except Exception as e:
-            logger.error(f"Error caching results to {cache_file}: {e}")
+            logger.error(f"Error reading validators for {source_key}: {e}")
+            return {}
 
+    def _save_validators(self, source_key: str, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Save the ETag and Last-Modified values returned for a source.
+        
+        Args:
+            source_key: Unique store key of the source
+            etag: ETag header value, if any
+            last_modified: Last-Modified header value, if any
+        """
+        try:
+            self.store.set_validators(source_key, etag, last_modified)
+        except Exception as e:
+            logger.error(f"Error saving validators for {source_key}: {e}")
+
+    def _load_entry_index(self, source_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the seen-entry index for a source.
+        
+        Args:
+            source_key: Unique store key of the source
+            
+        Returns:
+            Mapping of entry GUID/link to {"hash": ..., "article": ...}
+        """
+        try:
+            return self.store.get_entry_index(source_key)
+        except Exception as e:
+            logger.error(f"Error reading entry index for {source_key}: {e}")
+            return {}
+
+    def _save_entry_index(self, source_key: str, entry_index: Dict[str, Dict[str, Any]]):
+        """
+        Save the seen-entry index for a source.
+        
+        Args:
+            source_key: Unique store key of the source
+            entry_index: Mapping of entry GUID/link to hash and normalized article
+        """
+        try:
+            self.store.save_entry_index(source_key, entry_index)
+        except Exception as e:
+            logger.error(f"Error saving entry index for {source_key}: {e}")
+
+    def _serialize_article(self, article: Article) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of an article."""
+        return article.to_dict()
+
+    def _deserialize_article(self, article: Dict[str, Any]) -> Article:
+        """Rebuild an article from its serialized form."""
+        return Article.from_dict(article)
+
+    def _cache_results(self, source_key: str, articles: List[Article]):
+        """
+        Cache the results in the article store.
+        
+        Args:
+            source_key: Unique store key of the source
+            articles: List of articles to cache
+        """
+        try:
+            self.store.save_source_articles(source_key, articles)
+            self.store.clear_failure(source_key)
+        except Exception as e:
+            logger.error(f"Error caching results for {source_key}: {e}")
 
 if __name__ == "__main__":
     # Configure logging for standalone testing
@@ -480,7 +1116,7 @@ if __name__ == "__main__":
     # Display the first few articles
     for i, article in enumerate(articles[:5]):
         print(f"\nArticle {i+1}:")
-        print(f"Title: {article['title']}")
-        print(f"Source: {article['source']}")
-        print(f"URL: {article['url']}")
-        print(f"Published: {article['published']}")
+        print(f"Title: {article.title}")
+        print(f"Source: {article.source}")
+        print(f"URL: {article.url}")
+        print(f"Published: {article.published}")
@@ -3,22 +3,150 @@ News Processor - A module for processing and analyzing news data.
 Performs topic extraction, sentiment analysis, and content summarization.
 """
 import os
+import time
 import logging
 import json
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+import hashlib
+import multiprocessing
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Union, FrozenSet
+from datetime import datetime, timedelta
 import re
+import numpy as np
 from collections import Counter, defaultdict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
-from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-import nltk
 from pathlib import Path
 
+from . import nltk_resources
+from .nltk_resources import sent_tokenize
+from .text_utils import TermMatcher, tokenize
+from .article import Article
+from .article_store import ArticleStore
+from .near_duplicates import NearDuplicateIndex
+from .topic_history import TopicHistory
+from .topic_output import save_topics
+from .topic_scoring import score_topics, sentiment_label, DEFAULT_RELEVANCE_WEIGHTS, SENTIMENT_COLUMNS
+
 logger = logging.getLogger("TEC.NewsProcessor")
 
+# Sentiment scores (compound, positive, negative, neutral) used when VADER is unavailable
+NEUTRAL_SENTIMENT = (0.0, 0.0, 0.0, 1.0)
+
+
+def enrich_topic(dominant_terms: List[str], articles: List[Article], analyses: List[Dict[str, Any]],
+                 newest_article: Optional[Article], stop_words: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Build the suggested title, keywords and summary of a topic.
+    
+    Module-level so it can run in a worker process; it only reads the
+    article analyses it is given and never tokenizes text itself.
+    
+    Args:
+        dominant_terms: The topic's most significant terms
+        articles: The topic's articles
+        analyses: Analysis of each article (title_tokens, sentences), aligned with articles
+        newest_article: The topic's most recent article
+        stop_words: Stop words excluded from keywords
+        
+    Returns:
+        Dictionary with "suggested_title", "keywords" and "summary"
+    """
+    return {
+        "suggested_title": _suggest_topic_title(dominant_terms, newest_article),
+        "keywords": _extract_keywords(dominant_terms, analyses, stop_words),
+        "summary": _create_topic_summary(dominant_terms, articles, analyses, newest_article)
+    }
+
+
+def _suggest_topic_title(dominant_terms: List[str], newest_article: Optional[Article]) -> str:
+    """Suggest a topic title from its newest article or its dominant terms."""
+    # Strategy 1: Use the title of the most recent article with some cleaning
+    most_recent_title = newest_article.title if newest_article else ""
+    
+    # Clean the title - remove source markers like "- TechCrunch" at the end
+    cleaned_title = re.sub(r'\s+[-–|]\s+\w+(\s+\w+)?$', '', most_recent_title)
+    
+    # If we have a reasonable title, use it
+    if cleaned_title and len(cleaned_title) > 15 and len(cleaned_title) < 100:
+        return cleaned_title
+        
+    # Strategy 2: Combine dominant terms
+    if dominant_terms:
+        terms = dominant_terms[:4]  # Top 4 terms
+        return f"Trending in Tech: {', '.join(term.title() for term in terms)}"
+        
+    # Fallback
+    return "Latest Technology Trends and Developments"
+
+
+def _extract_keywords(dominant_terms: List[str], analyses: List[Dict[str, Any]], stop_words: FrozenSet[str]) -> List[str]:
+    """Extract up to 15 keywords from dominant terms and capitalized title words."""
+    # Start with dominant terms, dropping case-insensitive repeats
+    keywords = []
+    lowercase_keywords = set()
+    for term in dominant_terms[:10]:  # Top 10 terms
+        if term.lower() not in lowercase_keywords:
+            keywords.append(term)
+            lowercase_keywords.add(term.lower())
+    
+    # Extract entities from article titles
+    title_words = [word for analysis in analyses for word in analysis["title_tokens"]]
+    
+    # Simple approach: extract capitalized words that aren't at the beginning of sentences
+    for i, word in enumerate(title_words):
+        if len(keywords) >= 15:
+            break
+        lower_word = word.lower()
+        if (word[0].isupper() and len(word) > 1 and 
+            (i == 0 or title_words[i-1] not in ['.', '!', '?']) and
+            lower_word not in stop_words and lower_word not in lowercase_keywords):
+            keywords.append(word)
+            lowercase_keywords.add(lower_word)
+    
+    return keywords
+
+
+def _create_topic_summary(dominant_terms: List[str], articles: List[Article], analyses: List[Dict[str, Any]],
+                          newest_article: Optional[Article]) -> str:
+    """Summarize a topic with its sentences that mention the most dominant terms."""
+    # Collect titles and summary sentences, keeping the first occurrence of each
+    all_sentences = []
+    for article, analysis in zip(articles, analyses):
+        if article.title:
+            all_sentences.append(article.title)
+        if article.summary:
+            all_sentences.extend(analysis["sentences"])
+    all_sentences = list(dict.fromkeys(all_sentences))
+    
+    # Calculate a rough "importance" score for each sentence:
+    # dominant terms it mentions plus a bonus for shorter sentences
+    term_matcher = TermMatcher(dominant_terms)
+    sentence_importance = {}
+    for sentence in all_sentences:
+        term_count = term_matcher.count(sentence)
+        sentence_importance[sentence] = term_count + (1 / (len(sentence.split()) + 10))  # +10 to avoid division by zero
+    
+    # Take top 3-5 sentences, depending on their length
+    total_length = 0
+    selected_sentences = []
+    
+    for sentence in sorted(all_sentences, key=sentence_importance.get, reverse=True):
+        if total_length > 500 or len(selected_sentences) >= 5:
+            break
+        selected_sentences.append(sentence)
+        total_length += len(sentence)
+    
+    # Join the selected sentences
+    summary = " ".join(selected_sentences)
+    
+    # If summary is too short, use the top article's summary directly
+    if len(summary) < 100 and newest_article is not None:
+        summary = newest_article.summary or summary
+    
+    return summary
+
+
 class NewsProcessor:
     """
     Handles processing and analysis of news data.
@@ -32,18 +160,44 @@ class NewsProcessor:
         Args:
             config_path: Path to configuration file or directory
         """
-        # Download required NLTK data if not already present
-        self._ensure_nltk_resources()
-        
-        self.stop_words = set(stopwords.words('english'))
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        # NLTK data and models are loaded on first use, not at startup
+        self._stop_words = None
+        self._sentiment_analyzer = None
+        self._sentiment_unavailable = False  # Set when the VADER lexicon is missing
         
         # Default configuration
         self.min_articles_per_topic = 3
         self.max_articles_per_topic = 15
         self.min_topic_relevance = 0.5
+        self.relevance_weights = dict(DEFAULT_RELEVANCE_WEIGHTS)  # Weights of count, sentiment, recency and diversity
         self.max_topics = 10
         self.output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'processed_news')
+        self.output_format = "jsonl"  # "jsonl" stores each article once; "json" is the original indented format
+        self.compress_output = True  # gzip the JSON Lines output
+        self.article_store_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'news_cache', 'articles.db')
+        self._article_store = None
+        self.processing_store_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'news_processing', 'processor.db')
+        self._processing_store = None
+        self.near_duplicate_detection = True  # Drop syndicated copies with MinHash/LSH
+        self.near_duplicate_threshold = 0.7  # Minimum estimated Jaccard similarity of a copy
+        self.near_duplicate_retention_days = 7  # How long signatures are kept across runs
+        self._near_duplicates = None
+        self.topic_history = True  # Match topics to earlier runs to track their age and velocity
+        self.topic_match_threshold = 0.5  # Minimum centroid cosine similarity to continue a topic
+        self.topic_history_retention_days = 30  # Forget topics not seen for this long
+        self._topic_history = None
+        self.incremental_topics = False  # Update a persisted MiniBatchKMeans model instead of refitting
+        self.topic_clusters = 10  # Number of clusters in the incremental topic model
+        self.topic_model_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'topic_model', 'topic_model.joblib')
+        self._topic_model = None
+        self.analysis_cache = True  # Reuse sentiment and tokenization of unchanged articles
+        self.analysis_cache_retention_days = 30  # Drop cached analyses unused for this long
+        self._analyses = {}
+        self._analysis_cache_pruned = False
+        self.enrichment_workers = 0  # Worker processes for topic titles, keywords and summaries (0 runs in-process)
+        self._enrichment_pool = None
+        self.nltk_data_dir = nltk_resources.DEFAULT_DATA_DIR  # Vendored NLTK data, searched first
+        self.nltk_auto_download = False  # Download missing NLTK data on first use
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
@@ -51,26 +205,27 @@ class NewsProcessor:
         # Load configuration if provided
         if config_path:
             self._load_config(config_path)
+        
+        nltk_resources.configure(self.nltk_data_dir, allow_download=self.nltk_auto_download)
 
-    def _ensure_nltk_resources(self):
-        """Ensure required NLTK resources are downloaded."""
-        try:
-            resources = [
-                'punkt', 
-                'stopwords', 
-                'vader_lexicon'
-            ]
-            
-            for resource in resources:
-                try:
-                    nltk.data.find(f'tokenizers/{resource}')
-                except LookupError:
-                    logger.info(f"Downloading NLTK resource: {resource}")
-                    nltk.download(resource, quiet=True)
-                    
-        except Exception as e:
-            logger.error(f"Error ensuring NLTK resources: {e}")
-            logger.warning("Some features may not work correctly without NLTK resources")
+    @property
+    def stop_words(self) -> frozenset:
+        """English stop words, loaded on first use."""
+        if self._stop_words is None:
+            self._stop_words = nltk_resources.stop_words()
+        return self._stop_words
+
+    @property
+    def sentiment_analyzer(self):
+        """VADER sentiment analyzer, loaded on first use."""
+        if self._sentiment_analyzer is None:
+            self._sentiment_analyzer = nltk_resources.sentiment_analyzer()
+        return self._sentiment_analyzer
+
+    @sentiment_analyzer.setter
+    def sentiment_analyzer(self, analyzer):
+        self._sentiment_analyzer = analyzer
+        self._sentiment_unavailable = False
 
     def _load_config(self, config_path: str):
         """Load news processor configuration from file."""
@@ -86,7 +241,27 @@ class NewsProcessor:
                 self.min_articles_per_topic = config.get('min_articles_per_topic', self.min_articles_per_topic)
                 self.max_articles_per_topic = config.get('max_articles_per_topic', self.max_articles_per_topic)
                 self.min_topic_relevance = config.get('min_topic_relevance', self.min_topic_relevance)
+                self.relevance_weights.update(config.get('relevance_weights', {}))
                 self.max_topics = config.get('max_topics', self.max_topics)
+                self.output_format = config.get('output_format', self.output_format)
+                self.compress_output = config.get('compress_output', self.compress_output)
+                
+                self.article_store_path = config.get('article_store', self.article_store_path)
+                self.processing_store_path = config.get('processing_store', self.processing_store_path)
+                self.near_duplicate_detection = config.get('near_duplicate_detection', self.near_duplicate_detection)
+                self.near_duplicate_threshold = config.get('near_duplicate_threshold', self.near_duplicate_threshold)
+                self.near_duplicate_retention_days = config.get('near_duplicate_retention_days', self.near_duplicate_retention_days)
+                self.topic_history = config.get('topic_history', self.topic_history)
+                self.topic_match_threshold = config.get('topic_match_threshold', self.topic_match_threshold)
+                self.topic_history_retention_days = config.get('topic_history_retention_days', self.topic_history_retention_days)
+                self.incremental_topics = config.get('incremental_topics', self.incremental_topics)
+                self.topic_clusters = config.get('topic_clusters', self.topic_clusters)
+                self.topic_model_path = config.get('topic_model', self.topic_model_path)
+                self.analysis_cache = config.get('analysis_cache', self.analysis_cache)
+                self.analysis_cache_retention_days = config.get('analysis_cache_retention_days', self.analysis_cache_retention_days)
+                self.enrichment_workers = config.get('enrichment_workers', self.enrichment_workers)
+                self.nltk_data_dir = config.get('nltk_data_dir', self.nltk_data_dir)
+                self.nltk_auto_download = config.get('nltk_auto_download', self.nltk_auto_download)
                 
                 if 'output_dir' in config:
                     self.output_dir = config['output_dir']
@@ -100,82 +275,182 @@ class NewsProcessor:
             logger.error(f"Error loading news processor configuration: {e}")
             logger.info("Using default configuration")
 
-    def process_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_articles(self, articles: Iterable[Union[Article, Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """
-        Process a list of news articles to extract topics and insights.
+        Process news articles to extract topics and insights.
         
         Args:
-            articles: List of news articles
+            articles: List of news articles, or a stream such as
+                NewsFetcher.iter_articles(); dictionaries are converted to Article
             
         Returns:
             List of topic clusters with associated articles and analysis
         """
-        if not articles:
+        # Remove duplicate articles (consumes streams incrementally)
+        unique_articles = self._remove_duplicates(articles)
+        
+        if not unique_articles:
             logger.warning("No articles provided for processing")
             return []
             
-        logger.info(f"Processing {len(articles)} articles")
-        
-        # Remove duplicate articles
-        unique_articles = self._remove_duplicates(articles)
         logger.info(f"Found {len(unique_articles)} unique articles after deduplication")
         
+        # Analyze sentiment and tokenize each article once, reusing cached results
+        self._analyze_articles(unique_articles)
+        
         # Extract text for topic modeling
         texts = []
         for article in unique_articles:
             # Combine title and content for better topic modeling
-            text = f"{article['title']} {article.get('summary', '')}"
+            text = f"{article.title} {article.summary}"
             texts.append(text)
         
         # Calculate topics using TF-IDF and clustering
         topics = self._extract_topics(texts, unique_articles)
         logger.info(f"Extracted {len(topics)} topic clusters")
         
-        # Analyze sentiment and relevance for each topic
-        for topic in topics:
-            # Sentiment analysis
-            topic_sentiment = self._analyze_topic_sentiment(topic)
-            topic["sentiment"] = topic_sentiment
-            
-            # Overall relevance score
-            topic["relevance_score"] = self._calculate_relevance(topic)
-            
-            # Generate a title for the topic
-            topic["suggested_title"] = self._suggest_topic_title(topic)
-            
-            # Tag the topic with relevant keywords
-            topic["keywords"] = self._extract_keywords(topic)
-            
-            # Create a topic summary
-            topic["summary"] = self._create_topic_summary(topic)
+        # Score sentiment and relevance for all topics at once
+        newest_articles = self._score_topics(topics)
+        
+        # Match topics to earlier runs for their age and trend velocity
+        self._track_topics(topics)
         
         # Filter and sort topics by relevance
-        relevant_topics = [t for t in topics if t["relevance_score"] >= self.min_topic_relevance]
-        relevant_topics.sort(key=lambda x: x["relevance_score"], reverse=True)
+        relevant_topics = [(t, n) for t, n in zip(topics, newest_articles) if t["relevance_score"] >= self.min_topic_relevance]
+        relevant_topics.sort(key=lambda x: x[0]["relevance_score"], reverse=True)
         
         # Limit to maximum number of topics
-        top_topics = relevant_topics[:self.max_topics]
+        relevant_topics = relevant_topics[:self.max_topics]
+        top_topics = [topic for topic, _ in relevant_topics]
+        
+        # Add titles, keywords and summaries to the topics that are kept
+        self._enrich_topics(top_topics, [newest for _, newest in relevant_topics])
         
         # Save processed topics
         self._save_processed_topics(top_topics)
         
         return top_topics
 
-    def _remove_duplicates(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_stored_articles(self, max_age_days: int = 1, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Process recent articles straight from the article store written by NewsFetcher.
+        
+        Args:
+            max_age_days: Maximum age of articles in days
+            category: Only process articles in this category
+            
+        Returns:
+            List of topic clusters with associated articles and analysis
+        """
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        articles = self._get_article_store().query_articles(since=cutoff_date, category=category)
+        
+        return self.process_articles(articles)
+
+    def _get_article_store(self) -> ArticleStore:
+        """Get the article store written by NewsFetcher, opening it on first use."""
+        if self._article_store is None:
+            self._article_store = ArticleStore(self.article_store_path)
+        return self._article_store
+
+    def _get_processing_store(self) -> ArticleStore:
+        """
+        Get the store of near-duplicate signatures, article analyses and topic
+        history, opening it on first use.
+        
+        It is a separate database from the fetcher's article store, so the
+        processor never writes to the fetch cache.
+        """
+        if self._processing_store is None:
+            self._processing_store = ArticleStore(self.processing_store_path)
+        return self._processing_store
+
+    def _get_near_duplicate_index(self) -> Optional[NearDuplicateIndex]:
+        """
+        Get the near-duplicate index, loading recent signatures on first use.
+        
+        Returns:
+            The index, or None if near-duplicate detection is disabled or unavailable
+        """
+        if not self.near_duplicate_detection:
+            return None
+            
+        if self._near_duplicates is None:
+            index = NearDuplicateIndex(threshold=self.near_duplicate_threshold)
+            try:
+                store = self._get_processing_store()
+                cutoff_date = datetime.now() - timedelta(days=self.near_duplicate_retention_days)
+                store.prune_signatures(cutoff_date)
+                loaded = index.load(store, since=cutoff_date)
+                logger.info(f"Loaded {loaded} near-duplicate signatures")
+            except Exception as e:
+                logger.error(f"Error loading near-duplicate signatures: {e}")
+            self._near_duplicates = index
+            
+        return self._near_duplicates
+
+    def _get_topic_history(self) -> Optional[TopicHistory]:
         """
-        Remove duplicate articles based on URL and title similarity.
+        Get the topic history, loading recently seen topics on first use.
+        
+        Returns:
+            The history, or None if topic tracking is disabled
+        """
+        if not self.topic_history:
+            return None
+            
+        if self._topic_history is None:
+            history = TopicHistory(match_threshold=self.topic_match_threshold, stop_words=self.stop_words)
+            try:
+                store = self._get_processing_store()
+                cutoff_date = datetime.now() - timedelta(days=self.topic_history_retention_days)
+                store.prune_topics(cutoff_date)
+                loaded = history.load(store, since=cutoff_date)
+                logger.info(f"Loaded {loaded} tracked topics")
+            except Exception as e:
+                logger.error(f"Error loading topic history: {e}")
+            self._topic_history = history
+            
+        return self._topic_history
+
+    def _track_topics(self, topics: List[Dict[str, Any]]):
+        """
+        Match topics to the topic history, setting their age and velocity, and save it.
+        
+        Args:
+            topics: Scored topic dictionaries
+        """
+        history = self._get_topic_history()
+        if history is None:
+            return
+            
+        try:
+            history.observe(topics)
+            history.save(self._get_processing_store())
+        except Exception as e:
+            logger.error(f"Error tracking topic history: {e}")
+
+    def _remove_duplicates(self, articles: Iterable[Union[Article, Dict[str, Any]]]) -> List[Article]:
+        """
+        Remove duplicate articles based on URL and near-duplicate text.
+        
+        Articles whose title and summary closely match an article seen earlier
+        in this run, or in a recent run, are treated as syndicated copies.
         
         Args:
-            articles: List of articles
+            articles: List or stream of articles
             
         Returns:
             List of unique articles
         """
         unique_urls = set()
         unique_articles = []
+        near_duplicates = self._get_near_duplicate_index()
+        copies = 0
         
         for article in articles:
-            url = article.get('url', '')
+            article = Article.coerce(article)
+            url = article.url
             
             # Skip articles with no URL
             if not url:
@@ -186,17 +461,36 @@ class NewsProcessor:
                 continue
                 
             unique_urls.add(url)
+            
+            # Skip syndicated copies of an already indexed story
+            if near_duplicates is not None:
+                text = f"{article.title} {article.summary}"
+                duplicate_of = near_duplicates.find_duplicate(url, text)
+                if duplicate_of:
+                    logger.debug(f"Skipping {url}: near-duplicate of {duplicate_of}")
+                    copies += 1
+                    continue
+            
             unique_articles.append(article)
         
+        if copies:
+            logger.info(f"Removed {copies} near-duplicate articles")
+        
+        if near_duplicates is not None:
+            try:
+                near_duplicates.save(self._get_processing_store())
+            except Exception as e:
+                logger.error(f"Error saving near-duplicate signatures: {e}")
+        
         return unique_articles
 
-    def _extract_topics(self, texts: List[str], articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _extract_topics(self, texts: List[str], articles: List[Article]) -> List[Dict[str, Any]]:
         """
         Extract topics from a collection of texts using TF-IDF and K-means clustering.
         
         Args:
             texts: List of article texts
-            articles: Original article dictionaries
+            articles: Original articles
             
         Returns:
             List of topic dictionaries with clustered articles
@@ -204,7 +498,14 @@ class NewsProcessor:
         if not texts:
             return []
             
+        if self.incremental_topics:
+            return self._extract_topics_incremental(texts, articles)
+            
         try:
+            # scikit-learn is only imported once topics are actually extracted
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            from sklearn.cluster import KMeans
+            
             # Determine number of clusters
             n_clusters = min(max(3, len(texts) // 5), 10)  # Aim for 3-10 clusters based on volume
             
@@ -258,18 +559,74 @@ class NewsProcessor:
                 }
                 topics.append(topic)
             
-            # Filter out topics with too few or too many articles
-            filtered_topics = []
-            for topic in topics:
-                if self.min_articles_per_topic <= topic["article_count"] <= self.max_articles_per_topic:
-                    filtered_topics.append(topic)
-                    
-            return filtered_topics
+            return self._filter_topic_sizes(topics)
             
         except Exception as e:
             logger.error(f"Error extracting topics: {e}")
             return []
 
+    def _extract_topics_incremental(self, texts: List[str], articles: List[Article]) -> List[Dict[str, Any]]:
+        """
+        Extract topics with the persisted incremental topic model.
+        
+        Only articles the model has not seen are fitted; all articles are then
+        assigned to the existing clusters, whose ids stay stable across runs.
+        
+        Args:
+            texts: List of article texts
+            articles: Original articles
+            
+        Returns:
+            List of topic dictionaries with clustered articles
+        """
+        try:
+            if self._topic_model is None:
+                from .topic_model import IncrementalTopicModel
+                self._topic_model = IncrementalTopicModel(self.topic_model_path, n_clusters=self.topic_clusters)
+            model = self._topic_model
+            
+            updated = model.update(texts, [article.url for article in articles])
+            if not model.is_fitted:
+                # Too few articles to initialize the clusters yet
+                return [{
+                    "id": 0,
+                    "articles": articles,
+                    "article_count": len(articles),
+                    "dominant_terms": self._extract_terms_from_texts(texts)
+                }]
+            
+            if updated:
+                model.save()
+                logger.info(f"Updated topic model with {updated} new articles")
+            
+            cluster_articles = defaultdict(list)
+            for article, cluster_id in zip(articles, model.assign(texts)):
+                cluster_articles[int(cluster_id)].append(article)
+            
+            topics = []
+            for cluster_id in sorted(cluster_articles):
+                topics.append({
+                    "id": cluster_id,
+                    "articles": cluster_articles[cluster_id],
+                    "article_count": len(cluster_articles[cluster_id]),
+                    "dominant_terms": model.top_terms(cluster_id)
+                })
+            
+            return self._filter_topic_sizes(topics)
+            
+        except Exception as e:
+            logger.error(f"Error extracting topics incrementally: {e}")
+            return []
+
+    def _filter_topic_sizes(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter out topics with too few or too many articles."""
+        filtered_topics = []
+        for topic in topics:
+            if self.min_articles_per_topic <= topic["article_count"] <= self.max_articles_per_topic:
+                filtered_topics.append(topic)
+                
+        return filtered_topics
+
     def _extract_terms_from_texts(self, texts: List[str]) -> List[str]:
         """Extract key terms from a list of texts without using vectorizer."""
         if not texts:
@@ -279,7 +636,7 @@ class NewsProcessor:
         all_text = " ".join(texts)
         
         # Tokenize and remove stopwords
-        words = word_tokenize(all_text.lower())
+        words = tokenize(all_text.lower())
         words = [w for w in words if w.isalpha() and w not in self.stop_words and len(w) > 2]
         
         # Count word frequencies
@@ -288,299 +645,240 @@ class NewsProcessor:
         # Return the most common words
         return [word for word, count in word_counts.most_common(20)]
 
-    def _analyze_topic_sentiment(self, topic: Dict[str, Any]) -> Dict[str, float]:
+    def _score_topics(self, topics: List[Dict[str, Any]]) -> List[Optional[Article]]:
         """
-        Analyze the overall sentiment of articles in a topic.
+        Set the sentiment and relevance score of every topic.
+        
+        Per-article values are gathered into arrays once and reduced per topic
+        with topic_scoring.score_topics. Relevance combines article count,
+        sentiment intensity, recency and source diversity, weighted by
+        relevance_weights.
         
         Args:
-            topic: Topic dictionary with articles
+            topics: Topic dictionaries with articles
             
         Returns:
-            Dictionary with sentiment scores
+            The newest article of each topic (None for empty topics)
         """
-        compound_scores = []
-        positive_scores = []
-        negative_scores = []
-        neutral_scores = []
+        articles = [article for topic in topics for article in topic["articles"]]
+        labels = np.repeat(np.arange(len(topics)), [len(topic["articles"]) for topic in topics])
+        
+        sentiment = np.array(
+            [self._article_sentiment(article) for article in articles], dtype=np.float64
+        ).reshape(len(articles), len(SENTIMENT_COLUMNS))
+        published_ts = np.array([article.published_ts for article in articles], dtype=np.float64)
+        ages_days = (time.time() - published_ts) / 86400
+        
+        source_index = {}
+        source_ids = np.array([source_index.setdefault(article.source, len(source_index)) for article in articles], dtype=np.int64)
+        
+        scores = score_topics(
+            labels, len(topics), sentiment, ages_days, source_ids, published_ts,
+            max_articles_per_topic=self.max_articles_per_topic,
+            weights=self.relevance_weights
+        )
         
-        for article in topic["articles"]:
-            # Combine title and summary for sentiment analysis
-            text = f"{article['title']}. {article.get('summary', '')}"
+        newest_articles = []
+        for i, topic in enumerate(topics):
+            topic_sentiment = dict(zip(SENTIMENT_COLUMNS, scores["sentiment"][i].tolist()))
+            topic_sentiment["overall"] = sentiment_label(topic_sentiment["compound"])
+            topic["sentiment"] = topic_sentiment
+            topic["relevance_score"] = float(scores["relevance"][i])
             
-            sentiment = self.sentiment_analyzer.polarity_scores(text)
+            newest = scores["most_recent"][i]
+            newest_articles.append(articles[newest] if newest >= 0 else None)
             
-            compound_scores.append(sentiment["compound"])
-            positive_scores.append(sentiment["pos"])
-            negative_scores.append(sentiment["neg"])
-            neutral_scores.append(sentiment["neu"])
-        
-        # Calculate averages
-        avg_compound = sum(compound_scores) / len(compound_scores) if compound_scores else 0
-        avg_positive = sum(positive_scores) / len(positive_scores) if positive_scores else 0
-        avg_negative = sum(negative_scores) / len(negative_scores) if negative_scores else 0
-        avg_neutral = sum(neutral_scores) / len(neutral_scores) if neutral_scores else 0
-        
-        return {
-            "compound": avg_compound,
-            "positive": avg_positive,
-            "negative": avg_negative,
-            "neutral": avg_neutral,
-            "overall": "positive" if avg_compound > 0.05 else "negative" if avg_compound < -0.05 else "neutral"
-        }
+        return newest_articles
 
-    def _calculate_relevance(self, topic: Dict[str, Any]) -> float:
+    def _article_sentiment(self, article: Article) -> Tuple[float, float, float, float]:
         """
-        Calculate a relevance score for a topic based on several factors.
+        Get the sentiment of an article's title and summary.
         
-        Args:
-            topic: Topic dictionary
-            
         Returns:
-            Relevance score between 0 and 1
-        """
-        # Factors for relevance:
-        # 1. Number of articles (more is better, up to a point)
-        # 2. Sentiment intensity (stronger sentiment, either way, is more relevant)
-        # 3. Recency of articles
-        # 4. Diversity of sources
-        
-        # Factor 1: Number of articles
-        article_count = topic["article_count"]
-        count_score = min(article_count / self.max_articles_per_topic, 1.0)
-        
-        # Factor 2: Sentiment intensity
-        sentiment = topic["sentiment"]
-        sentiment_intensity = abs(sentiment["compound"])
-        
-        # Factor 3: Recency - average days old (0 = today, lower is better)
-        days_old_sum = 0
-        now = datetime.now()
-        for article in topic["articles"]:
-            pub_date = article.get("published_datetime", now)
-            
-            # Handle string datetime
-            if isinstance(pub_date, str):
-                try:
-                    pub_date = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                except ValueError:
-                    pub_date = now  # If conversion fails, use current time
-            
-            days_old = (now - pub_date).total_seconds() / 86400  # Convert to days
-            days_old_sum += days_old
-            
-        avg_days_old = days_old_sum / article_count if article_count > 0 else 7
-        recency_score = 1.0 - min(avg_days_old / 7, 1.0)  # 0-7 days old mapped to 1.0-0.0
-        
-        # Factor 4: Source diversity
-        sources = set()
-        for article in topic["articles"]:
-            sources.add(article.get("source", ""))
-            
-        source_count = len(sources)
-        diversity_score = min(source_count / 5, 1.0)  # Up to 5 different sources
-        
-        # Combined score with weights
-        weights = {
-            "count": 0.25,
-            "sentiment": 0.2,
-            "recency": 0.35,
-            "diversity": 0.2
-        }
-        
-        relevance_score = (
-            weights["count"] * count_score +
-            weights["sentiment"] * sentiment_intensity +
-            weights["recency"] * recency_score +
-            weights["diversity"] * diversity_score
-        )
-        
-        return relevance_score
+            (compound, positive, negative, neutral) VADER scores
+        """
+        return tuple(self._article_analysis(article)["sentiment"])
 
-    def _suggest_topic_title(self, topic: Dict[str, Any]) -> str:
+    def _analyze_articles(self, articles: List[Article]):
         """
-        Suggest a title for a topic based on its articles and dominant terms.
+        Analyze a batch of articles, loading unchanged ones from the analysis cache.
         
         Args:
-            topic: Topic dictionary
-              Returns:
-            Suggested title string
+            articles: Articles to analyze
         """
-        # Strategy 1: Use the title of the most recent article with some cleaning
-        most_recent_date = datetime.min
-        most_recent_title = ""
-        for article in topic["articles"]:
-            pub_date = article.get("published_datetime", datetime.min)
-            
-            # Handle string datetime
-            if isinstance(pub_date, str):
-                try:
-                    pub_date = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                except ValueError:
-                    pub_date = datetime.min  # If conversion fails, use min time
-            
-            if pub_date > most_recent_date:
-                most_recent_date = pub_date
-                most_recent_title = article.get("title", "")
-        
-        # Clean the title - remove source markers like "- TechCrunch" at the end
-        cleaned_title = re.sub(r'\s+[-–|]\s+\w+(\s+\w+)?$', '', most_recent_title)
-        
-        # If we have a reasonable title, use it
-        if cleaned_title and len(cleaned_title) > 15 and len(cleaned_title) < 100:
-            return cleaned_title
-            
-        # Strategy 2: Combine dominant terms
-        if topic["dominant_terms"]:
-            terms = topic["dominant_terms"][:4]  # Top 4 terms
-            return f"Trending in Tech: {', '.join(term.title() for term in terms)}"
-            
-        # Fallback
-        return "Latest Technology Trends and Developments"
+        self._analyses = {}
+        keys = list(dict.fromkeys(self._analysis_key(article) for article in articles))
+        store = None
+        
+        if self.analysis_cache:
+            try:
+                store = self._get_processing_store()
+                if not self._analysis_cache_pruned:
+                    store.prune_analyses(datetime.now() - timedelta(days=self.analysis_cache_retention_days))
+                    self._analysis_cache_pruned = True
+                self._analyses = store.get_analyses(keys)
+            except Exception as e:
+                logger.error(f"Error loading cached article analyses: {e}")
+                store = None
+        
+        new_analyses = {}
+        for article in articles:
+            key = self._analysis_key(article)
+            if key not in self._analyses:
+                self._analyses[key] = new_analyses[key] = self._analyze_text(article)
+        
+        logger.info(f"Analyzed {len(new_analyses)} articles ({len(keys) - len(new_analyses)} from cache)")
+        
+        # Neutral placeholders must not outlive a missing lexicon in the cache
+        if store is not None and new_analyses and not self._sentiment_unavailable:
+            try:
+                store.save_analyses(new_analyses)
+            except Exception as e:
+                logger.error(f"Error saving article analyses: {e}")
+
+    def _article_analysis(self, article: Article) -> Dict[str, Any]:
+        """Get the analysis of an article, analyzing it if it is not in this run's batch."""
+        key = self._analysis_key(article)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = self._analyses[key] = self._analyze_text(article)
+        return analysis
+
+    def _analysis_key(self, article: Article) -> str:
+        """Hash an article's title and summary to key its cached analysis."""
+        return hashlib.sha1(f"{article.title}\x1f{article.summary}".encode("utf-8")).hexdigest()
 
-    def _extract_keywords(self, topic: Dict[str, Any]) -> List[str]:
+    def _analyze_text(self, article: Article) -> Dict[str, Any]:
         """
-        Extract keywords for a topic.
+        Run sentiment analysis and tokenization on an article.
         
-        Args:
-            topic: Topic dictionary
-            
         Returns:
-            List of keyword strings
+            Dictionary with "sentiment" (compound, positive, negative, neutral),
+            "title_tokens" and "sentences" of the summary
         """
-        # Start with dominant terms
-        keywords = topic["dominant_terms"][:10]  # Top 10 terms
-        
-        # Extract entities from article titles
-        all_title_text = " ".join([a.get("title", "") for a in topic["articles"]])
-        
-        # Simple approach: extract capitalized words that aren't at the beginning of sentences
-        title_words = word_tokenize(all_title_text)
-        for i, word in enumerate(title_words):
-            if (word[0].isupper() and len(word) > 1 and 
-                (i == 0 or title_words[i-1] not in ['.', '!', '?']) and
-                word.lower() not in self.stop_words):
-                if word not in keywords and not any(word.lower() == k.lower() for k in keywords):
-                    keywords.append(word)
-        
-        # Filter out duplicates and lowercase versions of existing keywords
-        final_keywords = []
-        lowercase_keywords = set()
-        
-        for keyword in keywords:
-            if keyword.lower() not in lowercase_keywords:
-                final_keywords.append(keyword)
-                lowercase_keywords.add(keyword.lower())
-        
-        # Limit to top 15 keywords
-        return final_keywords[:15]
+        return {
+            "sentiment": self._sentiment_scores(f"{article.title}. {article.summary}"),
+            "title_tokens": tokenize(article.title),
+            "sentences": sent_tokenize(article.summary) if article.summary else []
+        }
 
-    def _create_topic_summary(self, topic: Dict[str, Any]) -> str:
+    def _sentiment_scores(self, text: str) -> List[float]:
         """
-        Create a summary of the topic based on its articles.
+        Score the sentiment of a text.
+        
+        Without the VADER lexicon, the error is logged once and every text is
+        scored neutral, so the run continues without sentiment.
         
-        Args:
-            topic: Topic dictionary
-            
         Returns:
-            Summary string
+            Compound, positive, negative and neutral scores
         """
-        # Extract sentences from article summaries
-        all_sentences = []
-        
-        for article in topic["articles"]:
-            title = article.get("title", "")
-            summary = article.get("summary", "")
-            
-            # Add the title as a sentence
-            if title:
-                all_sentences.append(title)
-            
-            # Extract sentences from the summary
-            if summary:
-                sentences = sent_tokenize(summary)
-                all_sentences.extend(sentences)
-        
-        # Calculate a rough "importance" score for each sentence
-        sentence_importance = {}
-        for sentence in all_sentences:
-            # Convert to lowercase for matching
-            lower_sentence = sentence.lower()
-            
-            # Count how many dominant terms appear in the sentence
-            term_count = sum(1 for term in topic["dominant_terms"] if term.lower() in lower_sentence)
-            
-            # Basic scoring: term count plus bonus for shorter sentences
-            score = term_count + (1 / (len(sentence.split()) + 10))  # +10 to avoid division by zero
-            
-            sentence_importance[sentence] = score
-        
-        # Select top sentences
-        top_sentences = sorted(all_sentences, key=lambda s: sentence_importance.get(s, 0), reverse=True)
-        
-        # Take top 3-5 sentences, depending on their length
-        total_length = 0
-        selected_sentences = []
-        
-        for sentence in top_sentences:
-            if total_length > 500 or len(selected_sentences) >= 5:
-                break
-                
-            if sentence not in selected_sentences:
-                selected_sentences.append(sentence)
-                total_length += len(sentence)
-        
-        # Join the selected sentences
-        summary = " ".join(selected_sentences)
+        if not self._sentiment_unavailable:
+            try:
+                scores = self.sentiment_analyzer.polarity_scores(text)
+                return [scores["compound"], scores["pos"], scores["neg"], scores["neu"]]
+            except LookupError as e:
+                logger.error(f"Sentiment analysis unavailable, scoring all articles neutral: {e}")
+                self._sentiment_unavailable = True
+        return list(NEUTRAL_SENTIMENT)
+
+    def _enrich_topics(self, topics: List[Dict[str, Any]], newest_articles: List[Optional[Article]]):
+        """
+        Set the suggested title, keywords and summary of every topic.
         
-        # If summary is too short, use the top article's summary directly
-        if len(summary) < 100 and topic["articles"]:
-            top_article = sorted(topic["articles"], 
-                                key=lambda a: a.get("published_datetime", datetime.min), 
-                                reverse=True)[0]
-            summary = top_article.get("summary", summary)
+        Topics are independent, so with enrichment_workers set they are
+        enriched in a process pool; results are applied in topic order either way.
         
-        return summary
+        Args:
+            topics: Scored topic dictionaries
+            newest_articles: The newest article of each topic
+        """
+        tasks = []
+        for topic, newest_article in zip(topics, newest_articles):
+            articles = topic["articles"]
+            tasks.append((
+                topic["dominant_terms"],
+                articles,
+                [self._article_analysis(article) for article in articles],
+                newest_article,
+                self.stop_words
+            ))
+        
+        results = None
+        if self.enrichment_workers > 0 and len(tasks) > 1:
+            try:
+                # Article bodies are not used, so they are not sent to the workers
+                worker_tasks = [
+                    (terms, [dataclasses.replace(a, content="") for a in articles], analyses,
+                     newest and dataclasses.replace(newest, content=""), stop_words)
+                    for terms, articles, analyses, newest, stop_words in tasks
+                ]
+                results = list(self._get_enrichment_pool().map(enrich_topic, *zip(*worker_tasks)))
+            except BrokenProcessPool as e:
+                logger.error(f"Topic enrichment pool failed, enriching in-process: {e}")
+                self._enrichment_pool = None
+        
+        if results is None:
+            results = [enrich_topic(*task) for task in tasks]
+        
+        for topic, result in zip(topics, results):
+            topic.update(result)
+
+    def _get_enrichment_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool used for topic enrichment, creating it on first use."""
+        if self._enrichment_pool is None:
+            # spawn avoids forking a parent that holds SQLite connections
+            self._enrichment_pool = ProcessPoolExecutor(
+                max_workers=self.enrichment_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._enrichment_pool
+
+    def close(self):
+        """Shut down the topic enrichment pool and close the stores."""
+        pool, self._enrichment_pool = self._enrichment_pool, None
+        if pool:
+            pool.shutdown(wait=True)
+        for store in (self._article_store, self._processing_store):
+            if store:
+                store.close()
+        self._article_store = self._processing_store = None
 
     def _save_processed_topics(self, topics: List[Dict[str, Any]]):
         """
         Save processed topics to file.
         
+        The default JSON Lines format stores each article once and lets
+        topic_output.load_topic_headers() read topics without article bodies.
+        
         Args:
             topics: List of processed topic dictionaries
         """
         try:
             # Create a timestamped filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = os.path.join(self.output_dir, f"processed_topics_{timestamp}.json")
             
-            # Convert datetime objects to ISO strings for JSON serialization
-            topics_copy = []
-            for topic in topics:
-                topic_copy = topic.copy()
+            if self.output_format == "json":
+                filename = os.path.join(self.output_dir, f"processed_topics_{timestamp}.json")
                 
-                # Process articles
-                articles_copy = []
-                for article in topic_copy["articles"]:
-                    article_copy = article.copy()
-                    
-                    # Convert datetime to string if present
-                    if "published_datetime" in article_copy and isinstance(article_copy["published_datetime"], datetime):
-                        article_copy["published_datetime"] = article_copy["published_datetime"].isoformat()
-                        
-                    articles_copy.append(article_copy)
+                # Convert articles to JSON-serializable dictionaries
+                topics_copy = []
+                for topic in topics:
+                    topic_copy = topic.copy()
+                    topic_copy["articles"] = [article.to_dict() for article in topic_copy["articles"]]
+                    topics_copy.append(topic_copy)
                 
-                topic_copy["articles"] = articles_copy
-                topics_copy.append(topic_copy)
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(topics_copy, f, indent=2)
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(topics_copy, f, indent=2)
+            else:
+                extension = ".jsonl.gz" if self.compress_output else ".jsonl"
+                filename = os.path.join(self.output_dir, f"processed_topics_{timestamp}{extension}")
+                save_topics(filename, topics)
                 
             logger.info(f"Saved processed topics to {filename}")
             
         except Exception as e:
             logger.error(f"Error saving processed topics: {e}")
 
-
 if __name__ == "__main__":
     # Configure logging for standalone testing
     logging.basicConfig(
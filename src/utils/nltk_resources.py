@@ -0,0 +1,211 @@
+"""
+NLTK Resources - Offline, lazy access to the NLTK data used by the news pipeline.
+Resources are looked up locally on first use; downloading is an explicit setup step.
+
+Usage:
+    python -m src.utils.nltk_resources --download [--data-dir DIR]
+"""
+import os
+import re
+import logging
+import argparse
+import threading
+from typing import Callable, FrozenSet, List, Optional
+
+from .text_utils import tokenize
+
+logger = logging.getLogger("TEC.NLTKResources")
+
+# Resource name -> path nltk.data.find expects
+RESOURCE_PATHS = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab/english/",
+    "stopwords": "corpora/stopwords",
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+}
+
+# Vendored data directory checked before NLTK's default search path
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'nltk_data')
+
+_lock = threading.RLock()
+_data_dir = DEFAULT_DATA_DIR
+_allow_download = False
+_cache = {}
+
+_FALLBACK_SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'])')
+
+
+def configure(data_dir: Optional[str] = None, allow_download: bool = False):
+    """
+    Set where NLTK data is looked up and whether missing data may be downloaded.
+
+    Args:
+        data_dir: Directory searched before NLTK's default locations (and the
+            download target); defaults to data/nltk_data
+        allow_download: Download missing resources on first use. Off by
+            default so scheduled runs never touch the network.
+    """
+    global _data_dir, _allow_download
+    with _lock:
+        _data_dir = data_dir or DEFAULT_DATA_DIR
+        _allow_download = allow_download
+        _cache.clear()
+
+
+def _nltk():
+    """Import nltk and put the configured data directory first on its search path."""
+    import nltk
+
+    if _data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, _data_dir)
+    return nltk
+
+
+def has_resource(name: str) -> bool:
+    """
+    Check whether an NLTK resource is available locally.
+
+    Args:
+        name: Resource name (a key of RESOURCE_PATHS)
+
+    Returns:
+        True if the resource can be loaded without downloading
+    """
+    nltk = _nltk()
+    try:
+        nltk.data.find(RESOURCE_PATHS[name])
+        return True
+    except LookupError:
+        return False
+
+
+def require(name: str) -> bool:
+    """
+    Make sure a resource is available, downloading it only if allowed.
+
+    Args:
+        name: Resource name (a key of RESOURCE_PATHS)
+
+    Returns:
+        True if the resource is available
+    """
+    if has_resource(name):
+        return True
+    if not _allow_download:
+        return False
+
+    logger.info(f"Downloading NLTK resource: {name}")
+    os.makedirs(_data_dir, exist_ok=True)
+    _nltk().download(name, download_dir=_data_dir, quiet=True)
+    return has_resource(name)
+
+
+def _cached(key: str, factory: Callable):
+    """Build a value once and reuse it for the life of the process."""
+    with _lock:
+        if key not in _cache:
+            _cache[key] = factory()
+        return _cache[key]
+
+
+def stop_words() -> FrozenSet[str]:
+    """
+    Get the English stop words.
+
+    Falls back to scikit-learn's English stop word list if the NLTK corpus
+    is not installed.
+    """
+    def load():
+        if require("stopwords"):
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words('english'))
+
+        logger.warning("NLTK stopwords not installed; using scikit-learn's English stop words")
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+        return frozenset(ENGLISH_STOP_WORDS)
+
+    return _cached("stop_words", load)
+
+
+def sentiment_analyzer():
+    """
+    Get the shared VADER sentiment analyzer.
+
+    Raises:
+        LookupError: If the VADER lexicon is not installed
+    """
+    def load():
+        if not require("vader_lexicon"):
+            raise LookupError(
+                "NLTK resource 'vader_lexicon' not found. Install it with "
+                "`python -m src.utils.nltk_resources --download`"
+            )
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        return SentimentIntensityAnalyzer()
+
+    return _cached("sentiment_analyzer", load)
+
+
+def _punkt_available() -> bool:
+    """Whether the Punkt sentence tokenizer data is installed (either format)."""
+    return _cached("punkt", lambda: require("punkt_tab") or require("punkt"))
+
+
+def sent_tokenize(text: str) -> List[str]:
+    """
+    Split text into sentences.
+
+    Uses NLTK's Punkt tokenizer when installed, otherwise a punctuation-based
+    fallback.
+    """
+    if _punkt_available():
+        from nltk.tokenize import sent_tokenize as nltk_sent_tokenize
+        return nltk_sent_tokenize(text)
+    return [sentence for sentence in _FALLBACK_SENTENCE_PATTERN.split(text.strip()) if sentence]
+
+
+def word_tokenize(text: str) -> List[str]:
+    """
+    Split text into word and punctuation tokens.
+
+    Uses NLTK's word tokenizer when Punkt is installed, otherwise
+    text_utils.tokenize.
+    """
+    if _punkt_available():
+        from nltk.tokenize import word_tokenize as nltk_word_tokenize
+        return nltk_word_tokenize(text)
+    return tokenize(text)
+
+
+def download_resources(data_dir: Optional[str] = None) -> List[str]:
+    """
+    Download every resource the news pipeline uses.
+
+    Args:
+        data_dir: Target directory (defaults to the configured data directory)
+
+    Returns:
+        Names of resources that are still missing afterwards
+    """
+    configure(data_dir or _data_dir, allow_download=True)
+    missing = [name for name in RESOURCE_PATHS if not require(name)]
+    configure(data_dir or _data_dir, allow_download=False)
+    return missing
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Check or install the NLTK data used by the news pipeline")
+    parser.add_argument("--download", action="store_true", help="Download missing resources")
+    parser.add_argument("--data-dir", help=f"NLTK data directory (default: {DEFAULT_DATA_DIR})")
+    args = parser.parse_args()
+
+    if args.download:
+        missing = download_resources(args.data_dir)
+    else:
+        configure(args.data_dir)
+        missing = [name for name in RESOURCE_PATHS if not has_resource(name)]
+
+    for name in RESOURCE_PATHS:
+        print(f"{name:<15} {'missing' if name in missing else 'ok'}")
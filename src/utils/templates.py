@@ -0,0 +1,112 @@
+"""
+Templates - Precompiled {{placeholder}} templates.
+Parses a template once, checks its placeholders against the names its caller
+provides, and fills every placeholder in a single pass when rendered.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+class Template:
+    """
+    A template compiled to a str.format_map() format string.
+
+    Literal braces are escaped and each {{name}} becomes a {name} field, so
+    rendering is one C-level pass over the template regardless of how many
+    placeholders it has.
+    """
+
+    __slots__ = ("source", "name", "placeholders", "_format")
+
+    def __init__(self, source: str, allowed: Optional[Iterable[str]] = None, name: str = "template"):
+        """
+        Compile a template.
+
+        Args:
+            source: Template text with {{name}} placeholders
+            allowed: Placeholder names the template may use (any if None)
+            name: Where the template comes from, for error messages
+
+        Raises:
+            ValueError: If the template uses a placeholder that is not allowed
+        """
+        self.source = source
+        self.name = name
+
+        parts = PLACEHOLDER_PATTERN.split(source)
+        # split() alternates literal text and placeholder names
+        literals, fields = parts[0::2], parts[1::2]
+        self.placeholders = frozenset(fields)
+
+        if allowed is not None:
+            unknown = sorted(self.placeholders - set(allowed))
+            if unknown:
+                known = ", ".join(f"{{{{{field}}}}}" for field in sorted(allowed))
+                raise ValueError(
+                    f"Unknown placeholder {{{{{unknown[0]}}}}} in {name}; known placeholders are: {known}"
+                )
+
+        escaped = [literal.replace("{", "{{").replace("}", "}}") for literal in literals]
+        self._format = escaped[0] + "".join(
+            f"{{{field}}}{literal}" for field, literal in zip(fields, escaped[1:])
+        )
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """
+        Fill in the template.
+
+        Args:
+            values: Value for each placeholder; extra keys are ignored
+
+        Returns:
+            Rendered text
+
+        Raises:
+            ValueError: If a placeholder has no value
+        """
+        try:
+            return self._format.format_map(values)
+        except KeyError as e:
+            raise ValueError(f"No value for placeholder {{{{{e.args[0]}}}}} in {self.name}") from None
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+
+def compile_templates(sources: List[str], allowed: Optional[Iterable[str]] = None,
+                      name: str = "templates") -> List[Template]:
+    """
+    Compile a list of templates.
+
+    Args:
+        sources: Template texts
+        allowed: Placeholder names the templates may use (any if None)
+        name: Where the list comes from, for error messages
+
+    Returns:
+        Compiled templates, in order
+    """
+    allowed = frozenset(allowed) if allowed is not None else None
+    return [Template(source, allowed, f"{name}[{i}]") for i, source in enumerate(sources)]
+
+
+def compile_template_fields(sources: Dict[str, str], allowed: Dict[str, Iterable[str]],
+                            name: str = "template") -> Dict[str, Template]:
+    """
+    Compile the text fields of a structured template.
+
+    Args:
+        sources: Field name -> template text
+        allowed: Field name -> placeholder names that field may use; fields
+            not listed may use any placeholder
+        name: Where the template comes from, for error messages
+
+    Returns:
+        Field name -> compiled template
+    """
+    return {
+        field: Template(source, allowed.get(field), f"{name}.{field}")
+        for field, source in sources.items()
+    }
@@ -0,0 +1,214 @@
+"""
+Topic History - Tracks news topics across processing runs.
+Matches each run's topic clusters to earlier ones by nearest centroid, so
+topics carry an age and a trend velocity without rescanning old output files.
+"""
+import re
+import time
+import uuid
+import zlib
+import logging
+from typing import Dict, Any, FrozenSet, List, Optional
+from datetime import datetime
+
+import numpy as np
+
+logger = logging.getLogger("TEC.TopicHistory")
+
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9]+")
+
+# Velocity is measured over at least this long, so back-to-back runs don't inflate it
+MIN_VELOCITY_WINDOW_HOURS = 1.0
+
+
+class TopicHistory:
+    """
+    Centroids and term signatures of topics seen in earlier runs.
+
+    Centroids live in a fixed hashed term space, so clusters from runs with
+    different TF-IDF vocabularies stay comparable. Each run's topics are
+    matched one-to-one to the most similar tracked topic above a cosine
+    similarity threshold; unmatched topics start new history entries.
+    """
+
+    def __init__(self, dimensions: int = 4096, match_threshold: float = 0.5,
+                 stop_words: FrozenSet[str] = frozenset()):
+        """
+        Initialize an empty history.
+
+        Args:
+            dimensions: Size of the hashed term space (must match across runs
+                to reuse persisted centroids)
+            match_threshold: Minimum cosine similarity for two topics to be the same story
+            stop_words: Words left out of centroids
+        """
+        self.dimensions = dimensions
+        self.match_threshold = match_threshold
+        self.stop_words = stop_words
+
+        self._topics = []  # tracked topic records
+        self._centroids = np.zeros((0, dimensions), dtype=np.float32)
+        self._pending = {}  # topic_key -> record not yet persisted
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def centroid(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute the centroid of a topic's article texts.
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            L2-normalized float32 vector of length dimensions
+        """
+        centroid = np.zeros(self.dimensions, dtype=np.float64)
+        for text in texts:
+            words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in self.stop_words]
+            if not words:
+                continue
+            # crc32 is stable across processes, unlike the built-in hash()
+            indexes = np.fromiter((zlib.crc32(word.encode("utf-8")) % self.dimensions for word in words),
+                                  dtype=np.int64, count=len(words))
+            counts = np.bincount(indexes, minlength=self.dimensions).astype(np.float64)
+            centroid += counts / np.linalg.norm(counts)
+        return self._normalize(centroid)
+
+    def match(self, centroids: np.ndarray) -> List[Optional[int]]:
+        """
+        Match centroids to tracked topics.
+
+        Pairs are assigned greedily from the most similar down, so each tracked
+        topic is matched at most once per run.
+
+        Args:
+            centroids: Array of shape (n, dimensions)
+
+        Returns:
+            Index of the matching tracked topic for each centroid, or None
+        """
+        matches = [None] * len(centroids)
+        if not len(centroids) or not self._topics:
+            return matches
+
+        similarity = centroids @ self._centroids.T
+        new_index, old_index = np.nonzero(similarity >= self.match_threshold)
+        order = np.argsort(-similarity[new_index, old_index], kind="stable")
+
+        taken = set()
+        for i in order:
+            new, old = int(new_index[i]), int(old_index[i])
+            if matches[new] is None and old not in taken:
+                matches[new] = old
+                taken.add(old)
+        return matches
+
+    def observe(self, topics: List[Dict[str, Any]], observed_at: Optional[float] = None):
+        """
+        Match topics to the history and set their trend fields.
+
+        Sets "history_id", "first_seen" (epoch seconds), "age_hours",
+        "runs_seen" and "velocity" (change in article count per hour since
+        the topic was last seen) on each topic.
+
+        Args:
+            topics: Scored topic dictionaries with articles, dominant_terms and relevance_score
+            observed_at: Observation time as epoch seconds (defaults to now)
+        """
+        observed_at = observed_at if observed_at is not None else time.time()
+        if not topics:
+            return
+
+        centroids = np.vstack([
+            self.centroid([f"{article.title} {article.summary}" for article in topic["articles"]])
+            for topic in topics
+        ])
+
+        for topic, centroid, match in zip(topics, centroids, self.match(centroids)):
+            count = topic["article_count"]
+
+            if match is None:
+                # A new story starts from zero articles at its oldest article's publication time
+                oldest = min((article.published_ts for article in topic["articles"]), default=observed_at)
+                record = {
+                    "topic_key": uuid.uuid4().hex,
+                    "first_seen": min(oldest, observed_at),
+                    "runs": 0
+                }
+                previous_count, previous_seen = 0, record["first_seen"]
+                self._topics.append(record)
+                self._centroids = np.vstack([self._centroids, centroid[np.newaxis, :]])
+            else:
+                record = self._topics[match]
+                previous_count, previous_seen = record["article_count"], record["last_seen"]
+                # Let the tracked centroid drift with the story
+                centroid = self._normalize(self._centroids[match] + centroid)
+                self._centroids[match] = centroid
+
+            hours = max((observed_at - previous_seen) / 3600, MIN_VELOCITY_WINDOW_HOURS)
+            record.update({
+                "last_seen": observed_at,
+                "runs": record["runs"] + 1,
+                "article_count": count,
+                "terms": list(topic["dominant_terms"][:20]),
+                "relevance": topic.get("relevance_score", 0.0),
+                "velocity": (count - previous_count) / hours
+            })
+            self._pending[record["topic_key"]] = record
+
+            topic["history_id"] = record["topic_key"]
+            topic["first_seen"] = record["first_seen"]
+            topic["age_hours"] = (observed_at - record["first_seen"]) / 3600
+            topic["runs_seen"] = record["runs"]
+            topic["velocity"] = record["velocity"]
+
+    def _normalize(self, vector: np.ndarray) -> np.ndarray:
+        """Scale a vector to unit length."""
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).astype(np.float32)
+
+    def load(self, store, since: Optional[datetime] = None) -> int:
+        """
+        Load tracked topics from an article store.
+
+        Args:
+            store: ArticleStore holding the topic history
+            since: Ignore topics last seen before this time
+
+        Returns:
+            Number of topics loaded
+        """
+        records, centroids = [], []
+        for record in store.get_topics(since=since):
+            centroid = np.frombuffer(record.pop("centroid"), dtype=np.float32)
+            if len(centroid) != self.dimensions:
+                continue  # Written with different history settings
+            records.append(record)
+            centroids.append(centroid)
+
+        self._topics = records
+        self._centroids = np.vstack(centroids) if centroids else np.zeros((0, self.dimensions), dtype=np.float32)
+        return len(records)
+
+    def save(self, store) -> int:
+        """
+        Persist topics observed since the last save.
+
+        Args:
+            store: ArticleStore to write to
+
+        Returns:
+            Number of topics written
+        """
+        if not self._pending:
+            return 0
+
+        index = {record["topic_key"]: i for i, record in enumerate(self._topics)}
+        rows = [
+            dict(record, centroid=self._centroids[index[key]].tobytes())
+            for key, record in self._pending.items()
+        ]
+        store.save_topics(rows)
+        self._pending = {}
+        return len(rows)
@@ -0,0 +1,208 @@
+"""
+Topic Model - An incremental topic clustering model that persists across runs.
+Uses a hashing vectorizer with running document frequencies and MiniBatchKMeans,
+so each run only fits the articles it has not seen before.
+"""
+import os
+import logging
+from typing import List
+from datetime import datetime, timedelta
+
+import numpy as np
+import joblib
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import normalize
+from sklearn.utils import murmurhash3_32
+
+logger = logging.getLogger("TEC.TopicModel")
+
+MODEL_VERSION = 1
+
+
+class IncrementalTopicModel:
+    """
+    Topic clusters that are updated, not refit, on every run.
+
+    Texts are hashed into a fixed feature space, so there is no vocabulary to
+    refit. IDF weights come from document frequencies accumulated across runs.
+    MiniBatchKMeans is updated with partial_fit on new articles only, which
+    keeps cluster ids stable from one run to the next.
+    """
+
+    def __init__(self, state_path: str, n_clusters: int = 10, n_features: int = 2 ** 18,
+                 retention_days: int = 7, random_state: int = 42):
+        """
+        Initialize the model, loading saved state if present.
+
+        Args:
+            state_path: File the model state is saved to
+            n_clusters: Number of topic clusters
+            n_features: Size of the hashed feature space
+            retention_days: How long fitted article URLs are remembered
+            random_state: Seed for cluster initialization
+        """
+        self.state_path = state_path
+        self.n_clusters = n_clusters
+        self.n_features = n_features
+        self.retention_days = retention_days
+        self.random_state = random_state
+
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            alternate_sign=False,
+            norm=None
+        )
+        self._analyzer = self.vectorizer.build_analyzer()
+
+        self.kmeans = None
+        self.doc_count = 0
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.terms = {}  # feature index -> most recent term hashed to it
+        self.fitted = {}  # article URL -> epoch seconds it was fitted
+
+        self._load()
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the clusters have been initialized."""
+        return self.kmeans is not None and hasattr(self.kmeans, "cluster_centers_")
+
+    def update(self, texts: List[str], urls: List[str]) -> int:
+        """
+        Fit the model on articles it has not seen before.
+
+        Args:
+            texts: Article texts
+            urls: Article URLs, aligned with texts
+
+        Returns:
+            Number of articles the model was updated with
+        """
+        new = [(text, url) for text, url in zip(texts, urls) if url not in self.fitted]
+        if not new:
+            return 0
+
+        # MiniBatchKMeans needs at least n_clusters samples to initialize
+        if not self.is_fitted and len(new) < self.n_clusters:
+            logger.info(f"Waiting for {self.n_clusters} articles before initializing topic clusters")
+            return 0
+
+        new_texts = [text for text, _ in new]
+        counts = self.vectorizer.transform(new_texts)
+
+        # Accumulate document frequencies before weighting
+        self.doc_freq += np.bincount(counts.indices, minlength=self.n_features)
+        self.doc_count += len(new_texts)
+        self._remember_terms(new_texts)
+
+        if self.kmeans is None:
+            self.kmeans = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                random_state=self.random_state,
+                n_init=3
+            )
+        self.kmeans.partial_fit(self._weight(counts))
+
+        now = datetime.now().timestamp()
+        for _, url in new:
+            self.fitted[url] = now
+        return len(new)
+
+    def assign(self, texts: List[str]) -> np.ndarray:
+        """
+        Assign texts to their nearest topic cluster.
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            Array of cluster ids
+        """
+        return self.kmeans.predict(self._weight(self.vectorizer.transform(texts)))
+
+    def top_terms(self, cluster_id: int, count: int = 20) -> List[str]:
+        """
+        Get the most significant terms of a cluster.
+
+        Args:
+            cluster_id: Cluster id
+            count: Number of terms
+
+        Returns:
+            Terms, most significant first
+        """
+        center = self.kmeans.cluster_centers_[cluster_id]
+        terms = []
+        for index in center.argsort()[::-1]:
+            if center[index] <= 0 or len(terms) >= count:
+                break
+            term = self.terms.get(int(index))
+            if term:
+                terms.append(term)
+        return terms
+
+    def _weight(self, counts):
+        """Apply smoothed TF-IDF weighting and L2 normalization to term counts."""
+        idf = np.log((1 + self.doc_count) / (1 + self.doc_freq)) + 1
+        return normalize(counts.multiply(idf).tocsr())
+
+    def _remember_terms(self, texts: List[str]):
+        """Record which term each hashed feature index came from."""
+        for text in texts:
+            for term in self._analyzer(text):
+                index = self._feature_index(term)
+                self.terms[index] = term
+
+    def _feature_index(self, term: str) -> int:
+        """Get the hashed feature index of a term, as HashingVectorizer computes it."""
+        return abs(murmurhash3_32(term, seed=0)) % self.n_features
+
+    def save(self):
+        """Save the model state, forgetting fitted URLs past the retention period."""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+        self.fitted = {url: fitted_at for url, fitted_at in self.fitted.items() if fitted_at >= cutoff}
+
+        # Only keep term names for features that still carry weight somewhere
+        if self.is_fitted:
+            active = set(np.flatnonzero(self.kmeans.cluster_centers_.max(axis=0) > 0).tolist())
+            self.terms = {index: term for index, term in self.terms.items() if index in active}
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        state = {
+            "version": MODEL_VERSION,
+            "n_clusters": self.n_clusters,
+            "n_features": self.n_features,
+            "kmeans": self.kmeans,
+            "doc_count": self.doc_count,
+            "doc_freq": self.doc_freq,
+            "terms": self.terms,
+            "fitted": self.fitted
+        }
+        temp_path = f"{self.state_path}.tmp"
+        joblib.dump(state, temp_path, compress=3)
+        os.replace(temp_path, self.state_path)
+
+    def _load(self):
+        """Load saved model state if it matches the current settings."""
+        if not os.path.exists(self.state_path):
+            return
+
+        try:
+            state = joblib.load(self.state_path)
+        except Exception as e:
+            logger.error(f"Error loading topic model from {self.state_path}: {e}")
+            return
+
+        if (state.get("version") != MODEL_VERSION or state.get("n_clusters") != self.n_clusters
+                or state.get("n_features") != self.n_features):
+            logger.warning("Saved topic model settings changed; starting a new model")
+            return
+
+        self.kmeans = state["kmeans"]
+        self.doc_count = state["doc_count"]
+        self.doc_freq = state["doc_freq"]
+        self.terms = state["terms"]
+        self.fitted = state["fitted"]
+        logger.info(f"Loaded topic model trained on {self.doc_count} articles")
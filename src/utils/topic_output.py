@@ -0,0 +1,191 @@
+"""
+Topic Output - Compact storage of processed news topics.
+Writes topics as JSON Lines with each article stored once and referenced by id,
+optionally gzip-compressed, and reads topic headers without loading articles.
+
+File layout (one JSON object per line):
+    {"format": "processed_topics", "version": 1, "created_at": ..., "topic_count": ..., "article_count": ...}
+    {"type": "topic", ..., "article_ids": [0, 1, ...]}      one line per topic
+    {"type": "article", "id": 0, "title": ..., ...}          one line per article
+"""
+import os
+import gzip
+import json
+from typing import Dict, Any, List, Optional, Iterator, TextIO
+from datetime import datetime
+
+from .article import Article
+
+FORMAT_NAME = "processed_topics"
+FORMAT_VERSION = 1
+
+# Records are written with "type" first, so article lines can be recognized unparsed
+ARTICLE_PREFIX = '{"type":"article"'
+
+
+def _open_text(path: str, mode: str, compressed: Optional[bool] = None) -> TextIO:
+    """Open a text file, gzip-compressed if requested or if its name ends in .gz."""
+    if compressed is None:
+        compressed = path.endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _dumps(value: Dict[str, Any]) -> str:
+    """Serialize a record as a single compact JSON line."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def save_topics(path: str, topics: List[Dict[str, Any]]):
+    """
+    Save processed topics in the compact JSON Lines format.
+
+    Args:
+        path: Output file; a ".gz" suffix enables gzip compression
+        topics: Topic dictionaries whose "articles" are Article objects or dictionaries
+    """
+    article_ids = {}
+    articles = []
+    topic_lines = []
+
+    for topic in topics:
+        ids = []
+        for article in topic.get("articles", []):
+            article = Article.coerce(article)
+            key = article.url or f"untitled-{len(articles)}"
+            if key not in article_ids:
+                article_ids[key] = len(articles)
+                articles.append(article)
+            ids.append(article_ids[key])
+
+        header = {key: value for key, value in topic.items() if key != "articles"}
+        topic_lines.append(_dumps({"type": "topic", **header, "article_ids": ids}))
+
+    temp_path = f"{path}.tmp"
+    with _open_text(temp_path, "w", compressed=path.endswith(".gz")) as f:
+        f.write(_dumps({
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "topic_count": len(topic_lines),
+            "article_count": len(articles)
+        }) + "\n")
+        for line in topic_lines:
+            f.write(line + "\n")
+        for article_id, article in enumerate(articles):
+            f.write(_dumps({"type": "article", "id": article_id, **article.to_dict()}) + "\n")
+
+    os.replace(temp_path, path)
+
+
+def _iter_lines(path: str) -> Iterator[str]:
+    """Check the header of a JSON Lines topics file and yield its remaining lines."""
+    with _open_text(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path} is not a processed topics file")
+        if header.get("version", 0) > FORMAT_VERSION:
+            raise ValueError(f"{path} uses unsupported format version {header['version']}")
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def _is_legacy(path: str) -> bool:
+    """Whether a file uses the original indented JSON array format."""
+    return path.endswith(".json")
+
+
+def load_topic_headers(path: str) -> List[Dict[str, Any]]:
+    """
+    Load topics without their articles.
+
+    Reading stops at the first article record, so article bodies are never
+    parsed (or, for compressed files, decompressed).
+
+    Args:
+        path: Topics file written by save_topics, or a legacy .json file
+
+    Returns:
+        Topic dictionaries with "article_ids" instead of "articles"
+    """
+    if _is_legacy(path):
+        topics = []
+        for topic in _load_legacy(path):
+            header = {key: value for key, value in topic.items() if key != "articles"}
+            header["article_ids"] = list(range(len(topic.get("articles", []))))
+            topics.append(header)
+        return topics
+
+    topics = []
+    for line in _iter_lines(path):
+        if line.startswith(ARTICLE_PREFIX):
+            break
+        record = json.loads(line)
+        record.pop("type", None)
+        topics.append(record)
+    return topics
+
+
+def load_topics(path: str) -> List[Dict[str, Any]]:
+    """
+    Load topics with their articles.
+
+    Args:
+        path: Topics file written by save_topics, or a legacy .json file
+
+    Returns:
+        Topic dictionaries whose "articles" are Article objects
+    """
+    if _is_legacy(path):
+        topics = _load_legacy(path)
+        for topic in topics:
+            topic["articles"] = [Article.from_dict(article) for article in topic.get("articles", [])]
+        return topics
+
+    topics = []
+    articles = {}
+    for line in _iter_lines(path):
+        record = json.loads(line)
+        record_type = record.pop("type", None)
+        if record_type == "topic":
+            topics.append(record)
+        elif record_type == "article":
+            articles[record.pop("id")] = Article.from_dict(record)
+
+    for topic in topics:
+        topic["articles"] = [articles[article_id] for article_id in topic.pop("article_ids", []) if article_id in articles]
+    return topics
+
+
+def _load_legacy(path: str) -> List[Dict[str, Any]]:
+    """Load a file in the original indented JSON array format."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_topic_files(directory: str) -> List[str]:
+    """
+    List processed topics files in a directory, oldest first.
+
+    Args:
+        directory: Directory written by NewsProcessor
+
+    Returns:
+        Paths of compact and legacy topics files
+    """
+    if not os.path.isdir(directory):
+        return []
+    names = [
+        name for name in os.listdir(directory)
+        if name.startswith("processed_topics_") and name.endswith((".jsonl", ".jsonl.gz", ".json"))
+    ]
+    # Names embed a sortable timestamp
+    return [os.path.join(directory, name) for name in sorted(names)]
+
+
+def latest_topics_file(directory: str) -> Optional[str]:
+    """Get the most recent processed topics file in a directory, if any."""
+    files = list_topic_files(directory)
+    return files[-1] if files else None
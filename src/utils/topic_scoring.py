@@ -0,0 +1,94 @@
+"""
+Topic Scoring - Vectorized sentiment and relevance scoring for news topics.
+Scores every topic at once from per-article arrays with NumPy group-by reductions.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+DEFAULT_RELEVANCE_WEIGHTS = {
+    "count": 0.25,
+    "sentiment": 0.2,
+    "recency": 0.35,
+    "diversity": 0.2
+}
+
+SENTIMENT_COLUMNS = ("compound", "positive", "negative", "neutral")
+
+
+def score_topics(labels: np.ndarray, n_topics: int, sentiment: np.ndarray, ages_days: np.ndarray,
+                 source_ids: np.ndarray, published_ts: np.ndarray, max_articles_per_topic: int,
+                 weights: Optional[Dict[str, float]] = None, max_age_days: float = 7.0,
+                 max_sources: int = 5) -> Dict[str, np.ndarray]:
+    """
+    Score all topics from per-article values.
+
+    Args:
+        labels: Topic index of each article
+        n_topics: Number of topics
+        sentiment: Per-article sentiment, shape (n_articles, 4) in SENTIMENT_COLUMNS order
+        ages_days: Age of each article in days
+        source_ids: Integer id of each article's source
+        published_ts: Publication time of each article in epoch seconds
+        max_articles_per_topic: Article count that earns the full count score
+        weights: Relevance weights for count, sentiment, recency and diversity
+        max_age_days: Average age at which the recency score reaches zero
+        max_sources: Distinct source count that earns the full diversity score
+
+    Returns:
+        Dictionary of per-topic arrays: "count", "sentiment" (n_topics, 4),
+        "relevance", and "most_recent" (index of each topic's newest article,
+        or -1 for empty topics)
+    """
+    weights = weights or DEFAULT_RELEVANCE_WEIGHTS
+    labels = np.asarray(labels, dtype=np.int64)
+
+    counts = np.bincount(labels, minlength=n_topics)
+    divisor = np.maximum(counts, 1)
+
+    # Mean of every sentiment column per topic
+    sentiment_means = np.column_stack([
+        np.bincount(labels, weights=sentiment[:, column], minlength=n_topics) / divisor
+        for column in range(sentiment.shape[1])
+    ]) if len(labels) else np.zeros((n_topics, len(SENTIMENT_COLUMNS)))
+
+    # Empty topics count as fully aged
+    mean_age = np.where(counts > 0, np.bincount(labels, weights=ages_days, minlength=n_topics) / divisor, max_age_days)
+
+    # Distinct sources per topic, from unique (topic, source) pairs
+    source_ids = np.asarray(source_ids, dtype=np.int64)
+    stride = int(source_ids.max()) + 1 if len(source_ids) else 1
+    pairs = np.unique(labels * stride + source_ids)
+    source_counts = np.bincount(pairs // stride, minlength=n_topics)
+
+    count_score = np.minimum(counts / max_articles_per_topic, 1.0)
+    sentiment_score = np.abs(sentiment_means[:, 0])
+    recency_score = 1.0 - np.minimum(mean_age / max_age_days, 1.0)
+    diversity_score = np.minimum(source_counts / max_sources, 1.0)
+
+    relevance = (
+        weights.get("count", 0.0) * count_score +
+        weights.get("sentiment", 0.0) * sentiment_score +
+        weights.get("recency", 0.0) * recency_score +
+        weights.get("diversity", 0.0) * diversity_score
+    )
+
+    # Newest article per topic: sort by (topic, time) and take each group's last row
+    most_recent = np.full(n_topics, -1, dtype=np.int64)
+    if len(labels):
+        order = np.lexsort((published_ts, labels))
+        sorted_labels = labels[order]
+        group_ends = np.flatnonzero(np.r_[sorted_labels[1:] != sorted_labels[:-1], True])
+        most_recent[sorted_labels[group_ends]] = order[group_ends]
+
+    return {
+        "count": counts,
+        "sentiment": sentiment_means,
+        "relevance": relevance,
+        "most_recent": most_recent
+    }
+
+
+def sentiment_label(compound: float) -> str:
+    """Classify a compound sentiment score as positive, negative or neutral."""
+    return "positive" if compound > 0.05 else "negative" if compound < -0.05 else "neutral"
@@ -0,0 +1,62 @@
+"""
+Unit tests for the Article record.
+"""
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.article import Article, parse_published
+
+# 2025-05-13 18:30:00 UTC
+EXPECTED_TS = datetime(2025, 5, 13, 18, 30, tzinfo=timezone.utc).timestamp()
+
+
+class TestParsePublished:
+    """Test publication date parsing."""
+
+    def test_formats_agree(self):
+        """Every supported date format resolves to the same instant."""
+        values = [
+            "2025-05-13T18:30:00Z",
+            "2025-05-13T20:30:00+02:00",
+            "Tue, 13 May 2025 18:30:00 GMT",
+            time.strptime("2025-05-13 18:30:00", "%Y-%m-%d %H:%M:%S"),  # UTC struct_time, as from feedparser
+            datetime(2025, 5, 13, 18, 30, tzinfo=timezone.utc),
+            EXPECTED_TS,
+        ]
+        assert [parse_published(value) for value in values] == [EXPECTED_TS] * len(values)
+
+    def test_unparseable_uses_default(self):
+        """Missing or invalid dates fall back to the default."""
+        assert parse_published("", default=1.0) == 1.0
+        assert parse_published("not a date", default=2.0) == 2.0
+        assert parse_published(None) is None
+
+
+class TestArticle:
+    """Test the Article record."""
+
+    def test_dict_round_trip(self):
+        """to_dict output converts back to an equal article."""
+        article = Article(title="Story", url="https://example.com/1", source="Example", published_ts=EXPECTED_TS)
+        data = article.to_dict()
+
+        assert data["published_datetime"] == "2025-05-13T18:30:00+00:00"
+        assert Article.from_dict(data) == article
+
+    def test_dict_style_access(self):
+        """Articles still answer dictionary-style lookups."""
+        article = Article(title="Story", url="https://example.com/1")
+
+        assert article["title"] == "Story"
+        assert article.get("summary") == ""
+        assert article.get("missing", "default") == "default"
+        assert "url" in article
+
+    def test_uses_slots(self):
+        """Articles carry no per-instance __dict__."""
+        assert not hasattr(Article(title="Story", url="https://example.com/1"), "__dict__")
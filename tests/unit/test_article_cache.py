@@ -0,0 +1,71 @@
+"""
+Unit tests for the generated article cache.
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.article_cache import ArticleCache, HIT, NEAR_HIT
+    from src.utils.article import Article
+    HAS_ARTICLE_CACHE = True
+except ImportError:
+    HAS_ARTICLE_CACHE = False
+
+# Skip all tests if the cache is not available
+pytestmark = pytest.mark.skipif(not HAS_ARTICLE_CACHE, reason="article cache not available")
+
+HOUR = 3600.0
+START = 1_700_000_000.0
+
+
+def make_topic(terms, article_numbers):
+    """Build a topic with the given dominant terms and article URLs."""
+    articles = [Article(title=f"Story {i}", url=f"https://example.com/{i}") for i in article_numbers]
+    return {"dominant_terms": terms, "articles": articles}
+
+
+class TestArticleCache:
+    """Test topic fingerprint lookups."""
+
+    def test_hit_survives_reload(self, tmp_path):
+        """The same terms and articles, in any order, hit after a reload."""
+        path = str(tmp_path / "cache_index.json")
+        cache = ArticleCache(path)
+        cache.add(make_topic(["quantum", "chip"], [1, 2, 3]), "article_1", now=START)
+        cache.save(now=START)
+
+        cache = ArticleCache(path)
+        match, entry = cache.lookup(make_topic(["Quantum", "chip"], [3, 2, 1]), now=START + HOUR)
+
+        assert match == HIT
+        assert entry["article_id"] == "article_1"
+
+    def test_near_hit_needs_same_terms_and_overlap(self, tmp_path):
+        """Mostly overlapping articles are a near hit; other terms or little overlap miss."""
+        cache = ArticleCache(str(tmp_path / "cache_index.json"), near_hit_threshold=0.5)
+        cache.add(make_topic(["quantum", "chip"], [1, 2, 3, 4]), "article_1", now=START)
+
+        assert cache.lookup(make_topic(["quantum", "chip"], [1, 2, 3, 4, 5]), now=START)[0] == NEAR_HIT
+        assert cache.lookup(make_topic(["quantum", "chip"], [1, 5, 6, 7]), now=START)[0] is None
+        assert cache.lookup(make_topic(["climate", "summit"], [1, 2, 3, 4]), now=START)[0] is None
+
+    def test_ttl_and_size_cap(self, tmp_path):
+        """Expired entries stop matching and the least recently used are evicted."""
+        cache = ArticleCache(str(tmp_path / "cache_index.json"), ttl_hours=24, max_entries=2)
+        old = make_topic(["old"], [1])
+        cache.add(old, "article_old", now=START)
+        assert cache.lookup(old, now=START + 25 * HOUR) == (None, None)
+
+        for i in range(3):
+            cache.add(make_topic([f"term{i}"], [i]), f"article_{i}", now=START + 25 * HOUR + i)
+        cache.lookup(make_topic(["term0"], [0]), now=START + 26 * HOUR)
+        cache.save(now=START + 26 * HOUR)
+
+        assert len(cache) == 2
+        assert cache.lookup(make_topic(["term0"], [0]), now=START + 26 * HOUR)[0] == HIT
+        assert cache.lookup(make_topic(["term1"], [1]), now=START + 26 * HOUR)[0] is None
@@ -0,0 +1,124 @@
+"""
+Unit tests for the SQLite article store.
+"""
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.article import Article
+from src.utils.article_store import ArticleStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create an article store in a temporary directory."""
+    article_store = ArticleStore(str(tmp_path / "articles.db"))
+    yield article_store
+    article_store.close()
+
+
+def make_article(index, hours_old, category="technology", source="Example"):
+    """Build a synthetic article."""
+    return {
+        "title": f"Story {index}",
+        "url": f"https://example.com/{index}",
+        "source": source,
+        "category": category,
+        "published": "",
+        "published_datetime": datetime.now() - timedelta(hours=hours_old),
+        "summary": f"Summary {index}",
+        "content": f"Content {index}",
+    }
+
+
+class TestArticleStore:
+    """Test the ArticleStore."""
+
+    def test_source_articles_reflect_latest_fetch(self, store):
+        """Only articles seen in a source's latest fetch form its cached set."""
+        store.save_source_articles("example", [make_article(1, 1), make_article(2, 2)], fetched_at=100.0)
+        store.save_source_articles("example", [make_article(2, 2), make_article(3, 3)], fetched_at=200.0)
+
+        urls = {a["url"] for a in store.get_source_articles("example")}
+        assert urls == {"https://example.com/2", "https://example.com/3"}
+        assert store.get_fetched_at("example") == 200.0
+
+    def test_touch_source_keeps_result_set(self, store):
+        """Touching a source refreshes its fetch time without losing articles."""
+        store.save_source_articles("example", [make_article(1, 1)], fetched_at=100.0)
+        store.touch_source("example", fetched_at=300.0)
+
+        assert store.get_fetched_at("example") == 300.0
+        assert len(store.get_source_articles("example")) == 1
+
+    def test_shared_url_stays_in_each_source(self, store):
+        """An article carried by two sources stays in both cached sets, also after a touch."""
+        store.save_source_articles("first", [make_article(1, 1), make_article(2, 2)], fetched_at=100.0)
+        store.save_source_articles("second", [make_article(2, 2)], fetched_at=150.0)
+        store.touch_source("first", fetched_at=300.0)
+
+        assert {a["url"] for a in store.get_source_articles("first")} == {
+            "https://example.com/1", "https://example.com/2"
+        }
+        assert [a["url"] for a in store.get_source_articles("second")] == ["https://example.com/2"]
+
+    def test_query_filters_by_age_and_category(self, store):
+        """query_articles filters on publication time and category, newest first."""
+        store.save_source_articles("example", [
+            make_article(1, 1),
+            make_article(2, 5, category="science"),
+            make_article(3, 72),
+        ])
+
+        recent = store.query_articles(since=datetime.now() - timedelta(days=1))
+        assert [a["url"] for a in recent] == ["https://example.com/1", "https://example.com/2"]
+
+        science = store.query_articles(category="science")
+        assert [a["title"] for a in science] == ["Story 2"]
+
+    def test_published_datetime_round_trip(self, store):
+        """Publication dates come back as epoch seconds and an aware datetime."""
+        article = make_article(1, 3)
+        store.save_source_articles("example", [article])
+
+        stored = store.get_source_articles("example")[0]
+        assert isinstance(stored, Article)
+        assert abs(stored.published_ts - article["published_datetime"].timestamp()) < 1
+        assert stored.published_datetime.tzinfo is not None
+
+    def test_failures_accumulate_and_clear(self, store):
+        """Consecutive failures are counted until cleared."""
+        assert store.record_failure("example", retry_after=100.0, error="HTTP 500") == 1
+        assert store.record_failure("example", retry_after=200.0, error="timeout") == 2
+
+        failure = store.get_failure("example")
+        assert failure == {"failures": 2, "retry_after": 200.0, "last_error": "timeout"}
+
+        store.clear_failure("example")
+        assert store.get_failure("example") is None
+
+    def test_analyses_are_cached_by_hash(self, store):
+        """Stored analyses are returned for known hashes only, and pruned when unused."""
+        store.save_analyses({"abc": {"sentiment": [0.1, 0.2, 0.0, 0.8], "title_tokens": ["Story"], "sentences": []}})
+
+        assert store.get_analyses(["abc", "missing"]) == {
+            "abc": {"sentiment": [0.1, 0.2, 0.0, 0.8], "title_tokens": ["Story"], "sentences": []}
+        }
+        assert store.prune_analyses(datetime.now() - timedelta(days=1)) == 0
+        assert store.prune_analyses(datetime.now() + timedelta(days=1)) == 1
+        assert store.get_analyses(["abc"]) == {}
+
+    def test_prune_articles_keeps_linked_articles(self, store):
+        """Pruning drops old links and only the articles no source still links to."""
+        store.save_source_articles("first", [make_article(1, 1), make_article(2, 2)], fetched_at=100.0)
+        store.save_source_articles("second", [make_article(2, 2), make_article(3, 3)], fetched_at=500.0)
+
+        assert store.prune_articles(datetime.fromtimestamp(300.0)) == 1
+
+        assert {a["url"] for a in store.query_articles()} == {"https://example.com/2", "https://example.com/3"}
+        assert store.get_source_articles("first") == []
+        assert len(store.get_source_articles("second")) == 2
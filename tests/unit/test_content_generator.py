@@ -0,0 +1,242 @@
+"""
+Unit tests for ContentGenerator section generation.
+"""
+import sys
+import json
+import time
+import threading
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.article import Article
+    from src.utils.content_generator import ContentGenerator
+    HAS_CONTENT_GENERATOR = True
+except ImportError:
+    HAS_CONTENT_GENERATOR = False
+
+# Skip all tests if the generator is not available
+pytestmark = pytest.mark.skipif(not HAS_CONTENT_GENERATOR, reason="content generator not available")
+
+
+class FakeAgent:
+    """Airth stand-in whose LLM calls take a fixed time and can fail."""
+
+    def __init__(self, delay=0.2, fail_on=None):
+        self.llm_client = object()
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _interact_llm(self, prompt, max_tokens=500):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError("LLM unavailable")
+            return f"LLM text for: {prompt.split(',')[1].strip()}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_topic():
+    """A topic with enough articles for four sections."""
+    articles = [
+        Article(title=f"Story {i}", url=f"https://example.com/{i}", source=f"Source {i}",
+                summary=f"Researchers reported the quantum milestone number {i} in detail today.")
+        for i in range(8)
+    ]
+    return {"articles": articles, "keywords": ["quantum"], "dominant_terms": ["quantum"]}
+
+
+@pytest.fixture
+def generator(tmp_path):
+    generator = ContentGenerator()
+    generator.output_dir = str(tmp_path)
+    yield generator
+    generator.close()
+
+
+class TestSectionGeneration:
+    """Test concurrent section generation."""
+
+    ASPECTS = ["chips", "qubits", "funding", "policy"]
+
+    def generate(self, generator, aspects):
+        """Queue and collect section contents the way generate_articles does."""
+        topic = make_topic()
+        pending = generator._start_section_contents(topic, "Quantum", aspects)
+        return generator._finish_section_contents(topic, "Quantum", aspects, pending)
+
+    def test_sections_run_concurrently_in_order(self, generator):
+        """Sections overlap their LLM calls and keep their order."""
+        generator.airth_agent = FakeAgent(delay=0.2)
+        generator.section_workers = 4
+
+        started = time.perf_counter()
+        contents = self.generate(generator, self.ASPECTS)
+        elapsed = time.perf_counter() - started
+
+        assert contents == [f"LLM text for: focusing on {aspect}" for aspect in self.ASPECTS]
+        assert generator.airth_agent.max_active == 4
+        assert elapsed < 0.6
+
+    def test_concurrency_cap(self, generator):
+        """No more than section_workers LLM calls run at once."""
+        generator.airth_agent = FakeAgent(delay=0.05)
+        generator.section_workers = 2
+
+        self.generate(generator, self.ASPECTS)
+
+        assert generator.airth_agent.max_active == 2
+
+    def test_failed_section_falls_back(self, generator):
+        """A failing section gets basic content; the others keep LLM content."""
+        generator.airth_agent = FakeAgent(delay=0.01, fail_on="focusing on funding")
+
+        contents = self.generate(generator, self.ASPECTS)
+
+        assert contents[0] == "LLM text for: focusing on chips"
+        assert contents[2].startswith("Recent developments in Quantum have brought significant attention to funding")
+        assert contents[3] == "LLM text for: focusing on policy"
+
+    def test_slow_section_times_out(self, generator):
+        """Sections not ready within section_timeout get basic content."""
+        generator.airth_agent = FakeAgent(delay=0.5)
+        generator.section_timeout = 0.1
+
+        contents = self.generate(generator, self.ASPECTS[:2])
+
+        assert all(content.startswith("Recent developments in Quantum") for content in contents)
+
+
+class TestBatchGeneration:
+    """Test generating articles for many topics at once."""
+
+    def test_articles_keep_topic_order(self, generator):
+        """Results follow topic order and each article is stored under its own id."""
+        topics = [make_topic(), {}, make_topic()]
+        topics[2]["suggested_title"] = "Second quantum story"
+
+        results = generator.generate_articles(topics)
+
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[1]["error"] == "No topic data provided"
+        assert results[2]["topic_data"]["suggested_title"] == "Second quantum story"
+        assert results[0]["id"] != results[2]["id"]
+        assert len(generator._get_content_store().find_articles()) == 2
+
+    def test_sections_share_one_queue(self, generator):
+        """Sections of different articles run concurrently."""
+        generator.airth_agent = FakeAgent(delay=0.2)
+        generator.section_workers = 8
+
+        started = time.perf_counter()
+        results = generator.generate_articles([make_topic(), make_topic()])
+        elapsed = time.perf_counter() - started
+
+        assert all(result["success"] for result in results)
+        assert generator.airth_agent.max_active == 8
+        assert elapsed < 0.6
+
+    def test_single_topic_matches_batch(self, generator):
+        """generate_article_from_topic is a batch of one."""
+        article = generator.generate_article_from_topic(make_topic())
+
+        assert article["success"]
+        assert "LLM text" not in article["content"]
+        assert generator.generate_article_from_topic({}) == {"success": False, "error": "No topic data provided"}
+
+
+class TestTemplates:
+    """Test template compilation in the generator."""
+
+    def test_config_change_recompiles(self, generator):
+        """Assigning new patterns takes effect on the next article."""
+        generator.seo_patterns = {"meta_description_formats": ["All about {{primary_keyword}} in {{current_year}}"]}
+
+        assert generator._generate_meta_description("Quantum", "chips", "AI", 2025) == "All about Quantum in 2025"
+
+    def test_unknown_placeholder_is_rejected(self, generator):
+        """Unknown placeholders are reported when the patterns are set."""
+        with pytest.raises(ValueError, match="Unknown placeholder"):
+            generator.seo_patterns = {"title_formats": ["{{primary_keywords}} explained"]}
+
+    def test_invalid_templates_keep_other_config(self, tmp_path):
+        """A bad template falls back to the default templates without dropping later keys."""
+        config_file = tmp_path / "content_generator.json"
+        config_file.write_text(json.dumps({
+            "templates": {"news_roundup": {"title": "{{primary_keywords}} news"}},
+            "seo_patterns": {"title_formats": ["{{primary_keyword}} explained"]},
+            "section_timeout": 7,
+            "output_dir": str(tmp_path / "output")
+        }))
+
+        generator = ContentGenerator(config_path=str(config_file))
+        try:
+            assert "deep_dive" in generator.content_templates
+            assert generator.seo_patterns == {"title_formats": ["{{primary_keyword}} explained"]}
+            assert generator.section_timeout == 7
+        finally:
+            generator.close()
+
+
+class TestArticleCache:
+    """Test reuse of articles generated in earlier runs."""
+
+    def test_same_topic_reuses_article(self, generator):
+        """A repeated topic returns the saved article without LLM calls."""
+        generator.airth_agent = FakeAgent(delay=0.01)
+        first = generator.generate_article_from_topic(make_topic())
+
+        generator.airth_agent = FakeAgent(delay=0.01, fail_on="focusing")
+        second = generator.generate_article_from_topic(make_topic())
+
+        assert second["cached"]
+        assert second["id"] == first["id"]
+        assert second["content"] == first["content"]
+        assert generator.airth_agent.max_active == 0
+        assert len(generator._get_content_store().find_articles()) == 1
+
+    def test_overlapping_topic_updates_article(self, generator):
+        """A topic with one more article keeps the cached sections and title."""
+        generator.airth_agent = FakeAgent(delay=0.01)
+        first = generator.generate_article_from_topic(make_topic())
+
+        topic = make_topic()
+        topic["articles"].append(Article(title="Story 8", url="https://example.com/8", source="Source 8"))
+        generator.airth_agent = FakeAgent(delay=0.01)
+        second = generator.generate_article_from_topic(topic)
+
+        assert "cached" not in second
+        assert second["title"] == first["title"]
+        assert second["sections"] == first["sections"]
+        assert second["topic_data"]["article_count"] == 0
+        assert generator.airth_agent.max_active == 0
+        assert len(generator._get_content_store().find_articles()) == 2
+
+    def test_updated_article_keeps_headings_with_their_content(self, generator):
+        """Reused paragraphs stay under their cached headings; extra sections are added."""
+        generator.airth_agent = FakeAgent(delay=0.01)
+        topic = make_topic()
+        topic["articles"] = topic["articles"][:3]
+        first = generator.generate_article_from_topic(topic)
+
+        generator.seo_patterns = {"heading_patterns": ["Changed heading on {{secondary_aspect}}"]}
+        topic = make_topic()
+        topic["articles"] = topic["articles"][:4]
+        second = generator.generate_article_from_topic(topic)
+
+        assert len(first["sections"]) == 2
+        assert second["sections"][:2] == first["sections"]
+        assert second["sections"][2]["title"].startswith("Changed heading on")
+        assert "LLM text" not in second["sections"][2]["content"]
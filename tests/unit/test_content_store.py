@@ -0,0 +1,67 @@
+"""
+Unit tests for the generated content store.
+"""
+import sys
+import pytest
+from pathlib import Path
+from datetime import datetime
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.content_store import ContentStore
+    HAS_CONTENT_STORE = True
+except ImportError:
+    HAS_CONTENT_STORE = False
+
+# Skip all tests if the store is not available
+pytestmark = pytest.mark.skipif(not HAS_CONTENT_STORE, reason="content store not available")
+
+START = 1_700_000_000.0
+
+
+def make_article(title, category="technology_ai", keywords=("AI",)):
+    """Build a generated article dictionary."""
+    return {"title": title, "content": f"<p>{title}</p>", "category": category,
+            "keywords": list(keywords), "template_used": "news_roundup"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContentStore(str(tmp_path / "generated_articles.db"))
+    yield store
+    store.close()
+
+
+class TestContentStore:
+    """Test storing and querying generated articles."""
+
+    def test_same_second_articles_get_unique_ids(self, store):
+        """Articles added together are all kept, under distinct ids."""
+        ids = store.add_articles([make_article("Same title"), make_article("Same title")], generated_at=START)
+
+        assert len(set(ids)) == 2
+        assert store.get_article(ids[0])["title"] == "Same title"
+        assert store.get_article("missing") is None
+
+    def test_queries_use_time_category_and_keyword(self, store):
+        """Articles can be filtered by generation time, category and keyword, newest first."""
+        store.add_articles([make_article("Old", keywords=["Quantum"])], generated_at=START)
+        store.add_articles([make_article("New", keywords=["quantum", "Chips"])], generated_at=START + 60)
+        store.add_articles([make_article("Other", category="airths_codex")], generated_at=START + 120)
+
+        assert [a["title"] for a in store.find_articles()] == ["Other", "New", "Old"]
+        assert [a["title"] for a in store.find_articles(keyword="QUANTUM")] == ["New", "Old"]
+        assert [a["title"] for a in store.find_articles(since=datetime.fromtimestamp(START + 30),
+                                                        category="technology_ai")] == ["New"]
+        assert store.find_articles(limit=1)[0]["generated_ts"] == START + 120
+        assert store.count_by_category() == {"technology_ai": 2, "airths_codex": 1}
+
+    def test_duplicate_title_check(self, store):
+        """Titles are matched ignoring case, optionally within a time window."""
+        store.add_articles([make_article("Quantum Chips Explained")], generated_at=START)
+
+        assert store.has_title("quantum chips explained")
+        assert not store.has_title("Quantum Chips Explained", since=datetime.fromtimestamp(START + 1))
@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared HTTP client.
+"""
+import sys
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.http_client import HttpClient
+    HAS_HTTP_CLIENT = True
+except ImportError:
+    HAS_HTTP_CLIENT = False
+
+# Skip all tests if requests is not available
+pytestmark = pytest.mark.skipif(not HAS_HTTP_CLIENT, reason="HTTP client dependencies not available")
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Fails the first request to /flaky with a 503, then succeeds."""
+
+    calls = 0
+
+    def do_GET(self):
+        if self.path == "/flaky":
+            FlakyHandler.calls += 1
+            status = 503 if FlakyHandler.calls == 1 else 200
+        else:
+            status = 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server for the duration of a test."""
+    FlakyHandler.calls = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpClient:
+    """Test the HttpClient."""
+
+    def test_retries_on_server_error(self, server):
+        """A 503 is retried transparently."""
+        client = HttpClient(backoff_factor=0, backoff_jitter=0)
+        response = client.get(f"{server}/flaky")
+
+        assert response.status_code == 200
+        assert FlakyHandler.calls == 2
+
+    def test_metrics_are_recorded_per_host(self, server):
+        """Each request is counted against its host."""
+        client = HttpClient()
+        for _ in range(3):
+            client.get(f"{server}/")
+
+        metrics = client.get_metrics()
+        host = server.split("//")[1]
+        assert metrics[host]["requests"] == 3
+        assert metrics[host]["errors"] == 0
+        assert metrics[host]["p50_seconds"] <= metrics[host]["max_seconds"]
+
+    def test_default_headers(self):
+        """Compressed transfers are advertised by default."""
+        client = HttpClient()
+        assert "gzip" in client.session.headers["Accept-Encoding"]
@@ -0,0 +1,60 @@
+"""
+Unit tests for MinHash/LSH near-duplicate detection.
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.near_duplicates import NearDuplicateIndex
+    from src.utils.article_store import ArticleStore
+    HAS_NEAR_DUPLICATES = True
+except ImportError:
+    HAS_NEAR_DUPLICATES = False
+
+# Skip all tests if numpy is not available
+pytestmark = pytest.mark.skipif(not HAS_NEAR_DUPLICATES, reason="numpy not available")
+
+STORY = (
+    "Researchers unveiled a quantum processor on Tuesday that they say can run error corrected "
+    "algorithms for hours, a milestone that could bring practical quantum computing closer to "
+    "commercial use according to the team behind the chip"
+)
+SYNDICATED = "Reuters - " + STORY + " Reporting by the wire desk."
+UNRELATED = (
+    "City council approved a new budget for road repairs after months of debate, with most of "
+    "the money going to bridges and pedestrian crossings in the northern districts"
+)
+
+
+class TestNearDuplicateIndex:
+    """Test the near-duplicate index."""
+
+    def test_syndicated_copy_is_detected(self):
+        """A lightly edited copy of a story matches the original."""
+        index = NearDuplicateIndex()
+        assert index.find_duplicate("https://a.example.com/story", STORY) is None
+        assert index.find_duplicate("https://b.example.com/copy", SYNDICATED) == "https://a.example.com/story"
+        assert index.find_duplicate("https://c.example.com/other", UNRELATED) is None
+
+    def test_same_url_is_not_a_duplicate(self):
+        """Seeing the original article again does not flag it as a copy of itself."""
+        index = NearDuplicateIndex()
+        index.find_duplicate("https://a.example.com/story", STORY)
+        assert index.find_duplicate("https://a.example.com/story", STORY) is None
+
+    def test_signatures_persist_across_runs(self, tmp_path):
+        """Signatures saved to the article store catch copies in a later run."""
+        store = ArticleStore(str(tmp_path / "articles.db"))
+        first_run = NearDuplicateIndex()
+        first_run.find_duplicate("https://a.example.com/story", STORY)
+        assert first_run.save(store) == 1
+
+        second_run = NearDuplicateIndex()
+        assert second_run.load(store) == 1
+        assert second_run.find_duplicate("https://b.example.com/copy", SYNDICATED) == "https://a.example.com/story"
+        store.close()
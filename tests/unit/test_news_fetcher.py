@@ -0,0 +1,400 @@
+"""
+Unit tests for the NewsFetcher.
+"""
+import sys
+import json
+import time
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.news_fetcher import NewsFetcher
+    from src.utils.article import Article
+    HAS_FETCHER = True
+except ImportError:
+    HAS_FETCHER = False
+
+# Skip all tests if the fetcher dependencies are not available
+pytestmark = pytest.mark.skipif(not HAS_FETCHER, reason="NewsFetcher dependencies not available")
+
+
+def make_fetcher(tmp_path, sources):
+    """Create a NewsFetcher with the given sources and an isolated article store."""
+    config_file = tmp_path / "news_sources.json"
+    config_file.write_text(json.dumps({
+        "sources": sources,
+        "article_store": str(tmp_path / "articles.db")
+    }))
+    return NewsFetcher(config_path=str(config_file))
+
+
+def make_articles(source_name, count, now):
+    """Build a list of synthetic articles for a source."""
+    return [
+        Article(
+            title=f"{source_name} story {i}",
+            url=f"https://{source_name}.example.com/{i}",
+            source=source_name,
+            published_ts=(now - timedelta(hours=i * 5)).timestamp(),
+        )
+        for i in range(count)
+    ]
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response."""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeHttpClient:
+    """HTTP client double that always returns the same 200 response."""
+
+    def __init__(self, content=b""):
+        self.content = content
+
+    def get(self, url, **kwargs):
+        return FakeResponse(content=self.content)
+
+
+RSS_DOCUMENT = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title><ttl>30</ttl>
+<item><guid>1</guid><title>First</title><link>https://example.com/1</link>
+<description>&lt;p&gt;first &lt;b&gt;story&lt;/b&gt;&lt;/p&gt;</description></item>
+<item><guid>2</guid><title>Second</title><link>https://example.com/2</link>
+<description>second story</description></item>
+</channel></rss>"""
+
+
+class TestFetchAllSources:
+    """Test merging behaviour of fetch_all_sources."""
+
+    def test_concurrent_matches_sequential(self, tmp_path):
+        """Concurrent fetching returns the same merged list as sequential fetching."""
+        now = datetime.now()
+        sources = [
+            {"name": name, "url": f"https://{name}.example.com/rss", "type": "rss"}
+            for name in ("alpha", "beta", "gamma", "delta")
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+        fetcher._fetch_source = lambda source, use_cache=True: make_articles(source["name"], 8, now)
+
+        sequential = fetcher.fetch_all_sources(max_age_days=1, concurrent=False)
+        concurrent = fetcher.fetch_all_sources(max_age_days=1, concurrent=True)
+
+        assert [a["url"] for a in concurrent] == [a["url"] for a in sequential]
+        assert all(a.published_ts >= (now - timedelta(days=1)).timestamp() for a in concurrent)
+
+    def test_failed_source_is_skipped(self, tmp_path):
+        """A source that returns None does not stop the others."""
+        now = datetime.now()
+        sources = [
+            {"name": "ok", "url": "https://ok.example.com/rss", "type": "rss"},
+            {"name": "broken", "url": "https://broken.example.com/rss", "type": "rss"},
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+        fetcher._fetch_source = lambda source, use_cache=True: None if source["name"] == "broken" else make_articles("ok", 2, now)
+
+        articles = fetcher.fetch_all_sources(concurrent=True)
+        assert {a["source"] for a in articles} == {"ok"}
+
+    def test_unfilterable_source_is_skipped(self, tmp_path):
+        """A source whose articles cannot be age-filtered does not abort the fetch."""
+        now = datetime.now()
+        sources = [
+            {"name": "ok", "url": "https://ok.example.com/rss", "type": "rss"},
+            {"name": "bad", "url": "https://bad.example.com/rss", "type": "rss"},
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+
+        def fetch(source, use_cache=True):
+            articles = make_articles(source["name"], 2, now)
+            if source["name"] == "bad":
+                articles[0].published_ts = None
+            return articles
+
+        fetcher._fetch_source = fetch
+        assert {a["source"] for a in fetcher.fetch_all_sources()} == {"ok"}
+        assert {a["source"] for a in fetcher.iter_articles(merge_by_date=True)} == {"ok"}
+
+
+class TestIterArticles:
+    """Test the streaming article API."""
+
+    def test_stream_yields_same_articles(self, tmp_path):
+        """iter_articles yields the same articles as fetch_all_sources."""
+        now = datetime.now()
+        sources = [
+            {"name": name, "url": f"https://{name}.example.com/rss", "type": "rss"}
+            for name in ("alpha", "beta", "gamma")
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+        fetcher._fetch_source = lambda source, use_cache=True: make_articles(source["name"], 6, now)
+
+        expected = {a["url"] for a in fetcher.fetch_all_sources()}
+        assert {a["url"] for a in fetcher.iter_articles()} == expected
+
+    def test_merge_by_date_is_sorted(self, tmp_path):
+        """merge_by_date yields articles newest first across sources."""
+        now = datetime.now()
+        sources = [
+            {"name": name, "url": f"https://{name}.example.com/rss", "type": "rss"}
+            for name in ("alpha", "beta")
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+        fetcher._fetch_source = lambda source, use_cache=True: make_articles(source["name"], 4, now)
+
+        dates = [a.published_ts for a in fetcher.iter_articles(merge_by_date=True)]
+        assert len(dates) == 8
+        assert dates == sorted(dates, reverse=True)
+
+    def test_merge_by_date_ties_follow_source_order(self, tmp_path):
+        """Articles published at the same time come out in configured source order."""
+        now = datetime.now()
+        sources = [
+            {"name": name, "url": f"https://{name}.example.com/rss", "type": "rss"}
+            for name in ("slow", "fast")
+        ]
+        fetcher = make_fetcher(tmp_path, sources)
+
+        def fetch(source, use_cache=True):
+            if source["name"] == "slow":
+                time.sleep(0.2)
+            return make_articles(source["name"], 1, now)
+
+        fetcher._fetch_source = fetch
+        assert [a.source for a in fetcher.iter_articles(merge_by_date=True)] == ["slow", "fast"]
+
+
+class TestConditionalRevalidation:
+    """Test ETag / Last-Modified bookkeeping."""
+
+    def test_validators_round_trip(self, tmp_path):
+        """Validators are stored with the source's cache entry and reloaded."""
+        fetcher = make_fetcher(tmp_path, [])
+        source_key = fetcher._get_source_key({"name": "Example Feed", "url": "https://example.com/rss"})
+        fetcher._cache_results(source_key, [])
+        fetcher._save_validators(source_key, '"abc123"', "Wed, 01 Jan 2025 00:00:00 GMT")
+
+        validators = fetcher._load_validators(source_key)
+        assert validators == {"etag": '"abc123"', "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+    def test_validators_ignored_without_cache(self, tmp_path):
+        """Validators are not sent when there is no cached copy to fall back on."""
+        fetcher = make_fetcher(tmp_path, [])
+        source_key = fetcher._get_source_key({"name": "Example Feed", "url": "https://example.com/rss"})
+        fetcher._save_validators(source_key, '"abc123"', None)
+
+        assert fetcher._load_validators(source_key) == {}
+
+    def test_refresh_cache_serves_stale_copy(self, tmp_path):
+        """A 304 refresh returns cached articles even after expiry."""
+        fetcher = make_fetcher(tmp_path, [])
+        fetcher.cache_expiry = -1
+        source_key = fetcher._get_source_key({"name": "Example Feed", "url": "https://example.com/rss"})
+        fetcher._cache_results(source_key, [Article(title="Cached", url="https://example.com/1")])
+
+        assert fetcher._check_cache(source_key) == []
+        assert fetcher._refresh_cache(source_key)[0].title == "Cached"
+
+class TestEntryIndex:
+    """Test incremental parsing of RSS entries."""
+
+    def test_unchanged_entries_are_not_renormalized(self, tmp_path, monkeypatch):
+        """Only new or changed entries go through the cleaning path."""
+        import feedparser
+        from src.utils import news_fetcher
+
+        def make_entry(guid, summary):
+            return feedparser.FeedParserDict(
+                id=guid, title=f"Story {guid}", link=f"https://example.com/{guid}",
+                published="", summary=summary
+            )
+
+        entries = [make_entry("1", "<p>first</p>"), make_entry("2", "<p>second</p>")]
+        monkeypatch.setattr(
+            news_fetcher.feedparser, "parse",
+            lambda document, **kwargs: feedparser.FeedParserDict(entries=list(entries))
+        )
+
+        source = {"name": "Example Feed", "url": "https://example.com/rss", "type": "rss"}
+        fetcher = make_fetcher(tmp_path, [source])
+        fetcher.http = FakeHttpClient()
+
+        normalized = []
+        original = news_fetcher._normalize_rss_entry
+
+        def tracking_normalize(entry, content, src):
+            normalized.append(entry["id"])
+            return original(entry, content, src)
+
+        monkeypatch.setattr(news_fetcher, "_normalize_rss_entry", tracking_normalize)
+
+        fetcher._fetch_rss(source)
+        assert normalized == ["1", "2"]
+
+        entries[1] = make_entry("2", "<p>second, updated</p>")
+        entries.append(make_entry("3", "<p>third</p>"))
+        normalized.clear()
+
+        articles = fetcher._fetch_rss(source)
+        assert normalized == ["2", "3"]
+        assert [a["summary"] for a in articles] == ["first", "second, updated", "third"]
+
+
+class TestParsePool:
+    """Test feed parsing in worker processes."""
+
+    def test_pool_matches_in_process(self, tmp_path):
+        """Parsing in the process pool yields the same articles as parsing in-process."""
+        source = {"name": "Example Feed", "url": "https://example.com/rss", "type": "rss"}
+
+        (tmp_path / "inline").mkdir()
+        (tmp_path / "pooled").mkdir()
+
+        inline = make_fetcher(tmp_path / "inline", [source])
+        inline.http = FakeHttpClient(RSS_DOCUMENT)
+        expected = inline._fetch_rss(source)
+
+        pooled = make_fetcher(tmp_path / "pooled", [source])
+        pooled.http = FakeHttpClient(RSS_DOCUMENT)
+        pooled.parse_workers = 1
+        try:
+            articles = pooled._fetch_rss(source)
+        finally:
+            pooled.close()
+
+        assert [a["summary"] for a in expected] == ["first story", "second story"]
+        assert [(a["url"], a["summary"]) for a in articles] == [(a["url"], a["summary"]) for a in expected]
+
+
+class TestSourceKeys:
+    """Test cache keys for sources."""
+
+    def test_same_name_different_url(self, tmp_path):
+        """Two sources sharing a name get distinct cache keys."""
+        fetcher = make_fetcher(tmp_path, [])
+        first = fetcher._get_source_key({"name": "Tech", "url": "https://a.example.com/rss"})
+        second = fetcher._get_source_key({"name": "Tech", "url": "https://b.example.com/rss"})
+        assert first != second
+
+
+class TestLegacyCache:
+    """Test importing the per-source JSON cache files of earlier versions."""
+
+    def test_legacy_cache_imported_once(self, tmp_path):
+        """A source's JSON cache file is imported only while the store has no fetch for it."""
+        source = {"name": "Old News", "url": "https://old.example.com/rss", "type": "rss"}
+        fetcher = make_fetcher(tmp_path, [source])
+        fetcher.cache_dir = str(tmp_path)
+        key = fetcher._get_source_key(source)
+
+        legacy_file = tmp_path / "old_news.json"
+        legacy_file.write_text(json.dumps([
+            {"title": "Old story", "url": "https://old.example.com/1", "source": "Old News",
+             "published_datetime": "2024-01-01T12:00:00"}
+        ]))
+        fetcher._import_legacy_cache()
+        assert [article.title for article in fetcher.store.get_source_articles(key)] == ["Old story"]
+
+        legacy_file.write_text(json.dumps([
+            {"title": "Changed story", "url": "https://old.example.com/2", "source": "Old News"}
+        ]))
+        fetcher._import_legacy_cache()
+        assert [article.title for article in fetcher.store.get_source_articles(key)] == ["Old story"]
+
+
+class TestCachePolicy:
+    """Test stale-while-revalidate and negative caching."""
+
+    def test_failed_source_backs_off(self, tmp_path):
+        """A failing source is not retried until its backoff has elapsed."""
+        source = {"name": "Flaky", "url": "https://flaky.example.com/rss", "type": "rss"}
+        fetcher = make_fetcher(tmp_path, [source])
+
+        calls = []
+
+        def failing_fetch(src):
+            calls.append(src["name"])
+            fetcher._record_failure(fetcher._get_source_key(src), "HTTP 503")
+            return []
+
+        fetcher._fetch_rss = failing_fetch
+
+        assert fetcher._fetch_source(source) == []
+        assert fetcher._fetch_source(source) == []
+        assert calls == ["Flaky"]
+
+        failure = fetcher.store.get_failure(fetcher._get_source_key(source))
+        assert failure["failures"] == 1
+
+    def test_stale_cache_is_served_while_refreshing(self, tmp_path):
+        """Expired articles inside the stale window are served and refreshed in the background."""
+        source = {"name": "Slow", "url": "https://slow.example.com/rss", "type": "rss", "cache_expiry": 60}
+        fetcher = make_fetcher(tmp_path, [source])
+        source_key = fetcher._get_source_key(source)
+
+        stale_time = datetime.now().timestamp() - 120
+        fetcher.store.save_source_articles(source_key, make_articles("slow", 2, datetime.now()), fetched_at=stale_time)
+
+        refreshed = []
+        fetcher._fetch_rss = lambda src: refreshed.append(src["name"]) or []
+
+        articles = fetcher._fetch_source(source)
+        fetcher._refresh_executor.shutdown(wait=True)
+
+        assert len(articles) == 2
+        assert refreshed == ["Slow"]
+
+
+class TestAdaptivePolling:
+    """Test the adaptive polling scheduler."""
+
+    def test_interval_follows_publish_rate(self, tmp_path):
+        """The next poll is spaced by the median publish gap, within bounds."""
+        source = {"name": "Weekly", "url": "https://weekly.example.com/rss", "type": "rss"}
+        fetcher = make_fetcher(tmp_path, [source])
+        source_key = fetcher._get_source_key(source)
+
+        # make_articles spaces articles five hours apart
+        fetcher._schedule_next_poll(source, source_key, make_articles("weekly", 4, datetime.now()))
+        interval = fetcher.store.get_next_poll(source_key) - datetime.now().timestamp()
+        assert 5 * 3600 - 60 < interval <= 5 * 3600
+
+        fetcher.max_poll_interval = 3600
+        fetcher._schedule_next_poll(source, source_key, make_articles("weekly", 4, datetime.now()))
+        interval = fetcher.store.get_next_poll(source_key) - datetime.now().timestamp()
+        assert interval <= 3600
+
+    def test_server_hints_are_honored(self, tmp_path):
+        """Cache-Control max-age and feed ttl lengthen the interval."""
+        source = {"name": "Hinted", "url": "https://hinted.example.com/rss", "type": "rss"}
+        fetcher = make_fetcher(tmp_path, [source])
+        source_key = fetcher._get_source_key(source)
+
+        fetcher._schedule_next_poll(source, source_key, [], {"Cache-Control": "public, max-age=7200"})
+        assert fetcher.store.get_next_poll(source_key) - datetime.now().timestamp() > 7000
+
+        fetcher._schedule_next_poll(source, source_key, [], {}, ttl_minutes="180")
+        assert fetcher.store.get_next_poll(source_key) - datetime.now().timestamp() > 3 * 3600 - 60
+
+    def test_source_not_due_is_skipped(self, tmp_path):
+        """A source that is not due is served from the store without fetching."""
+        source = {"name": "Quiet", "url": "https://quiet.example.com/rss", "type": "rss", "cache_expiry": 0}
+        fetcher = make_fetcher(tmp_path, [source])
+        source_key = fetcher._get_source_key(source)
+
+        fetcher.store.save_source_articles(source_key, make_articles("quiet", 2, datetime.now()),
+                                           fetched_at=datetime.now().timestamp() - 7200)
+        fetcher.store.set_next_poll(source_key, datetime.now().timestamp() + 3600, 3600)
+        fetcher._fetch_rss = lambda src: pytest.fail("source should not be fetched")
+
+        assert len(fetcher._fetch_source(source)) == 2
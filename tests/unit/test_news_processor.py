@@ -0,0 +1,127 @@
+"""
+Unit tests for NewsProcessor topic enrichment.
+"""
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.article import Article
+    from src.utils.news_processor import NewsProcessor, enrich_topic
+    HAS_NEWS_PROCESSOR = True
+except ImportError:
+    HAS_NEWS_PROCESSOR = False
+
+# Skip all tests if the processor dependencies are not available
+pytestmark = pytest.mark.skipif(not HAS_NEWS_PROCESSOR, reason="news processor dependencies not available")
+
+
+class FakeSentimentAnalyzer:
+    """Sentiment analyzer that needs no NLTK data."""
+
+    def polarity_scores(self, text):
+        return {"compound": 0.0, "pos": 0.0, "neg": 0.0, "neu": 1.0}
+
+
+def make_topics(count=4, per_topic=3):
+    """Build topics whose articles have distinct titles and summaries."""
+    now = time.time()
+    topics = []
+    for t in range(count):
+        articles = [
+            Article(
+                title=f"Quantum Chip {t} Reaches Milestone {i} - Wire",
+                url=f"https://example.com/{t}/{i}",
+                source=f"Source {i}",
+                published_ts=now - i * 3600,
+                summary=f"Researchers built chip {t}. The quantum result {i} was confirmed by Labs.",
+                content="Full article body " * 50
+            )
+            for i in range(per_topic)
+        ]
+        topics.append({"id": t, "articles": articles, "dominant_terms": ["quantum", "chip", f"topic{t}"]})
+    return topics
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Processor with in-memory analysis and no NLTK data requirements."""
+    processor = NewsProcessor()
+    processor.output_dir = str(tmp_path)
+    processor.analysis_cache = False
+    processor.sentiment_analyzer = FakeSentimentAnalyzer()
+    processor._stop_words = frozenset({"the", "was", "by"})
+    yield processor
+    processor.close()
+
+
+class TestTopicEnrichment:
+    """Test titles, keywords and summaries of topics."""
+
+    def test_enrich_topic(self):
+        """Test enrichment from pre-tokenized analyses."""
+        article = Article(title="Quantum Chip Reaches Milestone - Wire", url="https://example.com/a",
+                          summary="A short summary.")
+        analysis = {"title_tokens": ["Quantum", "Chip", "Reaches", "Milestone", "-", "Wire"],
+                    "sentences": ["A short summary."]}
+
+        result = enrich_topic(["quantum", "chip"], [article], [analysis], article, frozenset())
+
+        assert result["suggested_title"] == "Quantum Chip Reaches Milestone"
+        assert result["keywords"] == ["quantum", "chip", "Reaches", "Milestone", "Wire"]
+        assert result["summary"] == "A short summary."
+
+    def test_process_pool_matches_in_process(self, processor):
+        """Test that the worker pool gives the same results in the same order."""
+        topics = make_topics()
+        newest = [topic["articles"][0] for topic in topics]
+        processor._enrich_topics(topics, newest)
+        expected = [(t["suggested_title"], t["keywords"], t["summary"]) for t in topics]
+
+        processor.enrichment_workers = 2
+        topics = make_topics()
+        processor._enrich_topics(topics, newest)
+
+        assert [(t["suggested_title"], t["keywords"], t["summary"]) for t in topics] == expected
+        assert [t["id"] for t in topics] == [0, 1, 2, 3]
+
+
+class TestSentimentFallback:
+    """Test processing without the VADER lexicon."""
+
+    def test_missing_lexicon_scores_neutral(self, processor, tmp_path, monkeypatch):
+        """Articles are scored neutral, and the placeholders are not cached."""
+        def missing_lexicon():
+            raise LookupError("NLTK resource 'vader_lexicon' not found")
+
+        monkeypatch.setattr("src.utils.nltk_resources.sentiment_analyzer", missing_lexicon)
+        processor._sentiment_analyzer = None
+        processor.analysis_cache = True
+        processor.processing_store_path = str(tmp_path / "processor.db")
+        articles = make_topics(count=1)[0]["articles"]
+
+        processor._analyze_articles(articles)
+
+        assert [processor._article_sentiment(a) for a in articles] == [(0.0, 0.0, 0.0, 1.0)] * len(articles)
+        keys = [processor._analysis_key(a) for a in articles]
+        assert processor._get_processing_store().get_analyses(keys) == {}
+
+
+class TestProcessingStore:
+    """Test that the processor keeps its state out of the fetcher's store."""
+
+    def test_signatures_saved_to_processing_store(self, processor, tmp_path):
+        """Near-duplicate signatures go to the processing store only."""
+        processor.near_duplicate_detection = True
+        processor.article_store_path = str(tmp_path / "articles.db")
+        processor.processing_store_path = str(tmp_path / "processor.db")
+
+        processor._remove_duplicates(make_topics(count=1)[0]["articles"])
+
+        assert len(processor._get_processing_store().get_signatures()) == 3
+        assert processor._get_article_store().get_signatures() == []
@@ -0,0 +1,71 @@
+"""
+Unit tests for offline NLTK resource loading.
+"""
+import sys
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    import nltk
+    from src.utils import nltk_resources
+    HAS_NLTK = True
+except ImportError:
+    HAS_NLTK = False
+
+# Skip all tests if nltk is not available
+pytestmark = pytest.mark.skipif(not HAS_NLTK, reason="nltk not available")
+
+
+@pytest.fixture
+def empty_data_dir(tmp_path):
+    """Point resource lookups at an empty directory with downloads disabled."""
+    nltk_resources.configure(str(tmp_path))
+    with patch.object(nltk.data, "find", side_effect=LookupError("missing")):
+        yield tmp_path
+    nltk_resources.configure()
+
+
+class TestNltkResources:
+    """Test cases for the nltk_resources module."""
+
+    def test_resource_paths_use_their_categories(self):
+        """Test that each resource is looked up under its own category."""
+        assert nltk_resources.RESOURCE_PATHS["stopwords"].startswith("corpora/")
+        assert nltk_resources.RESOURCE_PATHS["vader_lexicon"].startswith("sentiment/")
+        assert nltk_resources.RESOURCE_PATHS["punkt"].startswith("tokenizers/")
+
+    def test_configured_directory_is_searched_first(self, tmp_path):
+        """Test that the data directory is put at the front of NLTK's search path."""
+        nltk_resources.configure(str(tmp_path))
+        try:
+            nltk_resources.has_resource("stopwords")
+            assert nltk.data.path[0] == str(tmp_path)
+        finally:
+            nltk_resources.configure()
+
+    def test_missing_resources_are_not_downloaded(self, empty_data_dir):
+        """Test that nothing is downloaded unless downloads are allowed."""
+        with patch.object(nltk, "download") as download:
+            assert not nltk_resources.require("stopwords")
+        download.assert_not_called()
+
+    def test_stop_words_fall_back_to_sklearn(self, empty_data_dir):
+        """Test the stop word fallback when the NLTK corpus is missing."""
+        words = nltk_resources.stop_words()
+        assert "the" in words
+        assert nltk_resources.stop_words() is words
+
+    def test_tokenizers_fall_back_without_punkt(self, empty_data_dir):
+        """Test the regular-expression tokenizers used when Punkt is missing."""
+        assert nltk_resources.sent_tokenize("Markets rose. Oil fell! Why?") == ["Markets rose.", "Oil fell!", "Why?"]
+        assert nltk_resources.word_tokenize("Oil's price fell.") == ["Oil's", "price", "fell", "."]
+
+    def test_missing_sentiment_lexicon_raises(self, empty_data_dir):
+        """Test that a missing VADER lexicon explains how to install it."""
+        with pytest.raises(LookupError, match="--download"):
+            nltk_resources.sentiment_analyzer()
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Try to import from source
 try:
-    from src.utils.text_utils import sanitize_html, extract_text_from_html
+    from src.utils.text_utils import sanitize_html, extract_text_from_html, tokenize, TermMatcher
     HAS_UTILS = True
 except ImportError:
     HAS_UTILS = False
@@ -47,3 +47,40 @@ class TestTextUtils:
         """Test sanitizing None input."""
         result = sanitize_html(None)
         assert result == "", "None input should return empty string"
+
+    def test_tokenize(self):
+        """Test splitting text into word and punctuation tokens."""
+        assert tokenize("Don't panic: AI's 5G rollout!") == ["Don't", "panic", ":", "AI's", "5G", "rollout", "!"]
+        assert tokenize("") == []
+
+
+class TestTermMatcher:
+    """Test the multi-term matcher."""
+
+    def test_matches_substring_containment(self):
+        """Test that matches equal a per-term substring check, overlaps included."""
+        terms = ["cloud", "google cloud", "ai", "ai safety", "api", "go", "safe"]
+        text = "Google Cloud expands AI safety work with a new API"
+        matcher = TermMatcher(terms)
+
+        assert matcher.find(text) == {term for term in terms if term in text.lower()}
+        assert matcher.count(text) == 7
+
+    def test_automaton_matches_substring_containment(self):
+        """Test the single-pass automaton used for large term sets."""
+        terms = [f"term{i}" for i in range(TermMatcher.AUTOMATON_MIN_TERMS)] + ["cloud", "google cloud", "go", "goo"]
+        text = "Google Cloud said term1 and term12 grew; term99 too."
+        matcher = TermMatcher(terms)
+
+        assert matcher._pattern is not None
+        assert matcher.find(text) == {term for term in terms if term in text.lower()}
+
+    def test_case_sensitive(self):
+        """Test case-sensitive matching."""
+        matcher = TermMatcher(["AI", "ai"], case_sensitive=True)
+        assert matcher.find("AI news") == {"AI"}
+
+    def test_no_terms(self):
+        """Test a matcher without terms."""
+        assert TermMatcher([]).find("anything") == set()
+
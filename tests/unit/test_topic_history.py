@@ -0,0 +1,88 @@
+"""
+Unit tests for cross-run topic tracking.
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.topic_history import TopicHistory
+    from src.utils.article_store import ArticleStore
+    from src.utils.article import Article
+    HAS_TOPIC_HISTORY = True
+except ImportError:
+    HAS_TOPIC_HISTORY = False
+
+# Skip all tests if numpy is not available
+pytestmark = pytest.mark.skipif(not HAS_TOPIC_HISTORY, reason="numpy not available")
+
+HOUR = 3600.0
+START = 1_700_000_000.0
+
+QUANTUM = "quantum processor qubits error correction chip milestone"
+CLIMATE = "climate summit emissions carbon agreement warming targets"
+
+
+def make_topic(words, count, run, published_ts=START):
+    """Build a scored topic with count articles about the given words."""
+    articles = [
+        Article(title=f"{words} report", url=f"https://example.com/{run}/{words[:7]}/{i}",
+                summary=f"Update {i} on {words}", published_ts=published_ts)
+        for i in range(count)
+    ]
+    return {"articles": articles, "article_count": count, "dominant_terms": words.split(), "relevance_score": 0.6}
+
+
+class TestTopicHistory:
+    """Test matching topics across runs."""
+
+    def test_new_topics_start_history(self):
+        """Topics with no earlier match start at their oldest article."""
+        history = TopicHistory()
+        topic = make_topic(QUANTUM, 4, run=1, published_ts=START - 2 * HOUR)
+        history.observe([topic], observed_at=START)
+
+        assert topic["runs_seen"] == 1
+        assert topic["age_hours"] == pytest.approx(2.0)
+        assert topic["velocity"] == pytest.approx(2.0)
+        assert len(history) == 1
+
+    def test_topics_match_across_runs(self, tmp_path):
+        """A later run continues the same stories, loaded back from the store."""
+        store = ArticleStore(str(tmp_path / "articles.db"))
+        first = [make_topic(QUANTUM, 4, run=1), make_topic(CLIMATE, 3, run=1)]
+        history = TopicHistory()
+        history.observe(first, observed_at=START)
+        assert history.save(store) == 2
+
+        history = TopicHistory()
+        assert history.load(store) == 2
+        second = [make_topic(CLIMATE, 3, run=2), make_topic(QUANTUM, 10, run=2)]
+        history.observe(second, observed_at=START + 2 * HOUR)
+        history.save(store)
+
+        assert second[1]["history_id"] == first[0]["history_id"]
+        assert second[0]["history_id"] == first[1]["history_id"]
+        assert second[1]["runs_seen"] == 2
+        assert second[1]["age_hours"] == pytest.approx(2.0)
+        assert second[1]["velocity"] == pytest.approx(3.0)
+        assert second[0]["velocity"] == pytest.approx(0.0)
+
+        observations = store.get_topic_observations(first[0]["history_id"])
+        assert [o["article_count"] for o in observations] == [4, 10]
+        store.close()
+
+    def test_each_topic_matches_once(self):
+        """Two clusters of one earlier story do not both continue it."""
+        history = TopicHistory()
+        history.observe([make_topic(QUANTUM, 4, run=1)], observed_at=START)
+
+        split = [make_topic(QUANTUM, 2, run=2), make_topic(QUANTUM, 2, run=3)]
+        history.observe(split, observed_at=START + HOUR)
+
+        assert split[0]["history_id"] != split[1]["history_id"]
+        assert len(history) == 2
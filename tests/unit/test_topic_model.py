@@ -0,0 +1,72 @@
+"""
+Unit tests for the incremental topic model.
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Try to import from source
+try:
+    from src.utils.topic_model import IncrementalTopicModel
+    HAS_TOPIC_MODEL = True
+except ImportError:
+    HAS_TOPIC_MODEL = False
+
+# Skip all tests if scikit-learn is not available
+pytestmark = pytest.mark.skipif(not HAS_TOPIC_MODEL, reason="scikit-learn not available")
+
+SUBJECTS = {
+    "quantum": "quantum processor qubits error correction chip",
+    "climate": "climate emissions carbon warming policy",
+    "football": "football league match goal striker",
+}
+
+
+def make_corpus(prefix, per_subject=4):
+    """Build texts and URLs covering each subject."""
+    texts, urls = [], []
+    for subject, words in SUBJECTS.items():
+        for i in range(per_subject):
+            texts.append(f"{words} report {i}")
+            urls.append(f"https://example.com/{prefix}/{subject}/{i}")
+    return texts, urls
+
+
+class TestIncrementalTopicModel:
+    """Test fitting, persistence and assignment."""
+
+    def test_only_new_articles_are_fitted(self, tmp_path):
+        """Articles fitted in an earlier run are skipped."""
+        model = IncrementalTopicModel(str(tmp_path / "model.joblib"), n_clusters=3)
+        texts, urls = make_corpus("a")
+
+        assert model.update(texts, urls) == len(texts)
+        assert model.update(texts, urls) == 0
+
+    def test_cluster_ids_are_stable_across_runs(self, tmp_path):
+        """A reloaded model assigns the same texts to the same cluster ids."""
+        state_path = str(tmp_path / "model.joblib")
+        model = IncrementalTopicModel(state_path, n_clusters=3)
+        texts, urls = make_corpus("a")
+        model.update(texts, urls)
+        before = model.assign(texts).tolist()
+        model.save()
+
+        reloaded = IncrementalTopicModel(state_path, n_clusters=3)
+        assert reloaded.is_fitted
+        assert reloaded.assign(texts).tolist() == before
+
+        # Subjects land in their own clusters, and terms map back from hashed features
+        assert len(set(before)) == 3
+        assert "quantum" in reloaded.top_terms(before[0])
+
+    def test_waits_for_enough_articles(self, tmp_path):
+        """The clusters are not initialized from fewer articles than clusters."""
+        model = IncrementalTopicModel(str(tmp_path / "model.joblib"), n_clusters=10)
+        texts, urls = make_corpus("a", per_subject=1)
+
+        assert model.update(texts, urls) == 0
+        assert not model.is_fitted
@@ -0,0 +1,74 @@
+"""
+Unit tests for the compact processed-topics format.
+"""
+import sys
+import json
+import pytest
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.article import Article
+from src.utils.topic_output import save_topics, load_topics, load_topic_headers, list_topic_files
+
+
+def make_topics():
+    """Two topics that share one article."""
+    shared = Article(title="Chip makers report record sales", url="https://example.com/shared",
+                     source="Wire", published_ts=1_700_000_000.0, summary="Sales rose.", content="Body " * 200)
+    other = Article(title="Quantum milestone", url="https://example.com/quantum",
+                    source="Lab News", published_ts=1_700_003_600.0, summary="Qubits held.")
+    return [
+        {"id": 0, "suggested_title": "Chips", "relevance_score": 0.8, "articles": [shared]},
+        {"id": 1, "suggested_title": "Quantum", "relevance_score": 0.6, "articles": [other, shared]},
+    ]
+
+
+class TestTopicOutput:
+    """Test saving and loading processed topics."""
+
+    @pytest.mark.parametrize("name", ["processed_topics_1.jsonl", "processed_topics_1.jsonl.gz"])
+    def test_round_trip(self, tmp_path, name):
+        """Topics load back with their articles, each stored once."""
+        path = str(tmp_path / name)
+        save_topics(path, make_topics())
+
+        topics = load_topics(path)
+        assert [topic["suggested_title"] for topic in topics] == ["Chips", "Quantum"]
+        assert [article.url for article in topics[1]["articles"]] == ["https://example.com/quantum", "https://example.com/shared"]
+        assert topics[1]["articles"][1] == make_topics()[0]["articles"][0]
+
+    def test_articles_are_stored_once(self, tmp_path):
+        """A shared article is written once and referenced by id."""
+        path = tmp_path / "processed_topics_1.jsonl"
+        save_topics(str(path), make_topics())
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert records[0]["article_count"] == 2
+        assert sum(1 for record in records if record.get("type") == "article") == 2
+
+    def test_headers_skip_articles(self, tmp_path):
+        """Headers are read without parsing article records."""
+        path = tmp_path / "processed_topics_1.jsonl"
+        save_topics(str(path), make_topics())
+        # Truncate the first article record; headers must still load
+        lines = path.read_text().splitlines()
+        path.write_text("\n".join(lines[:3] + [lines[3][:30]]) + "\n")
+
+        headers = load_topic_headers(str(path))
+        assert [header["article_ids"] for header in headers] == [[0], [1, 0]]
+        assert "articles" not in headers[0]
+
+    def test_legacy_json_files(self, tmp_path):
+        """Original indented JSON files still load and are listed."""
+        legacy = [{"id": 0, "suggested_title": "Old", "articles": [make_topics()[0]["articles"][0].to_dict()]}]
+        path = tmp_path / "processed_topics_0.json"
+        path.write_text(json.dumps(legacy, indent=2))
+        save_topics(str(tmp_path / "processed_topics_1.jsonl.gz"), make_topics())
+
+        assert load_topics(str(path))[0]["articles"][0].title == "Chip makers report record sales"
+        assert load_topic_headers(str(path))[0]["article_ids"] == [0]
+        assert [Path(p).name for p in list_topic_files(str(tmp_path))] == [
+            "processed_topics_0.json", "processed_topics_1.jsonl.gz"
+        ]